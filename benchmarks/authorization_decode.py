@@ -0,0 +1,105 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# Compares the per-request CPU time spent on token validation by the
+# authorization interceptor: validate + 'parse_access_token' versus validate +
+# reading the claims without verifying the signature again
+# ('ExecutorTokenValidator.validate_token_claims').
+#
+# usage: PYTHONPATH=src python benchmarks/authorization_decode.py [iterations]
+
+import sys
+import time
+
+import json
+
+import jwt
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from accelbyte_py_sdk import AccelByteSDK
+from accelbyte_py_sdk.services.auth import parse_access_token
+from accelbyte_py_sdk.token_validation.caching import CachingTokenValidator
+
+from accelbyte_grpc_plugin.token_validation import (
+    AccessTokenClaims,
+    AsyncJWKSCache,
+    ExecutorTokenValidator,
+)
+
+KEY_ID = "benchmark"
+NAMESPACE = "benchmark"
+RESOURCE = "ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD"
+ACTION = 2
+
+
+def create_validator_and_token():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    sdk = AccelByteSDK()
+    validator = CachingTokenValidator(sdk=sdk)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    validator.jwks_cache = AsyncJWKSCache(sdk=sdk)
+    validator.jwks_cache.add_keys([{**jwk, "kid": KEY_ID, "alg": "RS256", "use": "sig"}])
+    now = int(time.time())
+    token = jwt.encode(
+        {
+            "sub": "user",
+            "client_id": "client",
+            "namespace": NAMESPACE,
+            "iat": now,
+            "exp": now + 3600,
+            "permissions": [
+                {"Resource": f"ADMIN:NAMESPACE:{NAMESPACE}:CLOUDSAVE:RECORD", "Action": 15}
+            ],
+        },
+        private_key,
+        algorithm="RS256",
+        headers={"kid": KEY_ID},
+    )
+    return validator, token
+
+
+def validate_then_parse(validator, token):
+    error = validator.validate_token(
+        token=token, resource=RESOURCE, action=ACTION, namespace=NAMESPACE
+    )
+    assert error is None, error
+    claims, error = parse_access_token(token)
+    assert error is None, error
+    return claims.get("extend_namespace", None)
+
+
+def validate_then_read_claims(validator, token):
+    claims, error = validator.validate_token_claims(
+        token=token,
+        resource=RESOURCE,
+        action=ACTION,
+        namespace=NAMESPACE,
+    )
+    assert error is None, error
+    return AccessTokenClaims.from_dict(claims).extend_namespace
+
+
+def measure(fn, validator, token, iterations):
+    for _ in range(min(iterations, 100)):
+        fn(validator, token)
+    start = time.process_time()
+    for _ in range(iterations):
+        fn(validator, token)
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    validator, token = create_validator_and_token()
+    before = measure(validate_then_parse, validator, token, iterations)
+    executor_validator = ExecutorTokenValidator(token_validator=validator)
+    after = measure(validate_then_read_claims, executor_validator, token, iterations)
+    print(f"validate + parse_access_token: {before:8.1f} us/request")
+    print(f"validate + unverified claims:  {after:8.1f} us/request")
+    print(f"saved:                         {before - after:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# Compares the throughput and latency of the guild RPCs when the app runs on
+# the asyncio and the uvloop event loops (when uvloop is installed).
+#
+# The app is started as it is in production ('app.__main__.run_main') with
+# 'EVENT_LOOP' set, against a local fake IAM + CloudSave, with the guild
+# progress cache disabled so that every RPC goes through the SDK's async HTTP
+# client. The fake and the client run in processes of their own on the
+# asyncio loop, only the app's loop changes between runs. On machines with
+# few cores the three processes compete for CPU, compare the runs with each
+# other rather than with production numbers.
+#
+# usage: PYTHONPATH=src python benchmarks/event_loop.py [seconds] [concurrency]
+
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import sys
+import time
+
+import grpc
+import grpc.aio
+
+from app.proto.service_pb2 import (
+    CreateOrUpdateGuildProgressRequest,
+    GetGuildProgressRequest,
+    GuildProgress,
+)
+from app.proto.service_pb2_grpc import ServiceStub
+
+NAMESPACE = "benchmark"
+GUILDS = 1000
+# stands in for the round trip to a nearby CloudSave.
+LATENCY = 0.002
+TIMESTAMP = "2025-01-01T00:00:00Z"
+TOKEN = json.dumps(
+    {
+        "access_token": "benchmark",
+        "expires_in": 3600,
+        "namespace": NAMESPACE,
+        "permissions": [],
+        "scope": "",
+        "token_type": "Bearer",
+    }
+).encode()
+
+
+def get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def serve_fake_backend(port, ready):
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, path, _ = request_line.split(" ", 2)
+                length = 0
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value)
+                body = await reader.readexactly(length) if length else b""
+
+                status = b"200 OK"
+                if path.startswith("/iam/"):
+                    response_body = TOKEN
+                else:
+                    await asyncio.sleep(LATENCY)
+                    key = path.rsplit("/", 1)[-1]
+                    guild_id = key.split("_", 1)[-1]
+                    value = (
+                        json.loads(body)
+                        if method == "POST"
+                        else {"guild_id": guild_id, "namespace": NAMESPACE, "objectives": {"kills": 1}}
+                    )
+                    response_body = json.dumps(
+                        {
+                            "key": key,
+                            "namespace": NAMESPACE,
+                            "value": value,
+                            "created_at": TIMESTAMP,
+                            "updated_at": TIMESTAMP,
+                        }
+                    ).encode()
+                    if method == "POST":
+                        status = b"201 Created"
+
+                writer.write(
+                    b"HTTP/1.1 " + status + b"\r\n"
+                    b"Content-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(response_body)).encode() + b"\r\n"
+                    b"\r\n" + response_body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle_connection, "127.0.0.1", port)
+        ready.set()
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
+
+
+def serve_app(loop_type, grpc_port, backend_port):
+    os.environ.update(
+        {
+            "AB_BASE_URL": f"http://127.0.0.1:{backend_port}",
+            "AB_CLIENT_ID": "benchmark",
+            "AB_CLIENT_SECRET": "benchmark",
+            "AB_NAMESPACE": NAMESPACE,
+            "EVENT_LOOP": loop_type,
+            "PORT": str(grpc_port),
+            "ENABLE_LOOP_MONITOR": "false",
+            "ENABLE_PROMETHEUS": "false",
+            "ENABLE_REFLECTION": "false",
+            "ENABLE_ZIPKIN": "false",
+            "GUILD_PROGRESS_CACHE_ENABLED": "false",
+            "PLUGIN_GRPC_SERVER_AUTH_ENABLED": "false",
+            "PLUGIN_GRPC_SERVER_METRICS_ENABLED": "false",
+            # plain HTTP, the fake only speaks HTTP/1.1.
+            "SDK_HTTP_HTTP2": "false",
+        }
+    )
+
+    from app.__main__ import run_main
+    from app.utils import create_env
+
+    run_main(env=create_env())
+
+
+async def call(stub, latencies, deadline):
+    while time.perf_counter() < deadline:
+        guild_id = f"guild{random.randrange(GUILDS)}"
+        start = time.perf_counter()
+        if random.random() < 0.5:
+            method = "GetGuildProgress"
+            await stub.GetGuildProgress(
+                GetGuildProgressRequest(namespace=NAMESPACE, guild_id=guild_id)
+            )
+        else:
+            method = "CreateOrUpdateGuildProgress"
+            await stub.CreateOrUpdateGuildProgress(
+                CreateOrUpdateGuildProgressRequest(
+                    namespace=NAMESPACE,
+                    guild_progress=GuildProgress(
+                        guild_id=guild_id, namespace=NAMESPACE, objectives={"kills": 1}
+                    ),
+                )
+            )
+        latencies[method].append(time.perf_counter() - start)
+
+
+async def generate_load(grpc_port, seconds, concurrency):
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{grpc_port}") as channel:
+        await asyncio.wait_for(channel.channel_ready(), timeout=30)
+        stub = ServiceStub(channel)
+
+        # warm up the connections of the app's HTTP pool.
+        warm_up = {"GetGuildProgress": [], "CreateOrUpdateGuildProgress": []}
+        deadline = time.perf_counter() + 2
+        await asyncio.gather(*(call(stub, warm_up, deadline) for _ in range(concurrency)))
+
+        latencies = {"GetGuildProgress": [], "CreateOrUpdateGuildProgress": []}
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(*(call(stub, latencies, deadline) for _ in range(concurrency)))
+        return latencies
+
+
+def measure(loop_type, seconds, concurrency):
+    context = multiprocessing.get_context("spawn")
+    grpc_port = get_free_port()
+    backend_port = get_free_port()
+
+    ready = context.Event()
+    backend = context.Process(target=serve_fake_backend, args=(backend_port, ready))
+    backend.start()
+    ready.wait()
+    app = context.Process(target=serve_app, args=(loop_type, grpc_port, backend_port))
+    app.start()
+
+    try:
+        latencies = asyncio.run(generate_load(grpc_port, seconds, concurrency))
+    finally:
+        for process in (app, backend):
+            process.terminate()
+            process.join()
+
+    for method, values in latencies.items():
+        values.sort()
+        p50 = values[len(values) // 2] * 1e3
+        p99 = values[int(len(values) * 0.99) - 1] * 1e3
+        print(
+            f"{loop_type:8} {method:28} {len(values) / seconds:8.0f} rps,"
+            f" p50 {p50:6.2f} ms, p99 {p99:6.2f} ms"
+        )
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    loop_types = ["asyncio"]
+    try:
+        import uvloop  # noqa: F401
+
+        loop_types.append("uvloop")
+    except ImportError:
+        print("uvloop is not installed, skipping it")
+
+    for loop_type in loop_types:
+        measure(loop_type, seconds, concurrency)
+
+
+if __name__ == "__main__":
+    main()
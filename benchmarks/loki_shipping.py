@@ -0,0 +1,127 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# Logs through the previous synchronous LokiHandler and the queued LokiShipper
+# against a local stand-in for Loki's push API, and reports the time a
+# 'logger.info' call takes and what the stand-in received. The stand-in waits
+# '[push latency]' ms per push, like a remote Loki would.
+#
+# usage: PYTHONPATH=src python benchmarks/loki_shipping.py [records] [push latency ms]
+
+import gzip
+import json
+import logging
+import socket
+import statistics
+import sys
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import logging_loki
+
+from accelbyte_grpc_plugin.loki import LokiShipper
+
+
+class StandIn:
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.pushes = 0
+        self.records = 0
+        self.bytes = 0
+        self.lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.pushes = self.records = self.bytes = 0
+
+    def handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                size = len(body)
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                payload = json.loads(body)
+                records = sum(len(s.get("values", s.get("entries", []))) for s in payload["streams"])
+                time.sleep(stand_in.latency)
+                with stand_in.lock:
+                    stand_in.pushes += 1
+                    stand_in.records += records
+                    stand_in.bytes += size
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure(logger: logging.Logger, records: int):
+    latencies = []
+    for i in range(records):
+        start = time.perf_counter()
+        logger.info("request %d handled: guild_id=%s progress=%d", i, "guild-1", i)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return (
+        statistics.median(latencies) * 1e6,
+        latencies[int(len(latencies) * 0.99) - 1] * 1e6,
+        sum(latencies),
+    )
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = float(sys.argv[2]) / 1e3 if len(sys.argv) > 2 else 2.0 / 1e3
+
+    stand_in = StandIn(latency=latency)
+    port = get_free_port()
+    server = ThreadingHTTPServer(("127.0.0.1", port), stand_in.handler())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{port}/loki/api/v1/push"
+
+    logger = logging.getLogger("benchmark")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    # the implementation this benchmark compares against.
+    handler = logging_loki.LokiHandler(url=url, version="1")
+    logger.addHandler(handler)
+    p50, p99, total = measure(logger, records)
+    logger.removeHandler(handler)
+    print(
+        f"sync   logger.info: p50 {p50:8.1f} us, p99 {p99:8.1f} us, total {total:6.2f} s"
+        f" | pushes {stand_in.pushes}, records {stand_in.records}, bytes {stand_in.bytes}"
+    )
+
+    stand_in.reset()
+    shipper = LokiShipper(url=url, version="1", batch_interval=0.2)
+    handler = shipper.create_handler()
+    shipper.start()
+    logger.addHandler(handler)
+    p50, p99, total = measure(logger, records)
+    logger.removeHandler(handler)
+    shipper.stop(timeout=10)
+    print(
+        f"queued logger.info: p50 {p50:8.1f} us, p99 {p99:8.1f} us, total {total:6.2f} s"
+        f" | pushes {stand_in.pushes}, records {stand_in.records}, bytes {stand_in.bytes},"
+        f" dropped {shipper.records_dropped.labels(reason='queue_full')._value.get():.0f}"
+    )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
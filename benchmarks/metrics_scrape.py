@@ -0,0 +1,148 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# Measures /metrics scrape latency while the gRPC server on the same loop is
+# under load, for the previous Flask debug server (when Flask is installed)
+# and the asyncio metrics server. The load comes from a separate process
+# calling the gRPC health check.
+#
+# usage: PYTHONPATH=src python benchmarks/metrics_scrape.py [scrapes] [load concurrency]
+
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+
+import grpc
+import grpc.aio
+
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+from prometheus_client import Counter
+
+from accelbyte_grpc_plugin.metrics_server import AsyncMetricsServer
+
+
+def get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def generate_load(port, concurrency, stop):
+    async def run():
+        async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+            stub = health_pb2_grpc.HealthStub(channel)
+
+            async def worker():
+                while not stop.is_set():
+                    await stub.Check(health_pb2.HealthCheckRequest())
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    asyncio.run(run())
+
+
+def scrape(url, scrapes):
+    latencies = []
+    for _ in range(scrapes):
+        request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+        start = time.perf_counter()
+        with urllib.request.urlopen(request) as response:
+            response.read()
+        latencies.append(time.perf_counter() - start)
+        time.sleep(0.01)
+    return latencies
+
+
+def start_flask_server(port):
+    # the implementation this benchmark compares against.
+    from flask import Flask
+    from prometheus_client import make_wsgi_app
+    from werkzeug.middleware.dispatcher import DispatcherMiddleware
+
+    flask_app = Flask(import_name="benchmark")
+    flask_app.wsgi_app = DispatcherMiddleware(
+        app=flask_app.wsgi_app, mounts={"/metrics": make_wsgi_app()}
+    )
+    threading.Thread(
+        target=lambda: flask_app.run(
+            host="127.0.0.1", port=port, debug=True, use_reloader=False
+        ),
+        daemon=True,
+    ).start()
+    time.sleep(1)
+
+
+async def measure(kind, scrapes, concurrency):
+    grpc_port = get_free_port()
+    metrics_port = get_free_port()
+
+    server = grpc.aio.server()
+    health_pb2_grpc.add_HealthServicer_to_server(health.aio.HealthServicer(), server)
+    server.add_insecure_port(f"127.0.0.1:{grpc_port}")
+    await server.start()
+
+    metrics_server = None
+    if kind == "flask":
+        start_flask_server(metrics_port)
+    else:
+        metrics_server = AsyncMetricsServer(
+            addr="127.0.0.1", port=metrics_port, endpoint="/metrics"
+        )
+        await metrics_server.start()
+
+    context = multiprocessing.get_context("spawn")
+    stop = context.Event()
+    load = context.Process(target=generate_load, args=(grpc_port, concurrency, stop))
+    load.start()
+    await asyncio.sleep(2)
+
+    latencies = await asyncio.to_thread(
+        scrape, f"http://127.0.0.1:{metrics_port}/metrics", scrapes
+    )
+
+    stop.set()
+    load.join(timeout=5)
+    if load.is_alive():
+        load.terminate()
+    if metrics_server is not None:
+        await metrics_server.stop()
+    await server.stop(grace=None)
+
+    latencies.sort()
+    return (
+        statistics.median(latencies) * 1e3,
+        latencies[int(len(latencies) * 0.99) - 1] * 1e3,
+    )
+
+
+def main():
+    scrapes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    # a registry about the size of the app's.
+    counter = Counter("benchmark_requests", "", labelnames=["method", "code"])
+    for method in range(50):
+        for code in range(8):
+            counter.labels(method=f"/service/Method{method}", code=str(code)).inc()
+
+    kinds = ["async"]
+    try:
+        import flask  # noqa: F401
+
+        kinds.insert(0, "flask")
+    except ImportError:
+        print("flask is not installed, skipping the previous server")
+
+    for kind in kinds:
+        p50, p99 = asyncio.run(measure(kind, scrapes, concurrency))
+        print(f"{kind:6} scrape latency: p50 {p50:7.2f} ms, p99 {p99:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# Compares the throughput of the stock SDK HTTP client against the one built
+# by 'create_httpx_http_client' when sending concurrent CloudSave reads
+# ('admin_get_game_record_handler_v1_async') through the service's SDK
+# ('AsyncAccelByteSDK.run_request_async') to a local fake CloudSave. The fake delays new connections to stand in for the TCP +
+# TLS handshake with a remote CloudSave. It speaks HTTP/1.1 and HTTP/2 with
+# prior knowledge, the tuned client is run with 'http1' disabled since
+# HTTP/2 is otherwise only negotiated over TLS.
+#
+# usage: PYTHONPATH=src python benchmarks/sdk_http_client.py [requests] [concurrency]
+
+import asyncio
+import statistics
+import sys
+import time
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+
+from accelbyte_py_sdk.api import cloudsave as cs_service
+from accelbyte_py_sdk.core import (
+    DictConfigRepository,
+    HttpxHttpClient,
+    InMemoryTokenRepository,
+)
+
+from accelbyte_grpc_plugin.http_client import create_httpx_http_client
+from accelbyte_grpc_plugin.sdk import AsyncAccelByteSDK
+
+RESPONSE_BODY = (
+    b'{"key":"guildProgress_1","namespace":"benchmark",'
+    b'"value":{"guild_id":"1","namespace":"benchmark","objectives":{"kills":1}},'
+    b'"created_at":"2025-01-01T00:00:00Z","updated_at":"2025-01-01T00:00:00Z"}'
+)
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(RESPONSE_BODY)).encode() + b"\r\n"
+    b"\r\n" + RESPONSE_BODY
+)
+HTTP2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+ROUNDS = 5
+HANDSHAKE_LATENCY = 0.05
+LATENCY = 0.02
+
+
+async def handle_connection(reader, writer):
+    try:
+        await asyncio.sleep(HANDSHAKE_LATENCY)
+        data = await reader.readuntil(b"\r\n\r\n")
+        if data == HTTP2_PREFACE[: len(data)]:
+            data += await reader.readexactly(len(HTTP2_PREFACE) - len(data))
+            await handle_http2(reader, writer, data)
+        else:
+            await handle_http1(reader, writer, data)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def handle_http1(reader, writer, headers):
+    while True:
+        length = 0
+        for line in headers.split(b"\r\n"):
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                length = int(value)
+        if length:
+            await reader.readexactly(length)
+        await asyncio.sleep(LATENCY)
+        writer.write(RESPONSE)
+        await writer.drain()
+        headers = await reader.readuntil(b"\r\n\r\n")
+
+
+async def handle_http2(reader, writer, data):
+    connection = h2.connection.H2Connection(
+        config=h2.config.H2Configuration(client_side=False)
+    )
+    connection.initiate_connection()
+    connection.update_settings(
+        {h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 1000}
+    )
+
+    async def respond(stream_id):
+        await asyncio.sleep(LATENCY)
+        connection.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(RESPONSE_BODY))),
+            ],
+        )
+        connection.send_data(stream_id, RESPONSE_BODY, end_stream=True)
+        writer.write(connection.data_to_send())
+
+    tasks = set()
+    while data:
+        for event in connection.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                task = asyncio.ensure_future(respond(event.stream_id))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                return
+        writer.write(connection.data_to_send())
+        await writer.drain()
+        data = await reader.read(65536)
+
+
+async def measure(sdk, http, requests, concurrency):
+    sdk.set_http_client(http)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send():
+        async with semaphore:
+            _, error = await cs_service.admin_get_game_record_handler_v1_async(
+                key="guildProgress_1", namespace="benchmark", sdk=sdk
+            )
+            assert error is None, error
+
+    await send()
+    start = time.perf_counter()
+    await asyncio.gather(*(send() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    await http.client_async.aclose()
+    return requests / elapsed
+
+
+async def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    server = await asyncio.start_server(handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    token = InMemoryTokenRepository()
+    token.store_token({"access_token": "benchmark"})
+    # its metrics are registered once, both clients are measured through it.
+    sdk = AsyncAccelByteSDK()
+    sdk.initialize(
+        options={
+            "config": DictConfigRepository(
+                {
+                    "AB_BASE_URL": f"http://127.0.0.1:{port}",
+                    "AB_CLIENT_ID": "benchmark",
+                    "AB_CLIENT_SECRET": "benchmark",
+                    "AB_NAMESPACE": "benchmark",
+                }
+            ),
+            "token": token,
+        }
+    )
+
+    # new clients every round, the median of the rounds is reported.
+    befores, afters = [], []
+    async with server:
+        for _ in range(ROUNDS):
+            befores.append(await measure(sdk, HttpxHttpClient(), requests, concurrency))
+            afters.append(
+                await measure(
+                    sdk,
+                    create_httpx_http_client(http1=False, metrics=False),
+                    requests,
+                    concurrency,
+                )
+            )
+    before, after = statistics.median(befores), statistics.median(afters)
+
+    print(f"stock HttpxHttpClient:     {before:8.1f} requests/s")
+    print(f"create_httpx_http_client:  {after:8.1f} requests/s")
+    print(f"speedup:                   {after / before:8.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
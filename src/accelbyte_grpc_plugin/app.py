@@ -9,7 +9,7 @@ import logging
 from abc import ABC, abstractmethod
 from enum import IntEnum
 from logging import Logger
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from typing import Protocol, runtime_checkable
 
 # environs
@@ -28,7 +28,8 @@ import opentelemetry.trace
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import MetricReader
 from opentelemetry.sdk.resources import Resource, SERVICE_NAME as RESOURCE_SERVICE_NAME
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.sampling import Sampler
 
 
 class App:
@@ -75,10 +76,20 @@ class App:
         )
 
         self.grpc_interceptors: List[ServerInterceptor] = [aio_server_interceptor()]
+        self.grpc_maximum_concurrent_rpcs: Optional[int] = None
         self.grpc_server: Optional[Server] = None
+        self.grpc_server_options: List[Tuple[str, Any]] = [
+            ("grpc.max_metadata_size", 2**14),
+        ]
         self.grpc_service_names: List[str] = []
+        # other paths served on the metrics port, see 'AsyncMetricsServer.routes'.
+        self.http_routes: Dict[str, Callable[[Any], Awaitable[Any]]] = {}
+        self.startup_callbacks: List[Callable[[], Awaitable[None]]] = []
+        self.shutdown_callbacks: List[Callable[[], Awaitable[None]]] = []
         self.otel_metric_readers: List[MetricReader] = []
         self.otel_resource: Resource = Resource({RESOURCE_SERVICE_NAME: self.name})
+        self.otel_sampler: Optional[Sampler] = None
+        self.otel_span_processors: List[SpanProcessor] = []
 
         self.is_initialized: bool = False
 
@@ -95,7 +106,15 @@ class App:
             **kwargs,
         )
 
-        tracer_provider = TracerProvider(resource=self.otel_resource)
+        if self.otel_sampler is not None:
+            tracer_provider = TracerProvider(
+                sampler=self.otel_sampler, resource=self.otel_resource
+            )
+        else:
+            # the default, from OTEL_TRACES_SAMPLER.
+            tracer_provider = TracerProvider(resource=self.otel_resource)
+        for span_processor in self.otel_span_processors:
+            tracer_provider.add_span_processor(span_processor=span_processor)
         opentelemetry.trace.set_tracer_provider(tracer_provider=tracer_provider)
         self.logger.info("opentelemetry tracer provider set")
 
@@ -123,7 +142,11 @@ class App:
             **kwargs,
         )
 
-        self.grpc_server = grpc.aio.server(interceptors=self.grpc_interceptors,options=[("grpc.max_metadata_size", 2**14)])
+        self.grpc_server = grpc.aio.server(
+            interceptors=self.grpc_interceptors,
+            options=self.grpc_server_options,
+            maximum_concurrent_rpcs=self.grpc_maximum_concurrent_rpcs,
+        )
         self.logger.info("gRPC server created")
 
         self.apply_option_range(
@@ -154,6 +177,8 @@ class App:
 
         assert self.grpc_server is not None
 
+        await self.startup()
+
         self.grpc_server.add_insecure_port("[::]:{}".format(self.port))
         self.logger.info("gRPC server is starting")
         await self.grpc_server.start()
@@ -161,6 +186,34 @@ class App:
         await self.grpc_server.wait_for_termination(timeout=termination_timeout)
         self.logger.info("gRPC server has terminated")
 
+        await self.shutdown()
+
+    async def startup(self) -> None:
+        # callbacks run in order of registration, on the loop that runs the app.
+        for callback in self.startup_callbacks:
+            await callback()
+
+    async def shutdown(self) -> None:
+        # callbacks run in reverse order of registration, like a stack of context managers.
+        while self.shutdown_callbacks:
+            callback = self.shutdown_callbacks.pop()
+            try:
+                await callback()
+            except Exception as e:
+                self.logger.error("shutdown callback failed: %s", e)
+
+    def add_startup_callback(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self.startup_callbacks.append(callback)
+
+    def add_shutdown_callback(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self.shutdown_callbacks.append(callback)
+
+    async def stop(self, grace: Optional[float] = None) -> None:
+        if self.grpc_server is None:
+            return
+        self.logger.info("gRPC server is stopping")
+        await self.grpc_server.stop(grace=grace)
+
     # noinspection PyShadowingBuiltins
     def apply_option_range(
         self, range: Union[int, Tuple[int, int]], /, *args, **kwargs
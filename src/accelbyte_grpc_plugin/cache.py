@@ -0,0 +1,104 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import time
+
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """A least-recently-used cache whose entries also expire after a TTL.
+
+    When 'max_bytes' is set, entries are also evicted to keep the sum of
+    'sizeof(value)' under it.
+
+    Not thread-safe; meant to be used from a single event loop."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        on_evict: Optional[Callable[[K, V], None]] = None,
+        timer: Callable[[], float] = time.monotonic,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[V], int]] = None,
+    ) -> None:
+        if max_bytes is not None and sizeof is None:
+            sizeof = len
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.timer = timer
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+
+        self._items: "OrderedDict[K, Tuple[V, float]]" = OrderedDict()
+        self._bytes: int = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        item = self._items.get(key, None)
+        if item is None:
+            return default
+        value, expires_at = item
+        if expires_at <= self.timer():
+            self.delete(key)
+            return default
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        size = 0
+        if self.sizeof is not None:
+            size = self.sizeof(value)
+            if self.max_bytes is not None and size > self.max_bytes:
+                self.delete(key)
+                return
+        old_item = self._items.pop(key, None)
+        if old_item is not None and self.sizeof is not None:
+            self._bytes -= self.sizeof(old_item[0])
+        self._items[key] = (value, self.timer() + ttl)
+        self._bytes += size
+        while len(self._items) > self.max_size or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            evicted_key, (evicted_value, _) = self._items.popitem(last=False)
+            if self.sizeof is not None:
+                self._bytes -= self.sizeof(evicted_value)
+            if self.on_evict is not None:
+                self.on_evict(evicted_key, evicted_value)
+
+    def delete(self, key: K) -> Optional[V]:
+        item = self._items.pop(key, None)
+        if item is None:
+            return None
+        value, _ = item
+        if self.sizeof is not None:
+            self._bytes -= self.sizeof(value)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._bytes = 0
+
+
+__all__ = [
+    "TTLCache",
+]
@@ -0,0 +1,148 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import inspect
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from grpc import HandlerCallDetails, RpcMethodHandler, StatusCode
+from grpc.aio import ServerInterceptor
+from prometheus_client import Counter
+
+from accelbyte_grpc_plugin.utils import create_aio_rpc_error, wrap_rpc_method_handler
+
+# deadline of the RPC being served, in time.monotonic() seconds.
+deadline_var: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+def get_deadline() -> Optional[float]:
+    return deadline_var.get()
+
+
+def set_deadline(time_remaining: Optional[float]) -> None:
+    deadline_var.set(
+        time.monotonic() + time_remaining if time_remaining is not None else None
+    )
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """Runs the block without the deadline of the RPC being served, for work
+    shared between several RPCs (e.g. single-flight reads)."""
+    token = deadline_var.set(None)
+    try:
+        yield
+    finally:
+        deadline_var.reset(token)
+
+
+def get_time_remaining() -> Optional[float]:
+    """Returns the seconds left before the deadline of the RPC being served,
+    or None if it has no deadline."""
+    deadline = deadline_var.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def is_deadline_exceeded() -> bool:
+    time_remaining = get_time_remaining()
+    return time_remaining is not None and time_remaining <= 0
+
+
+def check_deadline() -> None:
+    """Raises DEADLINE_EXCEEDED if the client already gave up on the RPC being
+    served, call it before doing outbound I/O."""
+    if is_deadline_exceeded():
+        raise create_aio_rpc_error("deadline exceeded", StatusCode.DEADLINE_EXCEEDED)
+
+
+class DeadlineServerInterceptor(ServerInterceptor):
+    """Makes the deadline of each RPC available to the code serving it (see
+    'get_time_remaining') and counts the calls whose work was wasted because
+    the client was gone: either they were cancelled midway, or they completed
+    after it was cancelled or its deadline passed."""
+
+    def __init__(self) -> None:
+        self.wasted_calls = Counter(
+            name="grpc_server_wasted_calls",
+            documentation="number of calls served for a client that was gone",
+            labelnames=["method", "reason"],
+            unit="count",
+        )
+        self.wasted_seconds = Counter(
+            name="grpc_server_wasted",
+            documentation="time spent serving calls for a client that was gone",
+            labelnames=["method", "reason"],
+            unit="seconds",
+        )
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        # noinspection PyUnresolvedReferences
+        method = handler_call_details.method
+        handler = await continuation(handler_call_details)
+        return wrap_rpc_method_handler(
+            handler, lambda behavior: self.wrap_behavior(method, behavior)
+        )
+
+    def wrap_behavior(self, method: str, behavior: Callable) -> Callable:
+        def on_wasted(reason: str, start: float) -> None:
+            self.wasted_calls.labels(method=method, reason=reason).inc()
+            self.wasted_seconds.labels(method=method, reason=reason).inc(
+                time.monotonic() - start
+            )
+
+        def on_done(context: Any, start: float) -> None:
+            if context.cancelled() or is_deadline_exceeded():
+                on_wasted("completed", start)
+
+        if inspect.isasyncgenfunction(behavior):
+            async def wrapped_async_gen(request_or_iterator, context):
+                set_deadline(context.time_remaining())
+                start = time.monotonic()
+                try:
+                    async for response in behavior(request_or_iterator, context):
+                        yield response
+                except asyncio.CancelledError:
+                    on_wasted("cancelled", start)
+                    raise
+                on_done(context, start)
+
+            return wrapped_async_gen
+
+        async def wrapped(request_or_iterator, context):
+            set_deadline(context.time_remaining())
+            start = time.monotonic()
+            try:
+                result = behavior(request_or_iterator, context)
+                if inspect.isawaitable(result):
+                    result = await result
+            except asyncio.CancelledError:
+                # gRPC cancels the serving task once the client is gone.
+                on_wasted("cancelled", start)
+                raise
+            on_done(context, start)
+            return result
+
+        return wrapped
+
+
+__all__ = [
+    "DeadlineServerInterceptor",
+    "check_deadline",
+    "deadline_var",
+    "get_deadline",
+    "get_time_remaining",
+    "is_deadline_exceeded",
+    "no_deadline",
+    "set_deadline",
+]
@@ -0,0 +1,81 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import sys
+
+from enum import Enum
+from logging import Logger
+from typing import Any, Callable, Coroutine, Optional, Tuple
+
+
+class EventLoopType(str, Enum):
+    ASYNCIO = "asyncio"
+    # falls back to ASYNCIO when uvloop is not installed.
+    UVLOOP = "uvloop"
+
+
+def get_event_loop_factory(
+    loop_type: EventLoopType, logger: Optional[Logger] = None
+) -> Tuple[Callable[[], asyncio.AbstractEventLoop], EventLoopType]:
+    """Returns a factory for loops of 'loop_type' (or of the stdlib type if
+    uvloop is not installed), and the type it creates."""
+    if loop_type == EventLoopType.UVLOOP:
+        try:
+            import uvloop
+
+            return uvloop.new_event_loop, EventLoopType.UVLOOP
+        except ImportError:
+            if logger:
+                logger.warning("uvloop is not installed, using the asyncio event loop")
+
+    return asyncio.new_event_loop, EventLoopType.ASYNCIO
+
+
+def get_event_loop_type(loop: asyncio.AbstractEventLoop) -> EventLoopType:
+    if type(loop).__module__.startswith("uvloop"):
+        return EventLoopType.UVLOOP
+    return EventLoopType.ASYNCIO
+
+
+def run_event_loop(
+    main: Coroutine[Any, Any, Any],
+    loop_type: EventLoopType = EventLoopType.ASYNCIO,
+    logger: Optional[Logger] = None,
+) -> Any:
+    """Same as 'asyncio.run(main)' on a loop of 'loop_type'.
+
+    Everything 'main' starts shares that loop: the grpc.aio server, the async
+    HTTP clients and the tasks and callbacks scheduled on it. Loops created
+    elsewhere with 'asyncio.run' (e.g. on other threads) are not affected."""
+    loop_factory, _ = get_event_loop_factory(loop_type, logger=logger)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(main)
+
+    loop = loop_factory()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            # same clean up as 'asyncio.run'.
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+__all__ = [
+    "EventLoopType",
+    "get_event_loop_factory",
+    "get_event_loop_type",
+    "run_event_loop",
+]
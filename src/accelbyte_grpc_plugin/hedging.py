@@ -0,0 +1,188 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import math
+import time
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from prometheus_client import Counter
+
+from accelbyte_grpc_plugin.resilience import RetryBudget, SDKCallFunc, is_retryable
+
+
+class LatencyTracker:
+    """Tracks a latency percentile over the last 'window_size' samples.
+
+    The percentile is recomputed every 'update_interval' samples rather than
+    on every read, and is None until 'min_samples' have been seen."""
+
+    DEFAULT_WINDOW_SIZE: int = 1000
+    DEFAULT_UPDATE_INTERVAL: int = 50
+    DEFAULT_MIN_SAMPLES: int = 50
+
+    def __init__(
+        self,
+        percentile: float,
+        window_size: Optional[int] = None,
+        update_interval: Optional[int] = None,
+        min_samples: Optional[int] = None,
+    ) -> None:
+        if window_size is None:
+            window_size = self.DEFAULT_WINDOW_SIZE
+
+        if update_interval is None:
+            update_interval = self.DEFAULT_UPDATE_INTERVAL
+
+        if min_samples is None:
+            min_samples = self.DEFAULT_MIN_SAMPLES
+
+        self.percentile = percentile
+        self.update_interval = update_interval
+        self.min_samples = min_samples
+
+        self.samples: Deque[float] = deque(maxlen=window_size)
+        self.pending: int = 0
+        self.value: Optional[float] = None
+
+    def add(self, latency: float) -> None:
+        self.samples.append(latency)
+        self.pending += 1
+        if self.pending >= self.update_interval and len(self.samples) >= self.min_samples:
+            self.pending = 0
+            ordered = sorted(self.samples)
+            index = math.ceil(self.percentile * len(ordered)) - 1
+            self.value = ordered[max(0, min(len(ordered) - 1, index))]
+
+    def get(self) -> Optional[float]:
+        return self.value
+
+
+class HedgingPolicy:
+    """Sends a second, identical request when the first has not returned after
+    the 'percentile' latency of its endpoint (but no sooner than 'min_delay');
+    the first to succeed wins and the other is cancelled.
+
+    Only for idempotent reads. Hedges are capped to about 'max_ratio' of the
+    calls by a RetryBudget, so that they cannot double the load on a backend
+    that is slow for everyone."""
+
+    DEFAULT_PERCENTILE: float = 0.95
+    DEFAULT_MIN_DELAY: float = 0.005
+    DEFAULT_MAX_RATIO: float = 0.05
+
+    def __init__(
+        self,
+        percentile: Optional[float] = None,
+        min_delay: Optional[float] = None,
+        max_ratio: Optional[float] = None,
+    ) -> None:
+        if percentile is None:
+            percentile = self.DEFAULT_PERCENTILE
+
+        if min_delay is None:
+            min_delay = self.DEFAULT_MIN_DELAY
+
+        if max_ratio is None:
+            max_ratio = self.DEFAULT_MAX_RATIO
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.budget = RetryBudget(
+            ratio=max_ratio, min_retries_per_second=0.0, max_tokens=10.0
+        )
+
+        self.trackers: Dict[str, LatencyTracker] = {}
+
+        self.hedges_fired = Counter(
+            name="sdk_hedges_fired",
+            documentation="number of hedged SDK requests sent",
+            labelnames=["endpoint"],
+            unit="count",
+        )
+        self.hedges_won = Counter(
+            name="sdk_hedges_won",
+            documentation="number of hedged SDK requests that returned before the original",
+            labelnames=["endpoint"],
+            unit="count",
+        )
+        self.hedges_denied = Counter(
+            name="sdk_hedges_denied",
+            documentation="number of SDK hedges not sent because the hedge rate cap was reached",
+            labelnames=["endpoint"],
+            unit="count",
+        )
+
+    def get_tracker(self, endpoint: str) -> LatencyTracker:
+        tracker = self.trackers.get(endpoint, None)
+        if tracker is None:
+            tracker = LatencyTracker(percentile=self.percentile)
+            self.trackers[endpoint] = tracker
+        return tracker
+
+    def get_delay(self, endpoint: str) -> Optional[float]:
+        """Returns how long to wait before hedging, None while the latency of
+        'endpoint' is not known yet."""
+        latency = self.get_tracker(endpoint).get()
+        if latency is None:
+            return None
+        return max(self.min_delay, latency)
+
+    async def call(self, endpoint: str, fn: SDKCallFunc) -> Tuple[Any, Any]:
+        """Returns the (response, error) of the first 'fn()' to succeed, or of
+        the last one to fail."""
+        tracker = self.get_tracker(endpoint)
+        self.budget.on_call()
+
+        async def timed() -> Tuple[Any, Any]:
+            start = time.perf_counter()
+            try:
+                return await fn()
+            finally:
+                # attempts that were cancelled or failed are recorded too, with
+                # the time they ran as a lower bound, so that the slow requests
+                # that get hedged still count towards the percentile.
+                tracker.add(time.perf_counter() - start)
+
+        primary = asyncio.ensure_future(timed())
+        pending = {primary}
+        try:
+            delay = self.get_delay(endpoint)
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done:
+                    if self.budget.try_withdraw():
+                        self.hedges_fired.labels(endpoint=endpoint).inc()
+                        pending.add(asyncio.ensure_future(timed()))
+                    else:
+                        self.hedges_denied.labels(endpoint=endpoint).inc()
+
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # prefer the one that succeeded if both are done.
+                task = min(done, key=lambda t: self.is_failed(t))
+                if not pending or not self.is_failed(task):
+                    if task is not primary:
+                        self.hedges_won.labels(endpoint=endpoint).inc()
+                    return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def is_failed(task: "asyncio.Future[Tuple[Any, Any]]") -> bool:
+        if task.exception() is not None:
+            return True
+        _, error = task.result()
+        return error is not None and is_retryable(error)
+
+
+__all__ = [
+    "HedgingPolicy",
+    "LatencyTracker",
+]
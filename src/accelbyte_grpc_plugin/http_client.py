@@ -0,0 +1,360 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import socket
+import threading
+import time
+
+from logging import Logger
+from typing import Any, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+from prometheus_client import Gauge, Histogram
+
+from accelbyte_py_sdk.core import HttpxHttpClient
+
+from accelbyte_grpc_plugin.cache import TTLCache
+
+DEFAULT_MAX_CONNECTIONS: int = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+DEFAULT_KEEPALIVE_EXPIRY: float = 30.0
+
+# httpcore versions whose pools keep their network backend in '_network_backend'.
+MIN_HTTPCORE_VERSION: Tuple[int, ...] = (0, 17)
+MAX_HTTPCORE_VERSION: Tuple[int, ...] = (2, 0)
+
+
+class DNSCache:
+    """Caches resolved TCP addresses of hosts for 'ttl' seconds.
+
+    Shared by the sync and async clients, so lookups are guarded by a lock."""
+
+    DEFAULT_MAX_SIZE: int = 1024
+
+    def __init__(self, ttl: float, max_size: Optional[int] = None) -> None:
+        if max_size is None:
+            max_size = self.DEFAULT_MAX_SIZE
+
+        self.cache: TTLCache[Any, List[str]] = TTLCache(max_size=max_size, ttl=ttl)
+        self.lock = threading.Lock()
+
+    def get(self, host: str, port: int) -> Optional[List[str]]:
+        with self.lock:
+            return self.cache.get((host, port))
+
+    def set(self, host: str, port: int, addresses: List[str]) -> None:
+        with self.lock:
+            self.cache.set((host, port), addresses)
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        addresses = self.get(host, port)
+        if addresses is None:
+            addresses = self.get_addresses(
+                socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            )
+            self.set(host, port, addresses)
+        return addresses
+
+    async def resolve_async(self, host: str, port: int) -> List[str]:
+        addresses = self.get(host, port)
+        if addresses is None:
+            addresses = self.get_addresses(
+                await asyncio.get_running_loop().getaddrinfo(
+                    host, port, type=socket.SOCK_STREAM
+                )
+            )
+            self.set(host, port, addresses)
+        return addresses
+
+    @staticmethod
+    def get_addresses(infos: List[Any]) -> List[str]:
+        return list(dict.fromkeys(info[4][0] for info in infos))
+
+
+class DNSCachingNetworkBackend(httpcore.NetworkBackend):
+    def __init__(self, backend: httpcore.NetworkBackend, dns_cache: DNSCache) -> None:
+        self.backend = backend
+        self.dns_cache = dns_cache
+
+    def connect_tcp(self, host: str, port: int, *args, **kwargs) -> httpcore.NetworkStream:
+        addresses = self.dns_cache.resolve(host, port)
+        for i, address in enumerate(addresses):
+            try:
+                return self.backend.connect_tcp(address, port, *args, **kwargs)
+            except httpcore.ConnectError:
+                if i == len(addresses) - 1:
+                    raise
+        return self.backend.connect_tcp(host, port, *args, **kwargs)
+
+    def connect_unix_socket(self, *args, **kwargs) -> httpcore.NetworkStream:
+        return self.backend.connect_unix_socket(*args, **kwargs)
+
+    def sleep(self, seconds: float) -> None:
+        self.backend.sleep(seconds)
+
+
+class AsyncDNSCachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, dns_cache: DNSCache) -> None:
+        self.backend = backend
+        self.dns_cache = dns_cache
+
+    async def connect_tcp(
+        self, host: str, port: int, *args, **kwargs
+    ) -> httpcore.AsyncNetworkStream:
+        # TLS still verifies and sends SNI for the origin host, not the address.
+        addresses = await self.dns_cache.resolve_async(host, port)
+        for i, address in enumerate(addresses):
+            try:
+                return await self.backend.connect_tcp(address, port, *args, **kwargs)
+            except httpcore.ConnectError:
+                if i == len(addresses) - 1:
+                    raise
+        return await self.backend.connect_tcp(host, port, *args, **kwargs)
+
+    async def connect_unix_socket(self, *args, **kwargs) -> httpcore.AsyncNetworkStream:
+        return await self.backend.connect_unix_socket(*args, **kwargs)
+
+    async def sleep(self, seconds: float) -> None:
+        await self.backend.sleep(seconds)
+
+
+class HttpPoolMetrics:
+    def __init__(self, max_connections: int) -> None:
+        self.max_connections = max_connections
+
+        self.connections = Gauge(
+            name="sdk_http_pool_connections",
+            documentation="number of pooled SDK HTTP connections",
+            labelnames=["state"],
+        )
+        self.utilization = Gauge(
+            name="sdk_http_pool_utilization",
+            documentation="ratio of SDK HTTP connections in use to the maximum",
+        )
+        self.in_flight = Gauge(
+            name="sdk_http_pool_requests_in_flight",
+            documentation="number of SDK HTTP requests being sent or waiting for a connection",
+        )
+        self.wait_time = Histogram(
+            name="sdk_http_pool_wait",
+            documentation="time SDK HTTP requests waited for a pooled connection",
+            unit="seconds",
+            buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf")),
+        )
+
+    def update(self, pool: Any) -> None:
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return
+        active = sum(1 for c in connections if not c.is_idle())
+        self.connections.labels(state="active").set(active)
+        self.connections.labels(state="idle").set(len(connections) - active)
+        self.utilization.set(active / self.max_connections if self.max_connections else 0)
+
+
+class TimeoutHTTPTransport(httpx.HTTPTransport):
+    """Applies 'timeout' to requests that do not set their own.
+
+    The SDK builds its requests without the client, so the client's timeout
+    would never be used."""
+
+    def __init__(self, *args, timeout: Optional[httpx.Timeout] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.timeout = timeout
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.timeout is not None and "timeout" not in request.extensions:
+            request.extensions["timeout"] = self.timeout.as_dict()
+        return super().handle_request(request)
+
+
+class InstrumentedAsyncHTTPTransport(httpx.AsyncHTTPTransport):
+    """Applies 'timeout' to requests that do not set their own and exports the
+    connection pool usage and how long requests wait for a connection (the
+    time until the first connection event is traced)."""
+
+    def __init__(
+        self,
+        *args,
+        timeout: Optional[httpx.Timeout] = None,
+        metrics: Optional[HttpPoolMetrics] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.timeout = timeout
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.timeout is not None and "timeout" not in request.extensions:
+            request.extensions["timeout"] = self.timeout.as_dict()
+
+        if self.metrics is None:
+            return await super().handle_async_request(request)
+
+        metrics = self.metrics
+        start = time.perf_counter()
+        waiting = True
+        trace = request.extensions.get("trace", None)
+
+        async def on_trace(name: str, info: Any) -> None:
+            nonlocal waiting
+            if waiting:
+                waiting = False
+                metrics.wait_time.observe(time.perf_counter() - start)
+                metrics.update(self._pool)
+            if trace is not None:
+                await trace(name, info)
+
+        request.extensions["trace"] = on_trace
+        metrics.in_flight.inc()
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            metrics.in_flight.dec()
+            metrics.update(self._pool)
+
+
+class TunedHttpxHttpClient(HttpxHttpClient):
+    """An SDK HTTP client built on the given transports.
+
+    The base class creates its own transports and clients, which would have
+    to be replaced (and closed) afterwards."""
+
+    # noinspection PyMissingConstructor
+    def __init__(
+        self,
+        transport: httpx.HTTPTransport,
+        transport_async: httpx.AsyncHTTPTransport,
+        timeout: Optional[httpx.Timeout] = None,
+        follow_redirects: bool = False,
+    ) -> None:
+        self.transport = transport
+        self.transport_async = transport_async
+        self.follow_redirects = follow_redirects
+        self.client = httpx.Client(
+            transport=self.transport, timeout=timeout, follow_redirects=follow_redirects
+        )
+        self.client_async = httpx.AsyncClient(
+            transport=self.transport_async, timeout=timeout, follow_redirects=follow_redirects
+        )
+        self.allowed_kwarg_keys = {
+            "follow_redirects",
+            "timeout",
+        }
+
+
+def get_httpcore_version() -> Tuple[int, ...]:
+    version = []
+    for part in httpcore.__version__.split(".")[:2]:
+        if not part.isdigit():
+            break
+        version.append(int(part))
+    return tuple(version)
+
+
+def is_network_backend_supported(transport: Any) -> bool:
+    """Whether the network backend of the pool of 'transport' can be replaced.
+
+    httpx does not expose it, the private attributes are only relied upon for
+    the httpcore versions they are known to exist in."""
+    if not (MIN_HTTPCORE_VERSION <= get_httpcore_version() < MAX_HTTPCORE_VERSION):
+        return False
+    pool = getattr(transport, "_pool", None)
+    return pool is not None and hasattr(pool, "_network_backend")
+
+
+def create_httpx_http_client(
+    http1: bool = True,
+    http2: bool = True,
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    write_timeout: Optional[float] = None,
+    pool_timeout: Optional[float] = None,
+    dns_cache_ttl: Optional[float] = None,
+    follow_redirects: bool = True,
+    metrics: bool = True,
+    logger: Optional[Logger] = None,
+) -> HttpxHttpClient:
+    """Creates an SDK HTTP client with tuned pools for both its sync and async
+    clients. HTTP/2 is negotiated over TLS, with 'http1' disabled it is also
+    used for plain HTTP (prior knowledge). A None timeout means no timeout,
+    a 'timeout' passed to an SDK call (e.g. the RPC deadline) overrides all of
+    them. The DNS cache is skipped on httpcore versions it does not support."""
+    if max_connections is None:
+        max_connections = DEFAULT_MAX_CONNECTIONS
+
+    if max_keepalive_connections is None:
+        max_keepalive_connections = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+
+    if keepalive_expiry is None:
+        keepalive_expiry = DEFAULT_KEEPALIVE_EXPIRY
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    timeout = httpx.Timeout(
+        connect=connect_timeout,
+        read=read_timeout,
+        write=write_timeout,
+        pool=pool_timeout,
+    )
+
+    transport = TimeoutHTTPTransport(
+        http1=http1, http2=http2, limits=limits, timeout=timeout
+    )
+    transport_async = InstrumentedAsyncHTTPTransport(
+        http1=http1,
+        http2=http2,
+        limits=limits,
+        timeout=timeout,
+        metrics=HttpPoolMetrics(max_connections=max_connections) if metrics else None,
+    )
+
+    if dns_cache_ttl:
+        if is_network_backend_supported(transport) and is_network_backend_supported(
+            transport_async
+        ):
+            dns_cache = DNSCache(ttl=dns_cache_ttl)
+            # noinspection PyProtectedMember
+            pool = transport._pool
+            pool._network_backend = DNSCachingNetworkBackend(pool._network_backend, dns_cache)
+            # noinspection PyProtectedMember
+            pool = transport_async._pool
+            pool._network_backend = AsyncDNSCachingNetworkBackend(
+                pool._network_backend, dns_cache
+            )
+        elif logger:
+            logger.warning(
+                "SDK HTTP DNS cache disabled, not supported with httpcore %s",
+                httpcore.__version__,
+            )
+
+    return TunedHttpxHttpClient(
+        transport=transport,
+        transport_async=transport_async,
+        timeout=timeout,
+        follow_redirects=follow_redirects,
+    )
+
+
+__all__ = [
+    "AsyncDNSCachingNetworkBackend",
+    "DNSCache",
+    "DNSCachingNetworkBackend",
+    "HttpPoolMetrics",
+    "InstrumentedAsyncHTTPTransport",
+    "TimeoutHTTPTransport",
+    "TunedHttpxHttpClient",
+    "create_httpx_http_client",
+    "get_httpcore_version",
+    "is_network_backend_supported",
+]
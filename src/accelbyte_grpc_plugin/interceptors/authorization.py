@@ -2,16 +2,37 @@
 # This is licensed software from AccelByte Inc, for limitations
 # and restrictions contact your company contract manager.
 
-from typing import Awaitable, Callable, List, Optional
+import hashlib
+import time
+
+from contextvars import ContextVar
+from logging import Logger
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 import grpc
 from grpc import HandlerCallDetails, RpcMethodHandler, StatusCode
 from grpc.aio import ServerInterceptor
+from prometheus_client import Counter
 
 from google.protobuf.descriptor import MethodDescriptor
 from google.protobuf.descriptor_pool import Default as DescriptorPool
 
-from accelbyte_grpc_plugin.utils import get_headers_from_metadata, get_propagator_header_keys
+from accelbyte_grpc_plugin.cache import TTLCache
+from accelbyte_grpc_plugin.token_validation import (
+    AccessTokenClaims,
+    AsyncClaimsTokenValidatorProtocol,
+    AsyncTokenValidatorProtocol,
+    JWTClaims,
+    RevocationListObservable,
+    create_async_token_validator,
+)
+from accelbyte_grpc_plugin.utils import (
+    get_headers_from_metadata,
+    get_propagator_header_keys,
+    wrap_rpc_behavior,
+    wrap_rpc_method_handler,
+)
 
 from accelbyte_py_sdk.services.auth import parse_access_token
 from accelbyte_py_sdk.token_validation import TokenValidatorProtocol
@@ -22,7 +43,36 @@ from accelbyte_py_sdk.token_validation._ctypes import (
 )
 
 
+class MethodPolicy(NamedTuple):
+    method: str
+    resource: Optional[str] = None
+    action: Optional[int] = None
+    whitelisted: bool = False
+
+
+TokenCacheKey = Tuple[bytes, Optional[str], Optional[int], Optional[str]]
+
+
+class TokenCacheEntry(NamedTuple):
+    error: Optional[Exception]
+    claims: Optional[AccessTokenClaims]
+
+
+access_token_claims_var: ContextVar[Optional[AccessTokenClaims]] = ContextVar(
+    "access_token_claims", default=None
+)
+
+
+def get_access_token_claims() -> Optional[AccessTokenClaims]:
+    """Returns the claims of the access token of the RPC being served, as
+    verified by the AuthorizationServerInterceptor."""
+    return access_token_claims_var.get()
+
+
 class AuthorizationServerInterceptor(ServerInterceptor):
+    DEFAULT_TOKEN_CACHE_MAX_SIZE: int = 10000
+    DEFAULT_TOKEN_CACHE_TTL: float = 60.0
+
     whitelisted_methods: List[str] = [
         "/grpc.health.v1.Health/Check",
         "/grpc.health.v1.Health/Watch",
@@ -31,29 +81,231 @@ class AuthorizationServerInterceptor(ServerInterceptor):
 
     def __init__(
         self,
-        token_validator: TokenValidatorProtocol,
+        token_validator: Union[AsyncTokenValidatorProtocol, TokenValidatorProtocol],
         resource: Optional[str] = None,
         action: Optional[int] = None,
         namespace: Optional[str] = None,
+        token_cache_max_size: Optional[int] = None,
+        token_cache_ttl: Optional[float] = None,
     ) -> None:
         self.token_validator = token_validator
+        self.async_token_validator = create_async_token_validator(token_validator)
         self.resource = resource
         self.action = action
         self.namespace = namespace
 
+        self.method_not_found_handler = self.create_aio_rpc_error(
+            error="method not found", code=StatusCode.INTERNAL
+        )
+        self.method_policies: Optional[Mapping[str, MethodPolicy]] = None
+        # policies of the methods missing from 'method_policies', resolved on first use.
+        self.resolved_method_policies: Dict[str, MethodPolicy] = {}
+
+        if token_cache_max_size is None:
+            token_cache_max_size = self.DEFAULT_TOKEN_CACHE_MAX_SIZE
+
+        if token_cache_ttl is None:
+            token_cache_ttl = self.DEFAULT_TOKEN_CACHE_TTL
+
+        self.token_cache: Optional[TTLCache[TokenCacheKey, TokenCacheEntry]] = None
+        if token_cache_max_size > 0 and token_cache_ttl > 0:
+            self.token_cache = TTLCache(
+                max_size=token_cache_max_size,
+                ttl=token_cache_ttl,
+                on_evict=self.on_token_cache_evict,
+            )
+            if isinstance(token_validator, RevocationListObservable):
+                token_validator.add_revocation_list_listener(
+                    self.on_revocation_list_updated
+                )
+
+        self.token_cache_hits = Counter(
+            name="grpc_server_auth_token_cache_hits",
+            documentation="number of verified token cache hits",
+            unit="count",
+        )
+        self.token_cache_misses = Counter(
+            name="grpc_server_auth_token_cache_misses",
+            documentation="number of verified token cache misses",
+            unit="count",
+        )
+        self.token_cache_evictions = Counter(
+            name="grpc_server_auth_token_cache_evictions",
+            documentation="number of verified token cache evictions",
+            unit="count",
+        )
+
     async def intercept_service(
         self,
         continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
         handler_call_details: HandlerCallDetails,
     ) -> RpcMethodHandler:
         method = getattr(handler_call_details, "method", "")
-        if method in self.whitelisted_methods:
+        policy = self.get_method_policy(method=method)
+        if policy is None:
+            return self.method_not_found_handler
+
+        if policy.whitelisted:
             return await continuation(handler_call_details)
 
+        resource = policy.resource
+        action = policy.action
+
+        headers = get_headers_from_metadata(handler_call_details=handler_call_details)
+
+        authorization = headers.get("authorization", None)
+
+        if not authorization:
+            return self.create_aio_rpc_error(error="no authorization token found")
+
+        if not authorization.startswith("Bearer "):
+            return self.create_aio_rpc_error(error="invalid authorization token format")
+
+        token = authorization.removeprefix("Bearer ")
+
+        token_cache_key: Optional[TokenCacheKey] = None
+        token_cache_entry: Optional[TokenCacheEntry] = None
+        if self.token_cache is not None:
+            token_cache_key = self.create_token_cache_key(
+                token=token, resource=resource, action=action
+            )
+            token_cache_entry = self.token_cache.get(token_cache_key)
+            if token_cache_entry is not None:
+                self.token_cache_hits.inc()
+            else:
+                self.token_cache_misses.inc()
+
+        if token_cache_entry is None:
+            try:
+                # by default, any HTTP calls inside an interceptor does not propagate headers
+                propagator_header_keys = get_propagator_header_keys()
+                propagator_headers = {k: v for k, v in headers.items() if k in propagator_header_keys}
+
+                claims_dict, error = await self.validate_token_claims(
+                    token=token,
+                    resource=resource,
+                    action=action,
+                    x_additional_headers=propagator_headers,
+                )
+            except Exception as error:
+                return self.create_aio_rpc_error(
+                    error=f"ValidateToken.{type(error).__name__}: {error}",
+                    code=StatusCode.INTERNAL,
+                )
+
+            claims: Optional[AccessTokenClaims] = None
+            if claims_dict is not None:
+                claims = AccessTokenClaims.from_dict(claims_dict)
+
+            token_cache_entry = TokenCacheEntry(error=error, claims=claims)
+            if token_cache_key is not None and self.is_token_cacheable(error=error):
+                self.token_cache.set(
+                    token_cache_key,
+                    token_cache_entry,
+                    ttl=self.get_token_cache_ttl(claims=claims),
+                )
+
+        error = token_cache_entry.error
+        if error is not None:
+            if isinstance(error, InsufficientPermissionsError):
+                return self.create_aio_rpc_error(
+                    error=f"insufficient permissions: resource: {resource}, action: {action}",
+                    code=StatusCode.PERMISSION_DENIED,
+                )
+            elif isinstance(error, (TokenRevokedError, UserRevokedError)):
+                return self.create_aio_rpc_error(
+                    error=f"authorization token was already revoked",
+                    code=StatusCode.PERMISSION_DENIED,
+                )
+            else:
+                return self.create_aio_rpc_error(
+                    error=f"ValidateToken.{type(error).__name__}: {error}",
+                    code=StatusCode.UNAUTHENTICATED,
+                )
+
+        claims = token_cache_entry.claims
+        if claims is not None and (extend_namespace := claims.extend_namespace):
+            if extend_namespace != self.namespace:
+                return self.create_aio_rpc_error(
+                    error=f"'{extend_namespace}' does not match '{self.namespace}'",
+                    code=StatusCode.PERMISSION_DENIED,
+                )
+
+        handler = await continuation(handler_call_details)
+        return wrap_rpc_method_handler(
+            handler,
+            lambda behavior: wrap_rpc_behavior(
+                behavior,
+                before=lambda: access_token_claims_var.set(claims),
+                after=lambda state, _: access_token_claims_var.reset(state),
+            ),
+        )
+
+    def build_method_policies(
+        self, service_names: Iterable[str], logger: Optional[Logger] = None
+    ) -> Mapping[str, MethodPolicy]:
+        policies: Dict[str, MethodPolicy] = {
+            method: MethodPolicy(method=method, whitelisted=True)
+            for method in self.whitelisted_methods
+        }
+
+        for service_name in service_names:
+            try:
+                service_descriptor = DescriptorPool().FindServiceByName(service_name)
+            except KeyError:
+                if logger:
+                    logger.warning("service not found: %s", service_name)
+                continue
+            for method_descriptor in service_descriptor.methods:
+                method = f"/{service_descriptor.full_name}/{method_descriptor.name}"
+                if method not in policies:
+                    policies[method] = self.create_method_policy(
+                        method=method, method_descriptor=method_descriptor
+                    )
+
+        self.method_policies = MappingProxyType(policies)
+
+        if logger:
+            for policy in self.dump_method_policies():
+                logger.debug("authorization policy: %s", policy)
+
+        return self.method_policies
+
+    def dump_method_policies(self) -> List[Dict[str, Any]]:
+        if self.method_policies is None:
+            return []
+        return [policy._asdict() for policy in self.method_policies.values()]
+
+    def get_method_policy(self, method: str) -> Optional[MethodPolicy]:
+        if self.method_policies is not None:
+            policy = self.method_policies.get(method, None)
+            if policy is not None:
+                return policy
+
+        policy = self.resolved_method_policies.get(method, None)
+        if policy is None:
+            # e.g. services added to the server after the policies were built.
+            policy = self.resolve_method_policy(method=method)
+            if policy is not None:
+                # only methods found in the descriptor pool are kept, so this stays bounded.
+                self.resolved_method_policies[method] = policy
+        return policy
+
+    def resolve_method_policy(self, method: str) -> Optional[MethodPolicy]:
+        if method in self.whitelisted_methods:
+            return MethodPolicy(method=method, whitelisted=True)
+
         method_descriptor = self.get_method_descriptor(method=method)
         if not method_descriptor:
-            return self.create_aio_rpc_error(error="method not found", code=StatusCode.INTERNAL)
+            return None
+
+        return self.create_method_policy(
+            method=method, method_descriptor=method_descriptor
+        )
 
+    def create_method_policy(
+        self, method: str, method_descriptor: MethodDescriptor
+    ) -> MethodPolicy:
         resource: Optional[str] = None
         action: Optional[int] = None
 
@@ -79,71 +331,64 @@ class AuthorizationServerInterceptor(ServerInterceptor):
         if action is None:
             action = self.action
 
-        headers = get_headers_from_metadata(handler_call_details=handler_call_details)
-
-        authorization = headers.get("authorization", None)
+        return MethodPolicy(method=method, resource=resource, action=action)
 
-        if not authorization:
-            return self.create_aio_rpc_error(error="no authorization token found")
-
-        if not authorization.startswith("Bearer "):
-            return self.create_aio_rpc_error(error="invalid authorization token format")
-
-        try:
-            # by default, any HTTP calls inside an interceptor does not propagate headers
-            propagator_header_keys = get_propagator_header_keys()
-            propagator_headers = {k: v for k, v in headers.items() if k in propagator_header_keys}
-
-            token = authorization.removeprefix("Bearer ")
-            error = self.token_validator.validate_token(
+    async def validate_token_claims(
+        self,
+        token: str,
+        resource: Optional[str],
+        action: Optional[int],
+        **kwargs,
+    ) -> Tuple[Optional[JWTClaims], Optional[Exception]]:
+        if isinstance(self.async_token_validator, AsyncClaimsTokenValidatorProtocol):
+            return await self.async_token_validator.validate_token_claims_async(
                 token=token,
                 resource=resource,
                 action=action,
                 namespace=self.namespace,
-                x_additional_headers=propagator_headers,
-            )
-            if error is not None:
-                if isinstance(error, InsufficientPermissionsError):
-                    return self.create_aio_rpc_error(
-                        error=f"insufficient permissions: resource: {resource}, action: {action}",
-                        code=StatusCode.PERMISSION_DENIED,
-                    )
-                elif isinstance(error, (TokenRevokedError, UserRevokedError)):
-                    return self.create_aio_rpc_error(
-                        error=f"authorization token was already revoked",
-                        code=StatusCode.PERMISSION_DENIED,
-                    )
-                else:
-                    return self.create_aio_rpc_error(
-                        error=f"ValidateToken.{type(error).__name__}: {error}",
-                        code=StatusCode.UNAUTHENTICATED,
-                    )
-        except Exception as error:
-            return self.create_aio_rpc_error(
-                error=f"ValidateToken.{type(error).__name__}: {error}",
-                code=StatusCode.INTERNAL,
+                **kwargs,
             )
 
-        try:
-            claims, error = parse_access_token(token)
-            if error is not None:
-                return self.create_aio_rpc_error(
-                    error=f"ParceAccessToken.{type(error).__name__}: {error}",
-                    code=StatusCode.UNAUTHENTICATED,
-                )
-            if extend_namespace := claims.get("extend_namespace", None):
-                if extend_namespace != self.namespace:
-                    return self.create_aio_rpc_error(
-                        error=f"'{extend_namespace}' does not match '{self.namespace}'",
-                        code=StatusCode.PERMISSION_DENIED,
-                    )
-        except Exception as error:
-            return self.create_aio_rpc_error(
-                error=f"ParceAccessToken.{type(error).__name__}: {error}",
-                code=StatusCode.INTERNAL,
-            )
+        error = await self.async_token_validator.validate_token_async(
+            token=token,
+            resource=resource,
+            action=action,
+            namespace=self.namespace,
+            **kwargs,
+        )
+        if error is not None:
+            return None, error
+
+        claims, error = parse_access_token(token)
+        if error is not None:
+            return None, Exception(f"ParceAccessToken: {error}")
+
+        return claims, None
+
+    def create_token_cache_key(
+        self, token: str, resource: Optional[str], action: Optional[int]
+    ) -> TokenCacheKey:
+        return hashlib.sha256(token.encode()).digest(), resource, action, self.namespace
+
+    def get_token_cache_ttl(self, claims: Optional[AccessTokenClaims]) -> float:
+        ttl = self.token_cache.ttl
+        if claims is not None and claims.exp is not None:
+            ttl = min(ttl, float(claims.exp) - time.time())
+        return ttl
+
+    @staticmethod
+    def is_token_cacheable(error: Optional[Exception]) -> bool:
+        # only cache definite verdicts, transient failures should be retried.
+        return error is None or isinstance(
+            error, (InsufficientPermissionsError, TokenRevokedError, UserRevokedError)
+        )
+
+    def on_token_cache_evict(self, key: Any, value: Any) -> None:
+        self.token_cache_evictions.inc()
 
-        return await continuation(handler_call_details)
+    def on_revocation_list_updated(self) -> None:
+        if self.token_cache is not None:
+            self.token_cache.clear()
 
     @staticmethod
     def create_aio_rpc_error(error: str, code: StatusCode = StatusCode.UNAUTHENTICATED):
@@ -177,4 +422,7 @@ class AuthorizationServerInterceptor(ServerInterceptor):
 
 __all__ = [
     "AuthorizationServerInterceptor",
+    "MethodPolicy",
+    "TokenCacheEntry",
+    "get_access_token_claims",
 ]
@@ -0,0 +1,273 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import inspect
+import math
+import time
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import grpc
+from grpc import HandlerCallDetails, RpcMethodHandler, StatusCode
+from grpc.aio import ServerInterceptor
+from prometheus_client import Counter, Gauge
+
+from accelbyte_grpc_plugin.utils import wrap_rpc_method_handler
+
+
+class GradientLimit:
+    """Adaptive concurrency limit based on the gradient between the long-term
+    and the short-term round trip time (see Netflix's Gradient2Limit).
+
+    While latency stays close to its long-term average the limit grows by
+    about sqrt(limit) per sample, when latency rises the limit is scaled down
+    by the ratio of the two (at most halved per sample)."""
+
+    DEFAULT_INITIAL_LIMIT: int = 20
+    DEFAULT_MIN_LIMIT: int = 1
+    DEFAULT_MAX_LIMIT: int = 1000
+    DEFAULT_SMOOTHING: float = 0.2
+    DEFAULT_TOLERANCE: float = 1.5
+    DEFAULT_LONG_WINDOW: int = 600
+    # ratio of the limit applied when a call fails with a timeout-like status.
+    DEFAULT_BACKOFF_RATIO: float = 0.9
+
+    def __init__(
+        self,
+        initial_limit: Optional[int] = None,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        smoothing: Optional[float] = None,
+        tolerance: Optional[float] = None,
+        long_window: Optional[int] = None,
+        backoff_ratio: Optional[float] = None,
+    ) -> None:
+        if initial_limit is None:
+            initial_limit = self.DEFAULT_INITIAL_LIMIT
+
+        if min_limit is None:
+            min_limit = self.DEFAULT_MIN_LIMIT
+
+        if max_limit is None:
+            max_limit = self.DEFAULT_MAX_LIMIT
+
+        if smoothing is None:
+            smoothing = self.DEFAULT_SMOOTHING
+
+        if tolerance is None:
+            tolerance = self.DEFAULT_TOLERANCE
+
+        if long_window is None:
+            long_window = self.DEFAULT_LONG_WINDOW
+
+        if backoff_ratio is None:
+            backoff_ratio = self.DEFAULT_BACKOFF_RATIO
+
+        self.limit: float = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.long_window = long_window
+        self.backoff_ratio = backoff_ratio
+
+        self.in_flight: int = 0
+        self.long_rtt: Optional[float] = None
+        self.short_rtt: Optional[float] = None
+
+    def is_full(self) -> bool:
+        return self.in_flight >= int(self.limit)
+
+    def try_acquire(self) -> bool:
+        if self.is_full():
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, rtt: float, in_flight: int, dropped: bool = False) -> None:
+        self.in_flight -= 1
+
+        if dropped:
+            self.set_limit(self.limit * self.backoff_ratio)
+            return
+
+        if self.long_rtt is None or self.short_rtt is None:
+            self.long_rtt = self.short_rtt = rtt
+            return
+
+        self.short_rtt = rtt
+        self.long_rtt += (rtt - self.long_rtt) / self.long_window
+
+        # the long-term average was built during a slow period, let it recover faster.
+        if self.long_rtt / self.short_rtt > 2:
+            self.long_rtt *= 0.95
+
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / self.short_rtt))
+        new_limit = self.limit * gradient + math.sqrt(self.limit)
+        # the limit is not what is holding back the calls, do not grow it.
+        if new_limit > self.limit and in_flight < self.limit / 2:
+            return
+
+        self.set_limit(self.limit * (1 - self.smoothing) + new_limit * self.smoothing)
+
+    def set_limit(self, limit: float) -> None:
+        self.limit = max(float(self.min_limit), min(float(self.max_limit), limit))
+
+    def get_retry_after(self) -> float:
+        # a slot frees up roughly once per round trip.
+        return self.short_rtt or 0.0
+
+
+class ConcurrencyLimitServerInterceptor(ServerInterceptor):
+    """Sheds calls above an adaptive per-method in-flight limit with RESOURCE_EXHAUSTED.
+
+    Only unary calls are limited. Rejected calls carry a retry hint in the
+    'grpc-retry-pushback-ms' and 'retry-after' (seconds) trailing metadata.
+    Calls failing with one of the 'drop_codes' are treated as overload
+    signals and shrink the limit."""
+
+    DEFAULT_MIN_RETRY_AFTER: float = 0.1
+
+    bypass_methods: List[str] = [
+        "/grpc.health.v1.Health/Check",
+        "/grpc.health.v1.Health/Watch",
+    ]
+
+    drop_codes: Tuple[StatusCode, ...] = (
+        StatusCode.DEADLINE_EXCEEDED,
+        StatusCode.RESOURCE_EXHAUSTED,
+        StatusCode.UNAVAILABLE,
+    )
+
+    def __init__(
+        self,
+        limit_factory: Optional[Callable[[], GradientLimit]] = None,
+        min_retry_after: Optional[float] = None,
+    ) -> None:
+        if limit_factory is None:
+            limit_factory = GradientLimit
+
+        if min_retry_after is None:
+            min_retry_after = self.DEFAULT_MIN_RETRY_AFTER
+
+        self.limit_factory = limit_factory
+        self.min_retry_after = min_retry_after
+        self.limits: Dict[str, GradientLimit] = {}
+
+        self.limit_gauge = Gauge(
+            name="grpc_server_concurrency_limit",
+            documentation="current adaptive concurrency limit",
+            labelnames=["method"],
+        )
+        self.in_flight_gauge = Gauge(
+            name="grpc_server_concurrency_in_flight",
+            documentation="number of calls admitted by the concurrency limiter",
+            labelnames=["method"],
+        )
+        self.shed_counter = Counter(
+            name="grpc_server_concurrency_shed",
+            documentation="number of calls rejected by the concurrency limiter",
+            labelnames=["method"],
+            unit="count",
+        )
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        # noinspection PyUnresolvedReferences
+        method = handler_call_details.method
+        if method in self.bypass_methods:
+            return await continuation(handler_call_details)
+
+        limit = self.get_limit(method)
+        # shed early, before the interceptors after this one do any work.
+        if limit.is_full():
+            self.shed_counter.labels(method=method).inc()
+            return self.create_shed_handler(retry_after=self.get_retry_after(limit))
+
+        handler = await continuation(handler_call_details)
+
+        # streams are long-lived, their duration says nothing about the load.
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        # the slot is taken once the call is dispatched, calls cancelled or
+        # failing before that (e.g. while reading the request) never hold one.
+        return wrap_rpc_method_handler(
+            handler, lambda behavior: self.wrap_behavior(behavior, method, limit)
+        )
+
+    def wrap_behavior(self, behavior: Callable, method: str, limit: GradientLimit) -> Callable:
+        async def wrapped(request: Any, context: Any) -> Any:
+            if not limit.try_acquire():
+                self.shed_counter.labels(method=method).inc()
+                await self.abort_shed(context, retry_after=self.get_retry_after(limit))
+
+            start = time.monotonic()
+            in_flight = limit.in_flight
+            self.in_flight_gauge.labels(method=method).inc()
+            error: Optional[BaseException] = None
+            try:
+                result = behavior(request, context)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                limit.release(time.monotonic() - start, in_flight, dropped=self.is_drop(error))
+                self.in_flight_gauge.labels(method=method).dec()
+                self.limit_gauge.labels(method=method).set(limit.limit)
+
+        return wrapped
+
+    def get_limit(self, method: str) -> GradientLimit:
+        limit = self.limits.get(method, None)
+        if limit is None:
+            limit = self.limit_factory()
+            self.limits[method] = limit
+            self.limit_gauge.labels(method=method).set(limit.limit)
+        return limit
+
+    def is_drop(self, error: Optional[BaseException]) -> bool:
+        if error is None:
+            return False
+        code = getattr(error, "code", None)
+        if callable(code):
+            try:
+                return code() in self.drop_codes
+            except Exception:
+                return False
+        return False
+
+    def get_retry_after(self, limit: GradientLimit) -> float:
+        return max(self.min_retry_after, limit.get_retry_after())
+
+    @classmethod
+    def create_shed_handler(cls, retry_after: float) -> RpcMethodHandler:
+        async def abort(ignored_request: Any, context: Any) -> None:
+            await cls.abort_shed(context, retry_after=retry_after)
+
+        return grpc.unary_unary_rpc_method_handler(abort)
+
+    @staticmethod
+    async def abort_shed(context: Any, retry_after: float) -> None:
+        trailing_metadata = (
+            ("grpc-retry-pushback-ms", str(int(retry_after * 1000))),
+            ("retry-after", str(max(1, math.ceil(retry_after)))),
+        )
+        await context.abort(
+            StatusCode.RESOURCE_EXHAUSTED,
+            "server is overloaded, retry later",
+            trailing_metadata=trailing_metadata,
+        )
+
+
+__all__ = [
+    "ConcurrencyLimitServerInterceptor",
+    "GradientLimit",
+]
@@ -2,31 +2,228 @@
 # This is licensed software from AccelByte Inc, for limitations
 # and restrictions contact your company contract manager.
 
+import asyncio
+import inspect
 import platform
-from typing import Any, Awaitable, Callable, Dict, Optional
+import time
 
-from grpc import HandlerCallDetails, RpcMethodHandler
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+from grpc import HandlerCallDetails, RpcMethodHandler, StatusCode
 from grpc.aio import ServerInterceptor
-from prometheus_client import Counter
+from opentelemetry.trace import get_current_span
+from prometheus_client import Counter, Gauge, Histogram
+
+from accelbyte_grpc_plugin.utils import wrap_rpc_method_handler
+
+STATUS_CODES: Dict[int, StatusCode] = {code.value[0]: code for code in StatusCode}
+
+
+class MethodMetrics:
+    """The metrics children of one method, so that serving a call does not
+    resolve (and allocate) label values."""
+
+    def __init__(
+        self, interceptor: "MetricsServerInterceptor", method: str
+    ) -> None:
+        self.interceptor = interceptor
+        self.label_values: Tuple[str, ...] = (*interceptor.labels.values(), method)
+
+        self.in_flight = interceptor.in_flight.labels(*self.label_values)
+        self.request_size = interceptor.request_size.labels(*self.label_values)
+        self.response_size = interceptor.response_size.labels(*self.label_values)
+        self.by_code: Dict[StatusCode, Tuple[Any, Any]] = {}
+
+    def on_done(self, code: StatusCode, duration: float) -> None:
+        children = self.by_code.get(code, None)
+        if children is None:
+            label_values = (*self.label_values, code.name)
+            children = (
+                self.interceptor.calls.labels(*label_values),
+                self.interceptor.duration.labels(*label_values),
+            )
+            self.by_code[code] = children
+        calls, duration_histogram = children
+        calls.inc()
+        duration_histogram.observe(duration, exemplar=get_trace_exemplar())
 
 
 class MetricsServerInterceptor(ServerInterceptor):
+    """Records, per method: calls and their duration by status code, request
+    and response message sizes, and the calls in flight.
+
+    Durations carry the trace ID of the call as an exemplar (OpenMetrics)."""
+
+    DEFAULT_BUCKETS: Sequence[float] = (
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+        float("inf"),
+    )
+    # 64 B to 4 MiB (the default maximum message size).
+    SIZE_BUCKETS: Sequence[float] = tuple(4.0**i for i in range(3, 12)) + (float("inf"),)
+
     def __init__(
         self,
         labels: Optional[Dict[str, Any]] = None,
+        buckets: Optional[Sequence[float]] = None,
     ) -> None:
+        if buckets is None:
+            buckets = self.DEFAULT_BUCKETS
+
         self.labels = labels if labels else {"os": platform.system().lower()}
-        self.counter = Counter(
+        labelnames = [*self.labels.keys(), "method"]
+
+        self.calls = Counter(
             name="grpc_server_calls",
             documentation="number of gRPC calls",
-            labelnames=self.labels.keys(),
+            labelnames=[*labelnames, "code"],
             unit="count",
         )
+        self.duration = Histogram(
+            name="grpc_server_handling",
+            documentation="time taken to serve gRPC calls",
+            labelnames=[*labelnames, "code"],
+            unit="seconds",
+            buckets=buckets,
+        )
+        self.in_flight = Gauge(
+            name="grpc_server_calls_in_flight",
+            documentation="number of gRPC calls being served",
+            labelnames=labelnames,
+        )
+        self.request_size = Histogram(
+            name="grpc_server_request_message_size",
+            documentation="size of the received gRPC request messages",
+            labelnames=labelnames,
+            unit="bytes",
+            buckets=self.SIZE_BUCKETS,
+        )
+        self.response_size = Histogram(
+            name="grpc_server_response_message_size",
+            documentation="size of the sent gRPC response messages",
+            labelnames=labelnames,
+            unit="bytes",
+            buckets=self.SIZE_BUCKETS,
+        )
+
+        self.methods: Dict[str, MethodMetrics] = {}
 
     async def intercept_service(
         self,
         continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
         handler_call_details: HandlerCallDetails,
     ) -> RpcMethodHandler:
-        self.counter.labels(**self.labels).inc(amount=1)
-        return await continuation(handler_call_details)
+        # noinspection PyUnresolvedReferences
+        method = handler_call_details.method
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        metrics = self.methods.get(method, None)
+        if metrics is None:
+            metrics = MethodMetrics(self, method)
+            self.methods[method] = metrics
+
+        return wrap_rpc_method_handler(
+            handler, lambda behavior: self.wrap_behavior(metrics, behavior)
+        )
+
+    def wrap_behavior(self, metrics: MethodMetrics, behavior: Callable) -> Callable:
+        def on_request(request: Any) -> None:
+            metrics.request_size.observe(get_message_size(request))
+
+        def on_response(response: Any) -> None:
+            metrics.response_size.observe(get_message_size(response))
+
+        def wrap_request(request_or_iterator: Any) -> Any:
+            if hasattr(request_or_iterator, "__aiter__"):
+                return observe_iterator(request_or_iterator, on_request)
+            on_request(request_or_iterator)
+            return request_or_iterator
+
+        def on_done(context: Any, error: Optional[BaseException], start: float) -> None:
+            metrics.in_flight.dec()
+            metrics.on_done(get_status_code(context, error), time.perf_counter() - start)
+
+        if inspect.isasyncgenfunction(behavior):
+            async def wrapped_async_gen(request_or_iterator, context):
+                metrics.in_flight.inc()
+                start = time.perf_counter()
+                error: Optional[BaseException] = None
+                try:
+                    async for response in behavior(wrap_request(request_or_iterator), context):
+                        on_response(response)
+                        yield response
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    on_done(context, error, start)
+
+            return wrapped_async_gen
+
+        async def wrapped(request_or_iterator, context):
+            metrics.in_flight.inc()
+            start = time.perf_counter()
+            error: Optional[BaseException] = None
+            try:
+                result = behavior(wrap_request(request_or_iterator), context)
+                if inspect.isawaitable(result):
+                    result = await result
+                if result is not None:
+                    on_response(result)
+                return result
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                on_done(context, error, start)
+
+        return wrapped
+
+
+async def observe_iterator(
+    iterator: AsyncIterator[Any], on_item: Callable[[Any], None]
+) -> AsyncIterator[Any]:
+    async for item in iterator:
+        on_item(item)
+        yield item
+
+
+def get_message_size(message: Any) -> int:
+    byte_size = getattr(message, "ByteSize", None)
+    return byte_size() if byte_size is not None else 0
+
+
+def get_status_code(context: Any, error: Optional[BaseException]) -> StatusCode:
+    if error is not None:
+        code = getattr(error, "code", None)
+        if callable(code):
+            try:
+                code = code()
+            except Exception:
+                code = None
+        if isinstance(code, StatusCode):
+            return code
+        if isinstance(error, asyncio.CancelledError):
+            return StatusCode.CANCELLED
+    # set by 'context.abort(...)' or 'context.set_code(...)'.
+    code_fn = getattr(context, "code", None)
+    code = code_fn() if callable(code_fn) else None
+    if isinstance(code, int):
+        code = STATUS_CODES.get(code, None)
+    if isinstance(code, StatusCode):
+        return code
+    return StatusCode.UNKNOWN if error is not None else StatusCode.OK
+
+
+def get_trace_exemplar() -> Optional[Dict[str, str]]:
+    span_context = get_current_span().get_span_context()
+    if not span_context.is_valid:
+        return None
+    return {"trace_id": format(span_context.trace_id, "032x")}
+
+
+__all__ = [
+    "MethodMetrics",
+    "MetricsServerInterceptor",
+]
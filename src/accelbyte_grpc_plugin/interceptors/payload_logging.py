@@ -0,0 +1,84 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import inspect
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from grpc import HandlerCallDetails, RpcMethodHandler
+from grpc.aio import ServerInterceptor
+
+from accelbyte_grpc_plugin.payload_logging import PayloadLogger
+from accelbyte_grpc_plugin.utils import wrap_rpc_method_handler
+
+
+class PayloadLoggingServerInterceptor(ServerInterceptor):
+    """Logs the request and response messages of sampled calls.
+
+    Whether a call is sampled is decided once when it starts, so that either
+    all or none of its messages are logged."""
+
+    def __init__(self, payload_logger: PayloadLogger) -> None:
+        self.payload_logger = payload_logger
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        # noinspection PyUnresolvedReferences
+        method = handler_call_details.method
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+        return wrap_rpc_method_handler(
+            handler, lambda behavior: self.wrap_behavior(method, behavior)
+        )
+
+    def wrap_behavior(self, method: str, behavior: Callable) -> Callable:
+        payload_logger = self.payload_logger
+        # '{}' is replaced by the payload, method names cannot contain braces.
+        request_format = method + " request: {}"
+        response_format = method + " response: {}"
+
+        def wrap_request(request_or_iterator: Any) -> Any:
+            if hasattr(request_or_iterator, "__aiter__"):
+                return log_iterator(request_or_iterator, request_format, payload_logger)
+            payload_logger.enqueue(request_format, request_or_iterator)
+            return request_or_iterator
+
+        if inspect.isasyncgenfunction(behavior):
+            async def wrapped_async_gen(request_or_iterator, context):
+                if not payload_logger.is_sampled(method):
+                    async for response in behavior(request_or_iterator, context):
+                        yield response
+                    return
+                async for response in behavior(wrap_request(request_or_iterator), context):
+                    payload_logger.enqueue(response_format, response)
+                    yield response
+
+            return wrapped_async_gen
+
+        async def wrapped(request_or_iterator, context):
+            sampled = payload_logger.is_sampled(method)
+            if sampled:
+                request_or_iterator = wrap_request(request_or_iterator)
+            result = behavior(request_or_iterator, context)
+            if inspect.isawaitable(result):
+                result = await result
+            if sampled and result is not None:
+                payload_logger.enqueue(response_format, result)
+            return result
+
+        return wrapped
+
+
+async def log_iterator(
+    iterator: AsyncIterator[Any], format: str, payload_logger: PayloadLogger
+) -> AsyncIterator[Any]:
+    async for item in iterator:
+        payload_logger.enqueue(format, item)
+        yield item
+
+
+__all__ = ["PayloadLoggingServerInterceptor"]
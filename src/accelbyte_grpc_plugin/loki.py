@@ -0,0 +1,252 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import gzip
+import json
+import queue
+import threading
+import time
+
+from logging import LogRecord
+from logging.handlers import QueueHandler
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+import rfc3339
+
+from logging_loki.emitter import LokiEmitter, LokiEmitterV0, LokiEmitterV1
+from prometheus_client import Counter, Histogram
+
+BasicAuth = Optional[Tuple[str, str]]
+
+
+class LokiQueueHandler(QueueHandler):
+    """Formats records on the logging thread and puts them on a bounded queue
+    without blocking; records that do not fit are dropped and counted."""
+
+    def __init__(self, queue_: "queue.Queue[Any]", shipper: "LokiShipper") -> None:
+        super().__init__(queue_)
+        self.shipper = shipper
+
+    def enqueue(self, record: LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.shipper.on_dropped("queue_full")
+
+
+class LokiShipper:
+    """Ships log records to Loki from a background thread.
+
+    Records are taken from a bounded queue (see 'create_handler') and pushed
+    in batches of up to 'batch_size' records, or of whatever arrived within
+    'batch_interval' seconds, gzip-compressed. A failed push is retried up to
+    'max_retries' times and then dropped, so that an unavailable Loki cannot
+    back up into the service."""
+
+    DEFAULT_QUEUE_SIZE: int = 10000
+    DEFAULT_BATCH_SIZE: int = 500
+    DEFAULT_BATCH_INTERVAL: float = 1.0
+    DEFAULT_TIMEOUT: float = 5.0
+    DEFAULT_MAX_RETRIES: int = 2
+    DEFAULT_RETRY_DELAY: float = 0.5
+
+    RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        url: str,
+        auth: BasicAuth = None,
+        version: str = "1",
+        tags: Optional[Dict[str, Any]] = None,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        compress: bool = True,
+    ) -> None:
+        if queue_size is None:
+            queue_size = self.DEFAULT_QUEUE_SIZE
+
+        if batch_size is None:
+            batch_size = self.DEFAULT_BATCH_SIZE
+
+        if batch_interval is None:
+            batch_interval = self.DEFAULT_BATCH_INTERVAL
+
+        if timeout is None:
+            timeout = self.DEFAULT_TIMEOUT
+
+        if max_retries is None:
+            max_retries = self.DEFAULT_MAX_RETRIES
+
+        if version not in ("0", "1"):
+            raise ValueError("unknown Loki API version: {}".format(version))
+
+        self.url = url
+        self.version = version
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.compress = compress
+
+        # only used for the labels, records are sent by this class.
+        emitter_class = LokiEmitterV1 if version == "1" else LokiEmitterV0
+        self.emitter: LokiEmitter = emitter_class(url=url, tags=tags, auth=auth)
+
+        self.queue: "queue.Queue[Optional[LogRecord]]" = queue.Queue(maxsize=queue_size)
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.thread: Optional[threading.Thread] = None
+        self.stopping = threading.Event()
+
+        self.records_sent = Counter(
+            name="loki_log_records_sent",
+            documentation="number of log records pushed to Loki",
+            unit="count",
+        )
+        self.records_dropped = Counter(
+            name="loki_log_records_dropped",
+            documentation="number of log records not pushed to Loki",
+            labelnames=["reason"],
+            unit="count",
+        )
+        self.push_duration = Histogram(
+            name="loki_push_duration",
+            documentation="time taken to push a batch of log records to Loki",
+            labelnames=["result"],
+            unit="seconds",
+            buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, float("inf")),
+        )
+
+    def create_handler(self) -> LokiQueueHandler:
+        return LokiQueueHandler(self.queue, shipper=self)
+
+    def start(self) -> None:
+        if self.thread is not None:
+            return
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, name="loki-shipper", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Pushes the records still queued and stops the thread."""
+        if self.thread is None:
+            return
+        self.stopping.set()
+        try:
+            # wakes the thread up, the queue being full is fine since it is draining anyway.
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+        self.thread.join(timeout=timeout)
+        self.thread = None
+        self.session.close()
+
+    def on_dropped(self, reason: str, count: int = 1) -> None:
+        self.records_dropped.labels(reason=reason).inc(count)
+
+    def run(self) -> None:
+        while True:
+            batch = self.get_batch()
+            if batch:
+                self.push(batch)
+            elif self.stopping.is_set() and self.queue.empty():
+                return
+
+    def get_batch(self) -> List[LogRecord]:
+        batch: List[LogRecord] = []
+        deadline: Optional[float] = None
+        while len(batch) < self.batch_size:
+            try:
+                if self.stopping.is_set():
+                    # flushing, take what is there without waiting.
+                    record = self.queue.get_nowait()
+                elif deadline is None:
+                    record = self.queue.get()
+                else:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    record = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if record is None:
+                continue
+            batch.append(record)
+            if deadline is None:
+                deadline = time.monotonic() + self.batch_interval
+        return batch
+
+    def push(self, batch: List[LogRecord]) -> None:
+        body = json.dumps(self.build_payload(batch), separators=(",", ":")).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.compress:
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                if self.stopping.is_set():
+                    break
+                time.sleep(self.DEFAULT_RETRY_DELAY * 2 ** (attempt - 1))
+            start = time.perf_counter()
+            try:
+                response = self.session.post(
+                    self.url, data=body, headers=headers, timeout=self.timeout
+                )
+                status = response.status_code
+            except requests.RequestException:
+                status = 0
+            # Loki answers 204.
+            result = "ok" if 200 <= status < 300 else "error"
+            self.push_duration.labels(result=result).observe(time.perf_counter() - start)
+            if result == "ok":
+                self.records_sent.inc(len(batch))
+                return
+            if status and status not in self.RETRYABLE_STATUSES:
+                break
+        self.on_dropped("push_failed", len(batch))
+
+    def build_payload(self, batch: List[LogRecord]) -> Dict[str, Any]:
+        # one stream per distinct set of labels.
+        streams: Dict[Any, Tuple[Any, List[Any]]] = {}
+        for record in batch:
+            # 'QueueHandler.prepare' has already put the formatted line in 'msg'.
+            line = record.getMessage()
+            if self.version == "1":
+                labels: Any = self.emitter.build_tags(record)
+                key: Any = tuple(sorted((k, str(v)) for k, v in labels.items()))
+                entry: Any = [str(int(record.created * 1e9)), line]
+            else:
+                labels = self.emitter.build_labels(record)  # type: ignore[attr-defined]
+                key = labels
+                entry = {"ts": rfc3339.format_microsecond(record.created), "line": line}
+            stream = streams.get(key, None)
+            if stream is None:
+                stream = (labels, [])
+                streams[key] = stream
+            stream[1].append(entry)
+
+        if self.version == "1":
+            return {
+                "streams": [
+                    {"stream": labels, "values": values}
+                    for labels, values in streams.values()
+                ]
+            }
+        return {
+            "streams": [
+                {"labels": labels, "entries": entries}
+                for labels, entries in streams.values()
+            ]
+        }
+
+
+__all__ = [
+    "LokiQueueHandler",
+    "LokiShipper",
+]
@@ -0,0 +1,294 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import collections.abc
+import sys
+import threading
+import time
+import traceback
+
+from logging import Logger
+from typing import Any, Coroutine, Dict, List, Optional, Sequence
+
+from prometheus_client import Counter, Histogram
+
+
+class CoroutineStats:
+    __slots__ = ("steps", "cpu_time", "wall_time", "max_step")
+
+    def __init__(self) -> None:
+        self.steps: int = 0
+        self.cpu_time: float = 0.0
+        self.wall_time: float = 0.0
+        self.max_step: float = 0.0
+
+
+class TimedCoroutine(collections.abc.Coroutine):
+    """Wraps the coroutine of a task to time each of its steps (the time from
+    being resumed to the next suspension), which is the time it holds the
+    loop for."""
+
+    __slots__ = ("coro", "name", "monitor")
+
+    def __init__(self, coro: Coroutine, name: str, monitor: "LoopMonitor") -> None:
+        self.coro = coro
+        self.name = name
+        self.monitor = monitor
+
+    def send(self, value: Any) -> Any:
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            return self.coro.send(value)
+        finally:
+            self.monitor.on_step(self.name, time.perf_counter() - wall, time.thread_time() - cpu)
+
+    def throw(self, typ, val=None, tb=None) -> Any:
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            if val is None and tb is None:
+                return self.coro.throw(typ)
+            return self.coro.throw(typ, val, tb)
+        finally:
+            self.monitor.on_step(self.name, time.perf_counter() - wall, time.thread_time() - cpu)
+
+    def close(self) -> None:
+        self.coro.close()
+
+    def __await__(self):
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        return self.send(None)
+
+    @property
+    def cr_frame(self) -> Any:
+        # used by 'Task.get_stack()'.
+        return getattr(self.coro, "cr_frame", None)
+
+    @property
+    def cr_running(self) -> bool:
+        return getattr(self.coro, "cr_running", False)
+
+    @property
+    def cr_await(self) -> Any:
+        return getattr(self.coro, "cr_await", None)
+
+    def __repr__(self) -> str:
+        return repr(self.coro)
+
+
+class LoopMonitor:
+    """Measures how late the loop runs a callback scheduled every 'interval'
+    seconds (its lag, i.e. for how long something else held it).
+
+    In 'debug' mode, additionally:
+    - a watchdog thread logs the stack of the loop thread whenever the loop
+      has not run the probe for 'slow_callback_threshold' seconds, while the
+      blocking call is still running
+    - the steps of tasks created afterwards are timed (wall and CPU time) per
+      coroutine, steps slower than 'slow_callback_threshold' are logged, and
+      the 'top_n' coroutines with the slowest steps are logged every
+      'report_interval' seconds
+
+    The probe wakes the loop 1/'interval' times a second and is meant to
+    always run; 'debug' costs a few microseconds per task step."""
+
+    DEFAULT_INTERVAL: float = 0.1
+    DEFAULT_SLOW_CALLBACK_THRESHOLD: float = 0.1
+    DEFAULT_TOP_N: int = 10
+    DEFAULT_REPORT_INTERVAL: float = 60.0
+
+    BUCKETS: Sequence[float] = (
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+        float("inf"),
+    )
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        debug: bool = False,
+        slow_callback_threshold: Optional[float] = None,
+        top_n: Optional[int] = None,
+        report_interval: Optional[float] = None,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        if interval is None:
+            interval = self.DEFAULT_INTERVAL
+
+        if slow_callback_threshold is None:
+            slow_callback_threshold = self.DEFAULT_SLOW_CALLBACK_THRESHOLD
+
+        if top_n is None:
+            top_n = self.DEFAULT_TOP_N
+
+        if report_interval is None:
+            report_interval = self.DEFAULT_REPORT_INTERVAL
+
+        self.interval = interval
+        self.debug = debug
+        self.slow_callback_threshold = slow_callback_threshold
+        self.top_n = top_n
+        self.report_interval = report_interval
+        self.logger = logger
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread_id: Optional[int] = None
+        self.tasks: List["asyncio.Task[None]"] = []
+        self.previous_task_factory: Any = None
+        self.heartbeat: float = time.monotonic()
+        self.watchdog: Optional[threading.Thread] = None
+        self.stopping = threading.Event()
+        self.stats: Dict[str, CoroutineStats] = {}
+
+        self.lag = Histogram(
+            name="asyncio_loop_lag",
+            documentation="how late the event loop ran a callback scheduled at a fixed interval",
+            unit="seconds",
+            buckets=self.BUCKETS,
+        )
+        self.blocked = Counter(
+            name="asyncio_loop_blocked",
+            documentation="number of times the event loop was blocked for longer than the slow callback threshold",
+            unit="count",
+        )
+        self.slow_steps = Counter(
+            name="asyncio_slow_task_steps",
+            documentation="number of task steps that held the event loop for longer than the slow callback threshold",
+            labelnames=["coroutine"],
+            unit="count",
+        )
+        self.task_cpu = Counter(
+            name="asyncio_task_cpu",
+            documentation="CPU time spent running task steps",
+            labelnames=["coroutine"],
+            unit="seconds",
+        )
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self.loop = loop
+        self.loop_thread_id = threading.get_ident()
+        self.stopping.clear()
+        self.heartbeat = time.monotonic()
+        self.tasks.append(loop.create_task(self.probe()))
+
+        if self.debug:
+            self.previous_task_factory = loop.get_task_factory()
+            loop.set_task_factory(self.create_task)
+            self.tasks.append(loop.create_task(self.report()))
+            self.watchdog = threading.Thread(
+                target=self.watch, name="loop-monitor-watchdog", daemon=True
+            )
+            self.watchdog.start()
+
+    async def stop(self) -> None:
+        self.stopping.set()
+        if self.loop is not None and self.debug:
+            self.loop.set_task_factory(self.previous_task_factory)
+        for task in self.tasks:
+            task.cancel()
+        self.tasks.clear()
+        if self.watchdog is not None:
+            self.watchdog.join()
+            self.watchdog = None
+
+    async def probe(self) -> None:
+        interval = self.interval
+        while True:
+            expected = time.monotonic() + interval
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            self.heartbeat = now
+            self.lag.observe(lag)
+
+    def watch(self) -> None:
+        # blocked for longer than the threshold once the probe is late by it.
+        threshold = self.interval + self.slow_callback_threshold
+        reported = None
+        while not self.stopping.wait(self.slow_callback_threshold / 2):
+            heartbeat = self.heartbeat
+            blocked_for = time.monotonic() - heartbeat
+            if blocked_for < threshold or heartbeat == reported:
+                continue
+            # once per blocking episode.
+            reported = heartbeat
+            self.blocked.inc()
+            if self.logger:
+                frame = sys._current_frames().get(self.loop_thread_id, None)
+                stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+                self.logger.warning(
+                    "event loop blocked for more than %.3fs, at:\n%s",
+                    blocked_for - self.interval,
+                    stack,
+                )
+
+    def create_task(
+        self, loop: asyncio.AbstractEventLoop, coro: Coroutine, **kwargs: Any
+    ) -> "asyncio.Future[Any]":
+        name = getattr(coro, "__qualname__", None) or type(coro).__name__
+        timed = TimedCoroutine(coro, name=name, monitor=self)
+        if self.previous_task_factory is not None:
+            return self.previous_task_factory(loop, timed, **kwargs)
+        return asyncio.Task(timed, loop=loop, **kwargs)
+
+    def on_step(self, name: str, wall_time: float, cpu_time: float) -> None:
+        stats = self.stats.get(name, None)
+        if stats is None:
+            stats = CoroutineStats()
+            self.stats[name] = stats
+        stats.steps += 1
+        stats.wall_time += wall_time
+        stats.cpu_time += cpu_time
+        if wall_time > stats.max_step:
+            stats.max_step = wall_time
+        self.task_cpu.labels(coroutine=name).inc(cpu_time)
+        if wall_time >= self.slow_callback_threshold:
+            self.slow_steps.labels(coroutine=name).inc()
+            if self.logger:
+                self.logger.warning(
+                    "task step of %s held the event loop for %.3fs (%.3fs CPU)",
+                    name,
+                    wall_time,
+                    cpu_time,
+                )
+
+    async def report(self) -> None:
+        while True:
+            await asyncio.sleep(self.report_interval)
+            stats, self.stats = self.stats, {}
+            if not self.logger or not stats:
+                continue
+            slowest = sorted(stats.items(), key=lambda item: item[1].max_step, reverse=True)
+            lines = [
+                "{:>9.3f}ms {:>9.3f}ms {:>9.3f}s {:>8d}  {}".format(
+                    s.max_step * 1e3,
+                    s.wall_time / s.steps * 1e3,
+                    s.cpu_time,
+                    s.steps,
+                    name,
+                )
+                for name, s in slowest[: self.top_n]
+            ]
+            self.logger.info(
+                "slowest coroutines over the last %gs:\n%11s %11s %10s %8s  %s\n%s",
+                self.report_interval,
+                "max step",
+                "mean step",
+                "cpu",
+                "steps",
+                "coroutine",
+                "\n".join(lines),
+            )
+
+
+__all__ = [
+    "CoroutineStats",
+    "LoopMonitor",
+    "TimedCoroutine",
+]
@@ -0,0 +1,265 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import gzip
+import threading
+import time
+
+from http import HTTPStatus
+from logging import Logger
+from typing import AsyncIterator, Awaitable, Callable, Dict, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from prometheus_client import CollectorRegistry, Histogram, REGISTRY
+from prometheus_client.exposition import choose_encoder
+
+
+class HttpRequest(NamedTuple):
+    method: str
+    path: str
+    query: Dict[str, str]
+    headers: Dict[str, str]
+
+
+class HttpResponse(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    # an iterator is sent as it is produced, with chunked transfer encoding.
+    body: Union[bytes, AsyncIterator[bytes]] = b""
+
+
+HttpRouteHandler = Callable[[HttpRequest], Awaitable[HttpResponse]]
+
+
+class AsyncMetricsServer:
+    """Serves the metrics of 'registry' over HTTP from an asyncio loop.
+
+    Honors 'Accept' (OpenMetrics or the Prometheus text format) and
+    'Accept-Encoding: gzip'. The metrics are collected in the default
+    executor, so a scrape does not hold up the loop while it runs.
+
+    'routes' maps other paths to handlers, e.g. for debugging endpoints; the
+    mapping can still be added to after the server is created."""
+
+    DEFAULT_MAX_REQUEST_SIZE: int = 2**16
+    DEFAULT_READ_TIMEOUT: float = 10.0
+    # responses smaller than this are not worth compressing.
+    GZIP_MIN_SIZE: int = 1024
+
+    def __init__(
+        self,
+        addr: str,
+        port: int,
+        endpoint: str,
+        registry: CollectorRegistry = REGISTRY,
+        logger: Optional[Logger] = None,
+        routes: Optional[Dict[str, HttpRouteHandler]] = None,
+    ) -> None:
+        if routes is None:
+            routes = {}
+
+        self.addr = addr
+        self.port = port
+        self.endpoint = endpoint
+        self.registry = registry
+        self.logger = logger
+        self.routes = routes
+
+        self.server: Optional[asyncio.AbstractServer] = None
+
+        self.scrape_duration = Histogram(
+            name="metrics_scrape_duration",
+            documentation="time spent collecting and encoding the metrics of a scrape",
+            labelnames=["encoding"],
+            unit="seconds",
+            buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, float("inf")),
+        )
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(
+            self.handle_connection,
+            host=self.addr,
+            port=self.port,
+            limit=self.DEFAULT_MAX_REQUEST_SIZE,
+        )
+        if self.logger:
+            self.logger.info(
+                "metrics server is serving %s on %s:%d", self.endpoint, self.addr, self.port
+            )
+
+    async def stop(self) -> None:
+        if self.server is None:
+            return
+        self.server.close()
+        await self.server.wait_closed()
+        self.server = None
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        assert self.server is not None
+        await self.server.serve_forever()
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), self.DEFAULT_READ_TIMEOUT
+                    )
+                except asyncio.LimitOverrunError:
+                    await self.write_response(writer, 431, b"", {})
+                    return
+                method, target, headers = self.parse_request(head)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                url = urlsplit(target)
+                route = self.routes.get(url.path, None)
+
+                if method not in ("GET", "HEAD"):
+                    status, body, response_headers = 405, b"", {"Allow": "GET, HEAD"}
+                elif route is not None:
+                    request = HttpRequest(method, url.path, dict(parse_qsl(url.query)), headers)
+                    response = await self.handle_route(route, request)
+                    if not isinstance(response.body, bytes):
+                        completed = await self.write_streaming_response(
+                            writer, response, send_body=method != "HEAD", keep_alive=keep_alive
+                        )
+                        if not completed or not keep_alive:
+                            return
+                        continue
+                    status, response_headers, body = response.status, response.headers, response.body
+                elif url.path != self.endpoint:
+                    status, body, response_headers = 404, b"", {}
+                else:
+                    body, response_headers = await self.scrape(headers)
+                    status = 200
+
+                await self.write_response(
+                    writer,
+                    status,
+                    b"" if method == "HEAD" else body,
+                    response_headers,
+                    content_length=len(body),
+                    keep_alive=keep_alive,
+                )
+                if not keep_alive:
+                    return
+        except (
+            asyncio.IncompleteReadError,
+            asyncio.TimeoutError,
+            ConnectionError,
+            ValueError,
+        ):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_route(self, route: HttpRouteHandler, request: HttpRequest) -> HttpResponse:
+        try:
+            return await route(request)
+        except Exception as e:
+            if self.logger:
+                self.logger.error("%s failed: %s", request.path, e)
+            return HttpResponse(500, {}, b"")
+
+    async def scrape(self, headers: Dict[str, str]) -> Tuple[bytes, Dict[str, str]]:
+        start = time.perf_counter()
+        encoder, content_type = choose_encoder(headers.get("accept", ""))
+        body = await asyncio.get_running_loop().run_in_executor(
+            None, encoder, self.registry
+        )
+        response_headers = {"Content-Type": content_type}
+        encoding = "identity"
+        if "gzip" in headers.get("accept-encoding", "") and len(body) >= self.GZIP_MIN_SIZE:
+            body = gzip.compress(body, compresslevel=1)
+            response_headers["Content-Encoding"] = encoding = "gzip"
+        self.scrape_duration.labels(encoding=encoding).observe(time.perf_counter() - start)
+        return body, response_headers
+
+    @staticmethod
+    def parse_request(head: bytes) -> Tuple[str, str, Dict[str, str]]:
+        lines = head.decode("latin-1").split("\r\n")
+        method, path, _ = lines[0].split(" ", 2)
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        return method, path, headers
+
+    @staticmethod
+    async def write_response(
+        writer: asyncio.StreamWriter,
+        status: int,
+        body: bytes,
+        headers: Dict[str, str],
+        content_length: Optional[int] = None,
+        keep_alive: bool = False,
+    ) -> None:
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+        lines.extend(f"{k}: {v}" for k, v in headers.items())
+        lines.append(f"Content-Length: {len(body) if content_length is None else content_length}")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def write_streaming_response(
+        self,
+        writer: asyncio.StreamWriter,
+        response: HttpResponse,
+        send_body: bool = True,
+        keep_alive: bool = False,
+    ) -> bool:
+        """Returns False if the body could not be produced in full, in which case
+        the response is cut short (without its last chunk)."""
+        assert not isinstance(response.body, bytes)
+        lines = [f"HTTP/1.1 {response.status} {HTTPStatus(response.status).phrase}"]
+        lines.extend(f"{k}: {v}" for k, v in response.headers.items())
+        lines.append("Transfer-Encoding: chunked")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        chunks = response.body
+        try:
+            if send_body:
+                async for chunk in chunks:
+                    if chunk:
+                        writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                        # only as much as the client reads is produced.
+                        await writer.drain()
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+            return True
+        except ConnectionError:
+            raise
+        except Exception as e:
+            if self.logger:
+                self.logger.error("streaming a response failed: %s", e)
+            return False
+        finally:
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+def start_metrics_server_thread(server: AsyncMetricsServer) -> threading.Thread:
+    """Runs 'server' on its own loop in a daemon thread, for processes that do
+    not run an asyncio loop of their own."""
+    thread = threading.Thread(
+        target=lambda: asyncio.run(server.serve_forever()),
+        name="metrics-server",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+__all__ = [
+    "AsyncMetricsServer",
+    "HttpRequest",
+    "HttpResponse",
+    "HttpRouteHandler",
+    "start_metrics_server_thread",
+]
@@ -0,0 +1,51 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+from typing import Optional, Union
+
+from ..app import App, AppOptionApplyOrderEnum, AppOptionBase
+from ..interceptors.concurrency_limit import (
+    ConcurrencyLimitServerInterceptor,
+    GradientLimit,
+)
+
+
+class AppOptionConcurrencyLimit(AppOptionBase):
+    def __init__(
+        self,
+        initial_limit: Optional[int] = None,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        tolerance: Optional[float] = None,
+        maximum_concurrent_rpcs: Optional[int] = None,
+    ) -> None:
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
+
+        self.interceptor = ConcurrencyLimitServerInterceptor(
+            limit_factory=lambda: GradientLimit(
+                initial_limit=self.initial_limit,
+                min_limit=self.min_limit,
+                max_limit=self.max_limit,
+                tolerance=self.tolerance,
+            )
+        )
+
+    def apply(self, app: App, /, *args, **kwargs) -> None:
+        app.grpc_interceptors.append(self.interceptor)
+        if self.maximum_concurrent_rpcs is not None:
+            # hard cap enforced by gRPC itself, on top of the per-method limits.
+            app.grpc_maximum_concurrent_rpcs = self.maximum_concurrent_rpcs
+
+    def get_order(self) -> Union[int, AppOptionApplyOrderEnum]:
+        # before the other interceptors, so that shed calls skip them.
+        return AppOptionApplyOrderEnum.CREATE_GRPC_SERVER - 2
+
+
+__all__ = [
+    "AppOptionConcurrencyLimit",
+]
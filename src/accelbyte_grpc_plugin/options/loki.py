@@ -2,11 +2,11 @@
 # This is licensed software from AccelByte Inc, for limitations
 # and restrictions contact your company contract manager.
 
+import asyncio
 from typing import Optional
 
-import logging_loki
-
 from ..app import App, AppOptionBase
+from ..loki import LokiShipper
 
 
 class AppOptionLoki(AppOptionBase):
@@ -14,6 +14,11 @@ class AppOptionLoki(AppOptionBase):
     DEFAULT_USERNAME: str = ""
     DEFAULT_PASSWORD: str = ""
     DEFAULT_VERSION: str = "1"
+    DEFAULT_QUEUE_SIZE: int = LokiShipper.DEFAULT_QUEUE_SIZE
+    DEFAULT_BATCH_SIZE: int = LokiShipper.DEFAULT_BATCH_SIZE
+    DEFAULT_BATCH_INTERVAL: float = LokiShipper.DEFAULT_BATCH_INTERVAL
+    DEFAULT_COMPRESS: bool = True
+    DEFAULT_FLUSH_TIMEOUT: float = 5.0
 
     def __init__(
         self,
@@ -21,11 +26,21 @@ class AppOptionLoki(AppOptionBase):
         username: Optional[str] = None,
         password: Optional[str] = None,
         version: Optional[str] = None,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_interval: Optional[float] = None,
+        compress: Optional[bool] = None,
+        flush_timeout: Optional[float] = None,
     ) -> None:
         self.url = url
         self.username = username
         self.password = password
         self.version = version
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.compress = compress
+        self.flush_timeout = flush_timeout
 
     def apply(self, app: App, /, *args, **kwargs) -> None:
         with app.env.prefixed("LOKI_"):
@@ -37,10 +52,45 @@ class AppOptionLoki(AppOptionBase):
                 self.password = app.env.str("PASSWORD", self.DEFAULT_PASSWORD)
             if not self.version:
                 self.version = app.env.str("VERSION", self.DEFAULT_VERSION)
+            if self.queue_size is None:
+                self.queue_size = app.env.int("QUEUE_SIZE", self.DEFAULT_QUEUE_SIZE)
+            if self.batch_size is None:
+                self.batch_size = app.env.int("BATCH_SIZE", self.DEFAULT_BATCH_SIZE)
+            if self.batch_interval is None:
+                self.batch_interval = app.env.float(
+                    "BATCH_INTERVAL", self.DEFAULT_BATCH_INTERVAL
+                )
+            if self.compress is None:
+                self.compress = app.env.bool("COMPRESS", self.DEFAULT_COMPRESS)
+            if self.flush_timeout is None:
+                self.flush_timeout = app.env.float(
+                    "FLUSH_TIMEOUT", self.DEFAULT_FLUSH_TIMEOUT
+                )
         auth = (self.username, self.password) if self.username else None
-        hdlr = logging_loki.LokiHandler(url=self.url, auth=auth, version=self.version)
+
+        # the logger only enqueues, the records are pushed in batches from a thread.
+        shipper = LokiShipper(
+            url=self.url,
+            auth=auth,
+            version=self.version,
+            queue_size=self.queue_size,
+            batch_size=self.batch_size,
+            batch_interval=self.batch_interval,
+            compress=self.compress,
+        )
+        hdlr = shipper.create_handler()
+        shipper.start()
         app.logger.addHandler(hdlr=hdlr)
 
+        async def flush() -> None:
+            app.logger.removeHandler(hdlr=hdlr)
+            await asyncio.get_running_loop().run_in_executor(
+                None, shipper.stop, self.flush_timeout
+            )
+
+        # flushed last, after the other shutdown callbacks have logged.
+        app.shutdown_callbacks.insert(0, flush)
+
 
 __all__ = [
     "AppOptionLoki",
@@ -0,0 +1,64 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+from typing import Optional
+
+from ..app import App, AppOptionBase
+from ..loop_monitor import LoopMonitor
+
+
+class AppOptionLoopMonitor(AppOptionBase):
+    DEFAULT_INTERVAL: float = LoopMonitor.DEFAULT_INTERVAL
+    DEFAULT_DEBUG: bool = False
+    DEFAULT_SLOW_CALLBACK_THRESHOLD: float = LoopMonitor.DEFAULT_SLOW_CALLBACK_THRESHOLD
+    DEFAULT_TOP_N: int = LoopMonitor.DEFAULT_TOP_N
+    DEFAULT_REPORT_INTERVAL: float = LoopMonitor.DEFAULT_REPORT_INTERVAL
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        debug: Optional[bool] = None,
+        slow_callback_threshold: Optional[float] = None,
+        top_n: Optional[int] = None,
+        report_interval: Optional[float] = None,
+    ) -> None:
+        self.interval = interval
+        self.debug = debug
+        self.slow_callback_threshold = slow_callback_threshold
+        self.top_n = top_n
+        self.report_interval = report_interval
+
+    def apply(self, app: App, /, *args, **kwargs) -> None:
+        with app.env.prefixed("LOOP_MONITOR_"):
+            if self.interval is None:
+                self.interval = app.env.float("INTERVAL", self.DEFAULT_INTERVAL)
+            if self.debug is None:
+                self.debug = app.env.bool("DEBUG", self.DEFAULT_DEBUG)
+            if self.slow_callback_threshold is None:
+                self.slow_callback_threshold = app.env.float(
+                    "SLOW_CALLBACK_THRESHOLD", self.DEFAULT_SLOW_CALLBACK_THRESHOLD
+                )
+            if self.top_n is None:
+                self.top_n = app.env.int("TOP_N", self.DEFAULT_TOP_N)
+            if self.report_interval is None:
+                self.report_interval = app.env.float(
+                    "REPORT_INTERVAL", self.DEFAULT_REPORT_INTERVAL
+                )
+
+        monitor = LoopMonitor(
+            interval=self.interval,
+            debug=self.debug,
+            slow_callback_threshold=self.slow_callback_threshold,
+            top_n=self.top_n,
+            report_interval=self.report_interval,
+            logger=app.logger,
+        )
+        # started on the app's loop before the gRPC server, so that its tasks are timed in debug mode.
+        app.add_startup_callback(monitor.start)
+        app.add_shutdown_callback(monitor.stop)
+
+
+__all__ = [
+    "AppOptionLoopMonitor",
+]
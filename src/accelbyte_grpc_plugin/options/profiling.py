@@ -0,0 +1,53 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+from typing import Optional
+
+from ..app import App, AppOptionBase
+from ..profiling import Profiler
+
+
+class AppOptionProfiling(AppOptionBase):
+    """Serves the profiling endpoints of 'Profiler' on the metrics port, so
+    only where the app serves its metrics itself (workers only do on
+    PROMETHEUS_WORKER_BASE_PORT + index, when it is set)."""
+
+    DEFAULT_TOKEN: str = ""
+    DEFAULT_PREFIX: str = Profiler.DEFAULT_PREFIX
+    DEFAULT_MAX_SECONDS: float = Profiler.DEFAULT_MAX_SECONDS
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        prefix: Optional[str] = None,
+        max_seconds: Optional[float] = None,
+    ) -> None:
+        self.token = token
+        self.prefix = prefix
+        self.max_seconds = max_seconds
+
+    def apply(self, app: App, /, *args, **kwargs) -> None:
+        with app.env.prefixed("PROFILING_"):
+            if not self.token:
+                self.token = app.env.str("TOKEN", self.DEFAULT_TOKEN)
+            if not self.prefix:
+                self.prefix = app.env.str("PREFIX", self.DEFAULT_PREFIX)
+            if self.max_seconds is None:
+                self.max_seconds = app.env.float("MAX_SECONDS", self.DEFAULT_MAX_SECONDS)
+        if not self.token:
+            app.logger.warning("profiling is not served, PROFILING_TOKEN is not set")
+            return
+
+        profiler = Profiler(token=self.token, max_seconds=self.max_seconds, logger=app.logger)
+        app.http_routes.update(profiler.get_routes(prefix=self.prefix))
+
+        async def remove_snapshot() -> None:
+            profiler.remove_snapshot()
+
+        app.add_shutdown_callback(remove_snapshot)
+
+
+__all__ = [
+    "AppOptionProfiling",
+]
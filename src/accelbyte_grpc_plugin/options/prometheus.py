@@ -5,30 +5,47 @@
 import threading
 from typing import Optional, Union
 
-from flask import Flask
+from environs import Env
 from opentelemetry.exporter.prometheus import PrometheusMetricReader
-from prometheus_client import make_wsgi_app
-from werkzeug.middleware.dispatcher import DispatcherMiddleware
+from prometheus_client import CollectorRegistry, REGISTRY
 
 from ..app import App, AppOptionApplyOrderEnum, AppOptionBase
+from ..metrics_server import AsyncMetricsServer, start_metrics_server_thread
 
 
 class AppOptionPrometheus(AppOptionBase):
+    """Serves the metrics, and 'app.http_routes', over HTTP.
+
+    When running as worker 'worker' of several, the parent process serves the
+    aggregated prometheus_client metrics, which miss the OpenTelemetry metrics
+    and the HTTP routes of the workers. Each worker serves those itself on port
+    PROMETHEUS_WORKER_BASE_PORT + 'worker', only if it is set (it also serves
+    the worker's own prometheus_client metrics there, already in the aggregate)."""
+
     DEFAULT_ADDR: str = "0.0.0.0"
     DEFAULT_PORT: int = 8080
     DEFAULT_ENDPOINT: str = "/metrics"
+    # 0 does not serve the workers.
+    DEFAULT_WORKER_BASE_PORT: int = 0
 
     def __init__(
         self,
         addr: Optional[str] = None,
         port: Optional[int] = None,
         endpoint: Optional[str] = None,
+        serve: bool = True,
+        worker: Optional[int] = None,
     ) -> None:
         self.addr = addr
         self.port = port
         self.endpoint = endpoint
+        self.serve = serve
+        self.worker = worker
 
     def apply(self, app: App, /, *args, **kwargs) -> None:
+        if self.port is None and self.worker is not None:
+            self.port = get_worker_port(app.env, self.worker)
+            self.serve = self.serve and self.port is not None
         with app.env.prefixed("PROMETHEUS_"):
             if not self.addr:
                 self.addr = app.env.str("ADDR", self.DEFAULT_ADDR)
@@ -37,25 +54,63 @@ class AppOptionPrometheus(AppOptionBase):
             if not self.endpoint:
                 self.endpoint = app.env.str("ENDPOINT", self.DEFAULT_ENDPOINT)
             prefix = app.env.str("PREFIX", app.name)
-            mounts = {self.endpoint: make_wsgi_app()}
-            flask_app = Flask(import_name=app.name)
-            flask_app.wsgi_app = DispatcherMiddleware(
-                app=flask_app.wsgi_app, mounts=mounts
-            )
-            threading.Thread(
-                target=lambda: flask_app.run(
-                    host=self.addr,
+            if self.serve:
+                # served from the app's loop, started and stopped with it.
+                server = AsyncMetricsServer(
+                    addr=self.addr,
                     port=self.port,
-                    debug=True,
-                    use_reloader=False,
+                    endpoint=self.endpoint,
+                    logger=app.logger,
+                    routes=app.http_routes,
                 )
-            ).start()
+                app.add_startup_callback(server.start)
+                app.add_shutdown_callback(server.stop)
             app.otel_metric_readers.append(PrometheusMetricReader(prefix=prefix))
 
     def get_order(self) -> Union[int, AppOptionApplyOrderEnum]:
         return AppOptionApplyOrderEnum.SET_OTEL_METER_PROVIDER - 1
 
 
+def get_worker_port(env: Env, worker: int) -> Optional[int]:
+    """Returns the port worker 'worker' serves its metrics and HTTP routes on,
+    None if PROMETHEUS_WORKER_BASE_PORT is not set."""
+    with env.prefixed("PROMETHEUS_"):
+        base_port = env.int("WORKER_BASE_PORT", AppOptionPrometheus.DEFAULT_WORKER_BASE_PORT)
+    return base_port + worker if base_port else None
+
+
+def start_metrics_server(
+    addr: str,
+    port: int,
+    endpoint: str,
+    registry: CollectorRegistry = REGISTRY,
+) -> threading.Thread:
+    return start_metrics_server_thread(
+        AsyncMetricsServer(addr=addr, port=port, endpoint=endpoint, registry=registry)
+    )
+
+
+def start_multiprocess_metrics_server(
+    addr: str,
+    port: int,
+    endpoint: str,
+) -> threading.Thread:
+    # noinspection PyUnresolvedReferences
+    from prometheus_client import multiprocess
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return start_metrics_server(
+        addr=addr,
+        port=port,
+        endpoint=endpoint,
+        registry=registry,
+    )
+
+
 __all__ = [
     "AppOptionPrometheus",
+    "get_worker_port",
+    "start_metrics_server",
+    "start_multiprocess_metrics_server",
 ]
@@ -2,28 +2,138 @@
 # This is licensed software from AccelByte Inc, for limitations
 # and restrictions contact your company contract manager.
 
-from typing import Union
+from typing import Dict, Optional, Union
 
-import opentelemetry.trace
 from opentelemetry.exporter.zipkin.proto.http import ZipkinExporter
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace import SpanProcessor
 
 from ..app import App, AppOptionApplyOrderEnum, AppOptionBase
+from ..tracing import (
+    CountingBatchSpanProcessor,
+    MethodRatioSampler,
+    SpansDroppedCounter,
+    TailSamplingSpanProcessor,
+)
 
 
 class AppOptionZipkin(AppOptionBase):
     DEFAULT_ENDPOINT: str = "http://localhost:9411/api/v2/spans"
 
+    DEFAULT_SAMPLING_RATIO: float = 1.0
+    # health checks are frequent and uninteresting.
+    DEFAULT_METHOD_SAMPLING_RATIOS: Dict[str, float] = {
+        "/grpc.health.v1.Health/*": 0.0,
+    }
+    DEFAULT_TAIL_SAMPLING_ENABLED: bool = True
+    DEFAULT_TAIL_SAMPLING_LATENCY_THRESHOLD: float = TailSamplingSpanProcessor.DEFAULT_LATENCY_THRESHOLD
+    DEFAULT_TAIL_SAMPLING_MAX_TRACES: int = TailSamplingSpanProcessor.DEFAULT_MAX_TRACES
+
+    # same defaults (and env names) as BatchSpanProcessor's.
+    DEFAULT_BSP_MAX_QUEUE_SIZE: int = 2048
+    DEFAULT_BSP_SCHEDULE_DELAY: int = 5000
+    DEFAULT_BSP_MAX_EXPORT_BATCH_SIZE: int = 512
+    DEFAULT_BSP_EXPORT_TIMEOUT: int = 30000
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        sampling_ratio: Optional[float] = None,
+        method_sampling_ratios: Optional[Dict[str, float]] = None,
+        tail_sampling_enabled: Optional[bool] = None,
+        tail_sampling_latency_threshold: Optional[float] = None,
+        tail_sampling_max_traces: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        schedule_delay_millis: Optional[int] = None,
+        max_export_batch_size: Optional[int] = None,
+        export_timeout_millis: Optional[int] = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.sampling_ratio = sampling_ratio
+        self.method_sampling_ratios = method_sampling_ratios
+        self.tail_sampling_enabled = tail_sampling_enabled
+        self.tail_sampling_latency_threshold = tail_sampling_latency_threshold
+        self.tail_sampling_max_traces = tail_sampling_max_traces
+        self.max_queue_size = max_queue_size
+        self.schedule_delay_millis = schedule_delay_millis
+        self.max_export_batch_size = max_export_batch_size
+        self.export_timeout_millis = export_timeout_millis
+
     def apply(self, app: App, /, *args, **kwargs) -> None:
         with app.env.prefixed("OTEL_EXPORTER_ZIPKIN_"):
-            endpoint = app.env.str("ENDPOINT", self.DEFAULT_ENDPOINT)
-            span_exporter = ZipkinExporter(endpoint=endpoint)
-            span_processor = BatchSpanProcessor(span_exporter=span_exporter)
-            tracer_provider = opentelemetry.trace.get_tracer_provider()
-            tracer_provider.add_span_processor(span_processor=span_processor)
+            if not self.endpoint:
+                self.endpoint = app.env.str("ENDPOINT", self.DEFAULT_ENDPOINT)
+
+        with app.env.prefixed("OTEL_TRACES_SAMPLING_"):
+            if self.sampling_ratio is None:
+                self.sampling_ratio = app.env.float("RATIO", self.DEFAULT_SAMPLING_RATIO)
+            if self.method_sampling_ratios is None:
+                # e.g. "/service.Service/GetGuildProgress=0.1,/grpc.health.v1.Health/*=0".
+                self.method_sampling_ratios = app.env.dict(
+                    "METHOD_RATIOS", self.DEFAULT_METHOD_SAMPLING_RATIOS, subcast_values=float
+                )
+            if self.tail_sampling_enabled is None:
+                self.tail_sampling_enabled = app.env.bool(
+                    "TAIL_ENABLED", self.DEFAULT_TAIL_SAMPLING_ENABLED
+                )
+            if self.tail_sampling_latency_threshold is None:
+                self.tail_sampling_latency_threshold = app.env.float(
+                    "TAIL_LATENCY_THRESHOLD", self.DEFAULT_TAIL_SAMPLING_LATENCY_THRESHOLD
+                )
+            if self.tail_sampling_max_traces is None:
+                self.tail_sampling_max_traces = app.env.int(
+                    "TAIL_MAX_TRACES", self.DEFAULT_TAIL_SAMPLING_MAX_TRACES
+                )
+
+        with app.env.prefixed("OTEL_BSP_"):
+            if self.max_queue_size is None:
+                self.max_queue_size = app.env.int(
+                    "MAX_QUEUE_SIZE", self.DEFAULT_BSP_MAX_QUEUE_SIZE
+                )
+            if self.schedule_delay_millis is None:
+                self.schedule_delay_millis = app.env.int(
+                    "SCHEDULE_DELAY", self.DEFAULT_BSP_SCHEDULE_DELAY
+                )
+            if self.max_export_batch_size is None:
+                self.max_export_batch_size = app.env.int(
+                    "MAX_EXPORT_BATCH_SIZE", self.DEFAULT_BSP_MAX_EXPORT_BATCH_SIZE
+                )
+            if self.export_timeout_millis is None:
+                self.export_timeout_millis = app.env.int(
+                    "EXPORT_TIMEOUT", self.DEFAULT_BSP_EXPORT_TIMEOUT
+                )
+
+        # with a ratio of 1 every span is sampled up front, there is nothing left for the tail.
+        tail_sampling_enabled = self.tail_sampling_enabled and self.sampling_ratio < 1.0
+
+        app.otel_sampler = MethodRatioSampler(
+            ratio=self.sampling_ratio,
+            method_ratios=self.method_sampling_ratios,
+            record_unsampled=tail_sampling_enabled,
+        )
+
+        spans_dropped = SpansDroppedCounter()
+        span_exporter = ZipkinExporter(endpoint=self.endpoint)
+        span_processor: SpanProcessor = CountingBatchSpanProcessor(
+            span_exporter=span_exporter,
+            spans_dropped=spans_dropped,
+            max_queue_size=self.max_queue_size,
+            schedule_delay_millis=self.schedule_delay_millis,
+            max_export_batch_size=self.max_export_batch_size,
+            export_timeout_millis=self.export_timeout_millis,
+        )
+        if tail_sampling_enabled:
+            # keeps the unsampled traces that were slow or failed.
+            span_processor = TailSamplingSpanProcessor(
+                span_processor=span_processor,
+                latency_threshold=self.tail_sampling_latency_threshold,
+                max_traces=self.tail_sampling_max_traces,
+                spans_dropped=spans_dropped,
+            )
+        app.otel_span_processors.append(span_processor)
 
     def get_order(self) -> Union[int, AppOptionApplyOrderEnum]:
-        return AppOptionApplyOrderEnum.SET_OTEL_TRACER_PROVIDER + 1
+        # the sampler is set when the tracer provider is created.
+        return AppOptionApplyOrderEnum.SET_OTEL_TRACER_PROVIDER - 1
 
 
 __all__ = [
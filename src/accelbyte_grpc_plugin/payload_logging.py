@@ -0,0 +1,247 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import base64
+import json
+import logging
+import queue
+import random
+import threading
+
+from logging import Logger
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
+from prometheus_client import Counter
+
+REDACTED: str = "[REDACTED]"
+
+# field types whose Python values are already JSON-serializable.
+PLAIN_TYPES: FrozenSet[int] = frozenset(
+    {
+        FieldDescriptor.TYPE_BOOL,
+        FieldDescriptor.TYPE_DOUBLE,
+        FieldDescriptor.TYPE_FIXED32,
+        FieldDescriptor.TYPE_FIXED64,
+        FieldDescriptor.TYPE_FLOAT,
+        FieldDescriptor.TYPE_INT32,
+        FieldDescriptor.TYPE_INT64,
+        FieldDescriptor.TYPE_SFIXED32,
+        FieldDescriptor.TYPE_SFIXED64,
+        FieldDescriptor.TYPE_SINT32,
+        FieldDescriptor.TYPE_SINT64,
+        FieldDescriptor.TYPE_STRING,
+        FieldDescriptor.TYPE_UINT32,
+        FieldDescriptor.TYPE_UINT64,
+    }
+)
+
+
+def message_to_dict(
+    message: Message, redact_fields: FrozenSet[str] = frozenset()
+) -> Dict[str, Any]:
+    """Converts 'message' to a dict of its set fields, keyed by their proto
+    names, replacing the values of 'redact_fields' (at any depth).
+
+    Much cheaper than 'MessageToJson' since it only visits the fields that are
+    set and does no JSON name mapping; 64-bit integers stay integers."""
+    result: Dict[str, Any] = {}
+    for field, value in message.ListFields():
+        name = field.name
+        if name in redact_fields:
+            result[name] = REDACTED
+            continue
+        if field.message_type is not None and field.message_type.GetOptions().map_entry:
+            value_field = field.message_type.fields_by_name["value"]
+            if value_field.type in PLAIN_TYPES:
+                result[name] = dict(value)
+            else:
+                result[name] = {
+                    k: convert_value(value_field, v, redact_fields)
+                    for k, v in value.items()
+                }
+        elif is_repeated(field):
+            if field.type in PLAIN_TYPES:
+                result[name] = list(value)
+            else:
+                result[name] = [convert_value(field, v, redact_fields) for v in value]
+        else:
+            result[name] = convert_value(field, value, redact_fields)
+    return result
+
+
+def is_repeated(field: FieldDescriptor) -> bool:
+    # newer protobuf versions replaced 'label' with 'is_repeated'.
+    repeated = getattr(field, "is_repeated", None)
+    if repeated is not None:
+        return repeated
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def convert_value(field: FieldDescriptor, value: Any, redact_fields: FrozenSet[str]) -> Any:
+    field_type = field.type
+    if field_type == FieldDescriptor.TYPE_MESSAGE or field_type == FieldDescriptor.TYPE_GROUP:
+        if field.message_type.full_name.startswith("google.protobuf."):
+            # well-known types have their own JSON representation.
+            return MessageToDict(value, preserving_proto_field_name=True)
+        return message_to_dict(value, redact_fields)
+    if field_type == FieldDescriptor.TYPE_ENUM:
+        enum_value = field.enum_type.values_by_number.get(value, None)
+        return enum_value.name if enum_value is not None else value
+    if field_type == FieldDescriptor.TYPE_BYTES:
+        return base64.b64encode(value).decode("ascii")
+    return value
+
+
+class LazyPayload:
+    """Formats a payload only when the log record it is an argument of is
+    emitted (i.e. by the handlers), and at most once."""
+
+    __slots__ = ("format", "payload", "redact_fields", "text")
+
+    def __init__(
+        self, format: str, payload: Any, redact_fields: FrozenSet[str]
+    ) -> None:
+        self.format = format
+        self.payload = payload
+        self.redact_fields = redact_fields
+        self.text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self.text is None:
+            payload = self.payload
+            if isinstance(payload, Message):
+                payload = message_to_dict(payload, self.redact_fields)
+            payload_json = json.dumps(payload, separators=(",", ":"), default=str)
+            self.text = self.format.format(payload_json)
+        return self.text
+
+
+class PayloadLogger:
+    """Logs sampled gRPC payloads without serializing them on the event loop.
+
+    'log' only decides whether the payload is sampled and takes a snapshot of
+    it; the record is logged from a background thread, and the payload is
+    converted to JSON there, by the handlers, if the record is emitted at
+    all. Payloads that do not fit in the queue are dropped and counted.
+
+    Sample rates are looked up by full method name ('/package.Service/Method'),
+    then by service ('/package.Service/*'), then 'sample_rate' applies."""
+
+    DEFAULT_LEVEL: int = logging.INFO
+    DEFAULT_SAMPLE_RATE: float = 1.0
+    DEFAULT_MAX_QUEUE_SIZE: int = 1000
+
+    def __init__(
+        self,
+        logger: Logger,
+        level: Optional[int] = None,
+        sample_rate: Optional[float] = None,
+        method_sample_rates: Optional[Dict[str, float]] = None,
+        redact_fields: Optional[Iterable[str]] = None,
+        max_queue_size: Optional[int] = None,
+    ) -> None:
+        if level is None:
+            level = self.DEFAULT_LEVEL
+
+        if sample_rate is None:
+            sample_rate = self.DEFAULT_SAMPLE_RATE
+
+        if max_queue_size is None:
+            max_queue_size = self.DEFAULT_MAX_QUEUE_SIZE
+
+        self.logger = logger
+        self.level = level
+        self.sample_rate = sample_rate
+        self.method_sample_rates = dict(method_sample_rates or {})
+        self.redact_fields = frozenset(redact_fields or ())
+
+        self.queue: "queue.Queue[Optional[Tuple[str, Any]]]" = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+        self.sample_rates: Dict[Optional[str], float] = {}
+
+        self.payloads_dropped = Counter(
+            name="payload_log_records_dropped",
+            documentation="number of sampled payloads not logged because the queue was full",
+            unit="count",
+        )
+
+    def get_sample_rate(self, method: Optional[str]) -> float:
+        sample_rate = self.sample_rates.get(method, None)
+        if sample_rate is None:
+            sample_rate = self.sample_rate
+            if method is not None:
+                service = method.rsplit("/", 1)[0] + "/*"
+                sample_rate = self.method_sample_rates.get(
+                    method, self.method_sample_rates.get(service, sample_rate)
+                )
+            self.sample_rates[method] = sample_rate
+        return sample_rate
+
+    def is_sampled(self, method: Optional[str] = None) -> bool:
+        if not self.logger.isEnabledFor(self.level):
+            return False
+        sample_rate = self.get_sample_rate(method)
+        return sample_rate >= 1.0 or (sample_rate > 0.0 and random.random() < sample_rate)
+
+    # noinspection PyShadowingBuiltins
+    def log(self, format: str, payload: Any, method: Optional[str] = None) -> None:
+        """Logs 'format' with '{}' replaced by the JSON of 'payload', if sampled."""
+        if self.is_sampled(method):
+            self.enqueue(format, payload)
+
+    # noinspection PyShadowingBuiltins
+    def enqueue(self, format: str, payload: Any) -> None:
+        """Logs 'payload' regardless of sampling, e.g. for the rest of a call
+        that was sampled."""
+        if isinstance(payload, Message):
+            # the message may still be changed by the caller once this returns.
+            snapshot = payload.__class__()
+            snapshot.CopyFrom(payload)
+            payload = snapshot
+        self.start()
+        try:
+            self.queue.put_nowait((format, payload))
+        except queue.Full:
+            self.payloads_dropped.inc()
+
+    def start(self) -> None:
+        if self.thread is not None:
+            return
+        with self.lock:
+            if self.thread is None:
+                thread = threading.Thread(target=self.run, name="payload-logger", daemon=True)
+                thread.start()
+                self.thread = thread
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Logs the payloads still queued and stops the thread."""
+        if self.thread is None:
+            return
+        self.queue.put(None)
+        self.thread.join(timeout=timeout)
+        self.thread = None
+
+    def run(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            format, payload = item
+            # errors while formatting are reported by the handlers ('Handler.handleError').
+            self.logger.log(
+                self.level, "%s", LazyPayload(format, payload, self.redact_fields)
+            )
+
+
+__all__ = [
+    "LazyPayload",
+    "PayloadLogger",
+    "message_to_dict",
+]
@@ -0,0 +1,368 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import hmac
+import io
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from logging import Logger
+from types import CodeType, FrameType
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from .metrics_server import HttpRequest, HttpResponse, HttpRouteHandler
+
+TEXT_PLAIN: Dict[str, str] = {"Content-Type": "text/plain; charset=utf-8"}
+
+
+class StackSampler:
+    """Samples the stacks of the threads 'hz' times a second and counts them
+    in the collapsed-stack format ('frame;frame;frame count'), which
+    flamegraph.pl, speedscope and others read.
+
+    'run' samples from a thread of its own. Since it can only do so when it
+    gets the GIL, the loop thread is mostly seen where it releases it (e.g.
+    waiting for I/O), which suits wall-clock profiles. 'run_on_timer' samples
+    from a CPU timer signal instead, handled by the main thread in between
+    bytecodes, which sees the loop where it spends its CPU time.
+
+    In 'cpu' mode, a thread is only counted if it used CPU since the previous
+    sample (where per-thread CPU clocks are available), so that idle threads
+    and a loop waiting for I/O do not show up. Memory is bounded by the
+    number of distinct stacks, at most 'max_stacks'."""
+
+    DEFAULT_MAX_STACKS: int = 20000
+
+    def __init__(self, hz: int, cpu: bool = True, max_stacks: Optional[int] = None) -> None:
+        if max_stacks is None:
+            max_stacks = self.DEFAULT_MAX_STACKS
+
+        self.interval = 1.0 / hz
+        self.cpu = cpu and hasattr(time, "pthread_getcpuclockid")
+        self.max_stacks = max_stacks
+
+        self.counts: Dict[str, int] = {}
+        self.samples: int = 0
+        self.frame_names: Dict[CodeType, str] = {}
+        self.cpu_times: Dict[int, float] = {}
+
+    def run(self, seconds: float) -> None:
+        own_thread_id = threading.get_ident()
+        deadline = time.monotonic() + seconds
+        next_sample = time.monotonic()
+        while True:
+            next_sample += self.interval
+            now = time.monotonic()
+            if now >= deadline:
+                return
+            if next_sample > now:
+                time.sleep(next_sample - now)
+            else:
+                # running behind, skip the missed samples rather than bursting.
+                next_sample = now
+            self.sample(own_thread_id)
+
+    async def run_on_timer(self, seconds: float) -> None:
+        """Must be awaited on the main thread (which handles signals)."""
+        main_thread_id = threading.get_ident()
+
+        def on_signal(signum: int, frame: Optional[FrameType]) -> None:
+            self.sample(main_thread_id, main_frame=frame)
+
+        previous_handler = signal.signal(signal.SIGPROF, on_signal)
+        try:
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+            await asyncio.sleep(seconds)
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, previous_handler)
+
+    def sample(self, own_thread_id: int, main_frame: Optional[FrameType] = None) -> None:
+        """Samples the other threads, and the thread this runs on from 'main_frame'
+        if given."""
+        self.samples += 1
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        frames = sys._current_frames()
+        if main_frame is not None:
+            frames[own_thread_id] = main_frame
+        else:
+            frames.pop(own_thread_id, None)
+        for thread_id, frame in frames.items():
+            if not self.is_running(thread_id):
+                continue
+            stack = self.get_stack(frame, thread_names.get(thread_id, str(thread_id)))
+            count = self.counts.get(stack, None)
+            if count is None and len(self.counts) >= self.max_stacks:
+                stack, count = "[truncated]", self.counts.get("[truncated]", 0)
+            self.counts[stack] = (count or 0) + 1
+
+    def is_running(self, thread_id: int) -> bool:
+        if not self.cpu:
+            return True
+        try:
+            cpu_time = time.clock_gettime(time.pthread_getcpuclockid(thread_id))
+        except (OSError, OverflowError):
+            return True
+        previous = self.cpu_times.get(thread_id, None)
+        self.cpu_times[thread_id] = cpu_time
+        return previous is not None and cpu_time > previous
+
+    def get_stack(self, frame: Optional[FrameType], thread_name: str) -> str:
+        names: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            name = self.frame_names.get(code, None)
+            if name is None:
+                name = "{} ({}:{})".format(
+                    getattr(code, "co_qualname", code.co_name),
+                    os.path.basename(code.co_filename),
+                    code.co_firstlineno,
+                )
+                # ';' separates frames and ' ' the count.
+                name = name.replace(";", ":")
+                self.frame_names[code] = name
+            names.append(name)
+            frame = frame.f_back
+        names.append(thread_name.replace(";", ":").replace(" ", "_"))
+        return ";".join(reversed(names))
+
+    def get_collapsed_lines(self) -> Iterable[str]:
+        for stack, count in sorted(self.counts.items(), key=lambda item: -item[1]):
+            yield "{} {}\n".format(stack, count)
+
+
+class Profiler:
+    """Profiling endpoints for the running process, for the metrics HTTP
+    server (see 'get_routes'). Every request must carry the bearer 'token'.
+
+    - '{prefix}/profile?seconds=10&hz=100&mode=cpu|wall': samples the thread
+      stacks for 'seconds' and returns them in the collapsed-stack format
+    - '{prefix}/tracemalloc/start?frames=1' and '{prefix}/tracemalloc/stop'
+    - '{prefix}/tracemalloc/snapshot?limit=25&key_type=lineno&diff=1': the
+      top allocation sites, or their growth since the previous snapshot.
+      The previous snapshot is kept on disk rather than in memory.
+    - '{prefix}/tasks?limit=10': the asyncio tasks of the loop and their stacks
+
+    Responses are streamed, and only one profile is taken at a time."""
+
+    DEFAULT_PREFIX: str = "/debug"
+    DEFAULT_MAX_SECONDS: float = 60.0
+    DEFAULT_SECONDS: float = 10.0
+    DEFAULT_HZ: int = 100
+    MAX_HZ: int = 1000
+    DEFAULT_SNAPSHOT_LIMIT: int = 25
+    CHUNK_SIZE: int = 2**16
+
+    def __init__(
+        self,
+        token: str,
+        max_seconds: Optional[float] = None,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        if not token:
+            raise ValueError("a token is required")
+
+        if max_seconds is None:
+            max_seconds = self.DEFAULT_MAX_SECONDS
+
+        self.token = token.encode("utf-8")
+        self.max_seconds = max_seconds
+        self.logger = logger
+
+        self.busy = False
+        self.snapshot_path: Optional[str] = None
+
+    def get_routes(self, prefix: Optional[str] = None) -> Dict[str, HttpRouteHandler]:
+        if prefix is None:
+            prefix = self.DEFAULT_PREFIX
+        return {
+            prefix + "/profile": self.protected(self.profile),
+            prefix + "/tracemalloc/start": self.protected(self.tracemalloc_start),
+            prefix + "/tracemalloc/stop": self.protected(self.tracemalloc_stop),
+            prefix + "/tracemalloc/snapshot": self.protected(self.tracemalloc_snapshot),
+            prefix + "/tasks": self.protected(self.tasks),
+        }
+
+    def protected(self, handler: HttpRouteHandler) -> HttpRouteHandler:
+        async def wrapped(request: HttpRequest) -> HttpResponse:
+            scheme, _, token = request.headers.get("authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not hmac.compare_digest(
+                token.strip().encode("utf-8"), self.token
+            ):
+                return HttpResponse(401, {"WWW-Authenticate": "Bearer"}, b"")
+            if self.logger:
+                self.logger.info("profiling request: %s %s", request.path, request.query)
+            return await handler(request)
+
+        return wrapped
+
+    async def profile(self, request: HttpRequest) -> HttpResponse:
+        try:
+            seconds = float(request.query.get("seconds", self.DEFAULT_SECONDS))
+            hz = int(request.query.get("hz", self.DEFAULT_HZ))
+        except ValueError:
+            return text_response(400, "'seconds' and 'hz' must be numbers\n")
+        mode = request.query.get("mode", "cpu")
+        if not 0 < seconds <= self.max_seconds or not 0 < hz <= self.MAX_HZ or mode not in ("cpu", "wall"):
+            return text_response(
+                400,
+                "expected 0 < seconds <= {}, 0 < hz <= {}, mode 'cpu' or 'wall'\n".format(
+                    self.max_seconds, self.MAX_HZ
+                ),
+            )
+        if self.busy:
+            return text_response(409, "a profile is already being taken\n")
+
+        self.busy = True
+        try:
+            sampler = StackSampler(hz=hz, cpu=mode == "cpu")
+            if (
+                mode == "cpu"
+                and hasattr(signal, "setitimer")
+                and threading.current_thread() is threading.main_thread()
+            ):
+                await sampler.run_on_timer(seconds)
+            else:
+                # the sampler runs on its own thread, the loop keeps serving meanwhile.
+                thread = threading.Thread(target=sampler.run, args=(seconds,), name="profiler")
+                thread.start()
+                await asyncio.get_running_loop().run_in_executor(None, thread.join)
+        finally:
+            self.busy = False
+
+        return HttpResponse(200, TEXT_PLAIN, self.chunked(sampler.get_collapsed_lines()))
+
+    async def tracemalloc_start(self, request: HttpRequest) -> HttpResponse:
+        try:
+            frames = int(request.query.get("frames", 1))
+        except ValueError:
+            return text_response(400, "'frames' must be a number\n")
+        if tracemalloc.is_tracing():
+            return text_response(409, "tracemalloc is already tracing\n")
+        tracemalloc.start(frames)
+        return text_response(200, "tracemalloc started ({} frames)\n".format(frames))
+
+    async def tracemalloc_stop(self, request: HttpRequest) -> HttpResponse:
+        tracemalloc.stop()
+        self.remove_snapshot()
+        return text_response(200, "tracemalloc stopped\n")
+
+    async def tracemalloc_snapshot(self, request: HttpRequest) -> HttpResponse:
+        if not tracemalloc.is_tracing():
+            return text_response(409, "tracemalloc is not tracing, start it first\n")
+        try:
+            limit = int(request.query.get("limit", self.DEFAULT_SNAPSHOT_LIMIT))
+        except ValueError:
+            return text_response(400, "'limit' must be a number\n")
+        key_type = request.query.get("key_type", "lineno")
+        if key_type not in ("filename", "lineno", "traceback"):
+            return text_response(400, "'key_type' must be 'filename', 'lineno' or 'traceback'\n")
+        diff = request.query.get("diff", "") in ("1", "true")
+        if self.busy:
+            return text_response(409, "a profile is already being taken\n")
+
+        self.busy = True
+        try:
+            lines = await asyncio.get_running_loop().run_in_executor(
+                None, self.take_snapshot, limit, key_type, diff
+            )
+        finally:
+            self.busy = False
+        return HttpResponse(200, TEXT_PLAIN, self.chunked(lines))
+
+    def take_snapshot(self, limit: int, key_type: str, diff: bool) -> List[str]:
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            )
+        )
+        traced, peak = tracemalloc.get_traced_memory()
+        lines = ["traced: {} B, peak: {} B\n".format(traced, peak)]
+
+        previous: Optional[tracemalloc.Snapshot] = None
+        if diff and self.snapshot_path is not None:
+            previous = tracemalloc.Snapshot.load(self.snapshot_path)
+
+        if previous is not None:
+            lines.append("top {} allocation sites by growth since the previous snapshot:\n".format(limit))
+            for stat in snapshot.compare_to(previous, key_type)[:limit]:
+                lines.extend(format_statistic(stat))
+        else:
+            lines.append("top {} allocation sites:\n".format(limit))
+            for stat in snapshot.statistics(key_type)[:limit]:
+                lines.extend(format_statistic(stat))
+        del previous
+
+        # the next diff is against this one.
+        if self.snapshot_path is None:
+            fd, self.snapshot_path = tempfile.mkstemp(prefix="tracemalloc-", suffix=".snapshot")
+            os.close(fd)
+        snapshot.dump(self.snapshot_path)
+        return lines
+
+    def remove_snapshot(self) -> None:
+        if self.snapshot_path is not None:
+            try:
+                os.remove(self.snapshot_path)
+            except OSError:
+                pass
+            self.snapshot_path = None
+
+    async def tasks(self, request: HttpRequest) -> HttpResponse:
+        try:
+            limit = int(request.query.get("limit", 10))
+        except ValueError:
+            return text_response(400, "'limit' must be a number\n")
+        return HttpResponse(200, TEXT_PLAIN, self.dump_tasks(limit))
+
+    @staticmethod
+    async def dump_tasks(limit: int) -> AsyncIterator[bytes]:
+        # the tasks that finish while this is being sent are still listed.
+        tasks = list(asyncio.all_tasks())
+        yield "{} tasks\n\n".format(len(tasks)).encode("utf-8")
+        for task in tasks:
+            out = io.StringIO()
+            out.write("{!r}\n".format(task))
+            if not task.done():
+                task.print_stack(limit=limit, file=out)
+            out.write("\n")
+            yield out.getvalue().encode("utf-8")
+
+    async def chunked(self, lines: Iterable[str]) -> AsyncIterator[bytes]:
+        buffer: List[str] = []
+        size = 0
+        for line in lines:
+            buffer.append(line)
+            size += len(line)
+            if size >= self.CHUNK_SIZE:
+                yield "".join(buffer).encode("utf-8")
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield "".join(buffer).encode("utf-8")
+
+
+def format_statistic(stat: Union[tracemalloc.Statistic, tracemalloc.StatisticDiff]) -> List[str]:
+    lines = ["{}\n".format(stat)]
+    if len(stat.traceback) > 1:
+        lines.extend("    {}\n".format(line) for line in stat.traceback.format())
+    return lines
+
+
+def text_response(status: int, text: str) -> HttpResponse:
+    return HttpResponse(status, TEXT_PLAIN, text.encode("utf-8"))
+
+
+__all__ = [
+    "Profiler",
+    "StackSampler",
+]
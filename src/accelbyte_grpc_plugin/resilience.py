@@ -0,0 +1,388 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import random
+import time
+
+from enum import IntEnum
+from logging import Logger
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from grpc import StatusCode
+from grpc.aio import AioRpcError
+from prometheus_client import Counter, Gauge
+
+from accelbyte_grpc_plugin.deadlines import get_time_remaining
+from accelbyte_grpc_plugin.utils import create_aio_rpc_error
+
+SDKCallFunc = Callable[[], Awaitable[Tuple[Any, Any]]]
+
+HTTP_STATUS_CODES: Dict[int, StatusCode] = {
+    400: StatusCode.INVALID_ARGUMENT,
+    401: StatusCode.UNAUTHENTICATED,
+    403: StatusCode.PERMISSION_DENIED,
+    404: StatusCode.NOT_FOUND,
+    409: StatusCode.ALREADY_EXISTS,
+    412: StatusCode.FAILED_PRECONDITION,
+    429: StatusCode.RESOURCE_EXHAUSTED,
+    499: StatusCode.CANCELLED,
+    500: StatusCode.INTERNAL,
+    501: StatusCode.UNIMPLEMENTED,
+    502: StatusCode.UNAVAILABLE,
+    503: StatusCode.UNAVAILABLE,
+    504: StatusCode.DEADLINE_EXCEEDED,
+}
+
+# HTTP statuses worth retrying, the others will fail the same way again.
+RETRYABLE_HTTP_STATUSES = frozenset({0, 429, 500, 502, 503, 504})
+
+
+def get_http_status(error: Any) -> Optional[int]:
+    """Returns the HTTP status of an SDK error: 'code' for HttpResponse,
+    'http_status' for the error models (recorded by AsyncAccelByteSDK)."""
+    status = getattr(error, "http_status", None)
+    if status is None:
+        status = getattr(error, "code", None)
+    return status if isinstance(status, int) else None
+
+
+def get_status_code(error: Any) -> StatusCode:
+    """Maps an SDK error or exception to the closest gRPC status code."""
+    if isinstance(error, AioRpcError):
+        return error.code()
+    if isinstance(error, (httpx.TimeoutException, asyncio.TimeoutError)):
+        return StatusCode.DEADLINE_EXCEEDED
+    if isinstance(error, httpx.TransportError):
+        return StatusCode.UNAVAILABLE
+    status = get_http_status(error)
+    if status is None:
+        return StatusCode.UNKNOWN
+    if status == 0:
+        # the SDK's "Connection Error".
+        return StatusCode.UNAVAILABLE
+    if status in HTTP_STATUS_CODES:
+        return HTTP_STATUS_CODES[status]
+    if 400 <= status < 500:
+        return StatusCode.FAILED_PRECONDITION
+    if 500 <= status < 600:
+        return StatusCode.INTERNAL
+    return StatusCode.UNKNOWN
+
+
+def create_sdk_rpc_error(error: Any) -> AioRpcError:
+    if isinstance(error, AioRpcError):
+        return error
+    return create_aio_rpc_error(str(error), get_status_code(error))
+
+
+def is_retryable(error: Any) -> bool:
+    if isinstance(error, AioRpcError):
+        return False
+    if isinstance(error, (httpx.TransportError, asyncio.TimeoutError)):
+        return True
+    return get_http_status(error) in RETRYABLE_HTTP_STATUSES
+
+
+class RetryBudget:
+    """A token bucket that caps retries to a fraction of the calls made.
+
+    Every call deposits 'ratio' tokens, every retry withdraws one. The bucket
+    also refills at 'min_retries_per_second' so that retries are still
+    possible at low traffic, and holds at most 'max_tokens'. When CloudSave
+    fails every call, retries stay at about 'ratio' of the traffic instead of
+    multiplying it."""
+
+    DEFAULT_RATIO: float = 0.1
+    DEFAULT_MIN_RETRIES_PER_SECOND: float = 10.0
+    DEFAULT_MAX_TOKENS: float = 100.0
+
+    def __init__(
+        self,
+        ratio: Optional[float] = None,
+        min_retries_per_second: Optional[float] = None,
+        max_tokens: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ratio is None:
+            ratio = self.DEFAULT_RATIO
+
+        if min_retries_per_second is None:
+            min_retries_per_second = self.DEFAULT_MIN_RETRIES_PER_SECOND
+
+        if max_tokens is None:
+            max_tokens = self.DEFAULT_MAX_TOKENS
+
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self.timer = timer
+
+        self.tokens: float = max_tokens
+        self.refilled_at: float = timer()
+
+    def refill(self) -> None:
+        now = self.timer()
+        self.tokens = min(
+            self.max_tokens,
+            self.tokens + (now - self.refilled_at) * self.min_retries_per_second,
+        )
+        self.refilled_at = now
+
+    def on_call(self) -> None:
+        self.refill()
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        self.refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class CircuitState(IntEnum):
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+class CircuitBreaker:
+    """Opens after 'failure_threshold' consecutive failures and rejects calls
+    for 'reset_timeout' seconds, then lets 'half_open_max_calls' probes
+    through: the circuit closes on a success and re-opens on a failure."""
+
+    DEFAULT_FAILURE_THRESHOLD: int = 5
+    DEFAULT_RESET_TIMEOUT: float = 10.0
+    DEFAULT_HALF_OPEN_MAX_CALLS: int = 1
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        half_open_max_calls: Optional[int] = None,
+        on_state_change: Optional[Callable[[CircuitState], None]] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold is None:
+            failure_threshold = self.DEFAULT_FAILURE_THRESHOLD
+
+        if reset_timeout is None:
+            reset_timeout = self.DEFAULT_RESET_TIMEOUT
+
+        if half_open_max_calls is None:
+            half_open_max_calls = self.DEFAULT_HALF_OPEN_MAX_CALLS
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self.timer = timer
+
+        self.state: CircuitState = CircuitState.CLOSED
+        self.failures: int = 0
+        self.opened_at: float = 0.0
+        self.half_open_calls: int = 0
+
+    def set_state(self, state: CircuitState) -> None:
+        if state == self.state:
+            return
+        self.state = state
+        self.failures = 0
+        self.half_open_calls = 0
+        if state == CircuitState.OPEN:
+            self.opened_at = self.timer()
+        if self.on_state_change is not None:
+            self.on_state_change(state)
+
+    def get_retry_after(self) -> float:
+        return max(0.0, self.opened_at + self.reset_timeout - self.timer())
+
+    def try_acquire(self) -> bool:
+        if self.state == CircuitState.OPEN:
+            if self.get_retry_after() > 0:
+                return False
+            self.set_state(CircuitState.HALF_OPEN)
+        if self.state == CircuitState.HALF_OPEN:
+            if self.half_open_calls >= self.half_open_max_calls:
+                return False
+            self.half_open_calls += 1
+        return True
+
+    def release(self) -> None:
+        """Gives back the slot of a call that ended without an outcome."""
+        if self.state == CircuitState.HALF_OPEN and self.half_open_calls > 0:
+            self.half_open_calls -= 1
+
+    def on_success(self) -> None:
+        if self.state == CircuitState.HALF_OPEN:
+            self.set_state(CircuitState.CLOSED)
+        self.failures = 0
+
+    def on_failure(self) -> None:
+        if self.state == CircuitState.HALF_OPEN:
+            self.set_state(CircuitState.OPEN)
+            return
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.set_state(CircuitState.OPEN)
+
+
+class SDKCallPolicy:
+    """Runs SDK calls with retries and a circuit breaker per endpoint.
+
+    Only transient failures (transport errors, timeouts, 429 and 5xx) are
+    retried and count against the breaker; other errors are handed back to
+    the caller as is. Retries use full-jitter exponential backoff, are
+    limited by a shared RetryBudget, and are not attempted if the backoff
+    would outlive the RPC deadline."""
+
+    DEFAULT_MAX_ATTEMPTS: int = 3
+    DEFAULT_BASE_DELAY: float = 0.05
+    DEFAULT_MAX_DELAY: float = 1.0
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        breaker_factory: Optional[Callable[[str], CircuitBreaker]] = None,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        if max_attempts is None:
+            max_attempts = self.DEFAULT_MAX_ATTEMPTS
+
+        if base_delay is None:
+            base_delay = self.DEFAULT_BASE_DELAY
+
+        if max_delay is None:
+            max_delay = self.DEFAULT_MAX_DELAY
+
+        if retry_budget is None:
+            retry_budget = RetryBudget()
+
+        if breaker_factory is None:
+            breaker_factory = lambda endpoint: CircuitBreaker()
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget = retry_budget
+        self.breaker_factory = breaker_factory
+        self.logger = logger
+
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+        self.breaker_state = Gauge(
+            name="sdk_circuit_breaker_state",
+            documentation="state of the SDK circuit breakers (0: closed, 1: open, 2: half-open)",
+            labelnames=["endpoint"],
+        )
+        self.breaker_rejected = Counter(
+            name="sdk_circuit_breaker_rejected",
+            documentation="number of SDK calls rejected by an open circuit breaker",
+            labelnames=["endpoint"],
+            unit="count",
+        )
+        self.retries = Counter(
+            name="sdk_retries",
+            documentation="number of SDK calls retried after a transient failure",
+            labelnames=["endpoint"],
+            unit="count",
+        )
+        self.retries_denied = Counter(
+            name="sdk_retries_denied",
+            documentation="number of SDK retries not attempted because the retry budget was spent",
+            labelnames=["endpoint"],
+            unit="count",
+        )
+
+    def get_breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self.breakers.get(endpoint, None)
+        if breaker is None:
+            breaker = self.breaker_factory(endpoint)
+            breaker.on_state_change = lambda state: self.on_state_change(endpoint, state)
+            self.breakers[endpoint] = breaker
+            self.breaker_state.labels(endpoint=endpoint).set(breaker.state)
+        return breaker
+
+    def on_state_change(self, endpoint: str, state: CircuitState) -> None:
+        self.breaker_state.labels(endpoint=endpoint).set(state)
+        if self.logger:
+            self.logger.warning("circuit breaker %s is %s", endpoint, state.name.lower())
+
+    def get_backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+    async def call(
+        self, endpoint: str, fn: SDKCallFunc, retryable: bool = True
+    ) -> Tuple[Any, Any]:
+        """Returns the (response, error) of 'fn', raises UNAVAILABLE if the
+        circuit of 'endpoint' is open. Set 'retryable' to False for calls that
+        are not safe to repeat. Exceptions still failing after the last
+        attempt are raised as the mapped AioRpcError."""
+        breaker = self.get_breaker(endpoint)
+        self.retry_budget.on_call()
+
+        attempt = 0
+        while True:
+            if not breaker.try_acquire():
+                self.breaker_rejected.labels(endpoint=endpoint).inc()
+                raise create_aio_rpc_error(
+                    f"{endpoint} is unavailable, retry after {breaker.get_retry_after():.1f}s",
+                    StatusCode.UNAVAILABLE,
+                )
+
+            attempt += 1
+            try:
+                response, error = await fn()
+            except (httpx.TransportError, asyncio.TimeoutError) as e:
+                response, error = None, e
+            except BaseException:
+                # e.g. cancelled, tells nothing about the health of the endpoint.
+                breaker.release()
+                raise
+
+            if error is None or not is_retryable(error):
+                breaker.on_success()
+                return response, error
+
+            breaker.on_failure()
+
+            if not retryable or attempt >= self.max_attempts:
+                break
+
+            delay = self.get_backoff(attempt)
+            time_remaining = get_time_remaining()
+            if time_remaining is not None and time_remaining <= delay:
+                break
+
+            if not self.retry_budget.try_withdraw():
+                self.retries_denied.labels(endpoint=endpoint).inc()
+                break
+
+            self.retries.labels(endpoint=endpoint).inc()
+            await asyncio.sleep(delay)
+
+        if isinstance(error, Exception):
+            raise create_sdk_rpc_error(error) from error
+        return response, error
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitState",
+    "HTTP_STATUS_CODES",
+    "RETRYABLE_HTTP_STATUSES",
+    "RetryBudget",
+    "SDKCallFunc",
+    "SDKCallPolicy",
+    "create_sdk_rpc_error",
+    "get_http_status",
+    "get_status_code",
+    "is_retryable",
+]
@@ -0,0 +1,241 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import math
+import sys
+
+from logging import Logger
+from typing import Awaitable, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from prometheus_client import Counter, Gauge
+
+from accelbyte_py_sdk import AccelByteSDK
+from accelbyte_py_sdk.api import iam as iam_service
+from accelbyte_py_sdk.token_validation._bloom_filter import BloomFilter
+from accelbyte_py_sdk.token_validation._utils import str2datetime
+
+
+class RevokedTokens(NamedTuple):
+    bits: Tuple[int, ...]
+    k: int
+    m: int
+
+
+class RevocationList(NamedTuple):
+    revoked_tokens: Optional[RevokedTokens]
+    revoked_users: Dict[str, float]
+    # the exact revoked tokens, when the source publishes them (IAM does not).
+    revoked_token_ids: Optional[FrozenSet[str]] = None
+
+
+RevocationListFetcher = Callable[[], Awaitable[RevocationList]]
+
+
+class RevocationIndex:
+    """Immutable snapshot of the revocation list.
+
+    Tokens are checked against the bloom filter first, hits are confirmed
+    against the exact revoked tokens when there are any. IAM only publishes
+    the bloom filter, so with it a positive answer may be a false positive.
+    Revoked users are kept as an exact map."""
+
+    def __init__(
+        self,
+        revoked_tokens: Optional[RevokedTokens] = None,
+        revoked_token_filter: Optional[BloomFilter] = None,
+        revoked_users: Optional[Dict[str, float]] = None,
+        revoked_token_ids: Optional[FrozenSet[str]] = None,
+    ) -> None:
+        if revoked_token_filter is None and revoked_tokens is not None:
+            revoked_token_filter = BloomFilter.create_from_bits(
+                bits=list(revoked_tokens.bits), k=revoked_tokens.k, m=revoked_tokens.m
+            )
+
+        self.revoked_tokens = revoked_tokens
+        self.revoked_token_filter = revoked_token_filter
+        self.revoked_users: Dict[str, float] = revoked_users or {}
+        self.revoked_token_ids = revoked_token_ids
+
+    def is_token_revoked(self, token: str) -> bool:
+        if self.revoked_token_filter is None:
+            return False
+        if not self.revoked_token_filter.might_contains(key=token):
+            return False
+        if self.revoked_token_ids is None:
+            return True
+        return token in self.revoked_token_ids
+
+    def is_user_revoked(self, user_id: str, issued_at: Optional[float]) -> bool:
+        revoked_at = self.revoked_users.get(user_id, None)
+        if revoked_at is None:
+            return False
+        return issued_at is None or revoked_at >= issued_at
+
+    def apply(self, revocation_list: RevocationList) -> "RevocationIndex":
+        revoked_tokens = revocation_list.revoked_tokens
+        revoked_token_filter = self.revoked_token_filter
+        if revoked_tokens != self.revoked_tokens:
+            revoked_token_filter = None
+
+        # unchanged parts are kept as they are, so that callers can tell
+        # whether anything changed by identity.
+        revoked_users = revocation_list.revoked_users
+        if revoked_users == self.revoked_users:
+            revoked_users = self.revoked_users
+
+        revoked_token_ids = revocation_list.revoked_token_ids
+        if revoked_token_ids == self.revoked_token_ids:
+            revoked_token_ids = self.revoked_token_ids
+
+        return RevocationIndex(
+            revoked_tokens=revoked_tokens,
+            revoked_token_filter=revoked_token_filter,
+            revoked_users=revoked_users,
+            revoked_token_ids=revoked_token_ids,
+        )
+
+    def is_same(self, other: "RevocationIndex") -> bool:
+        return (
+            self.revoked_token_filter is other.revoked_token_filter
+            and self.revoked_users is other.revoked_users
+            and self.revoked_token_ids is other.revoked_token_ids
+        )
+
+    def get_token_filter_size(self) -> int:
+        if self.revoked_token_filter is None:
+            return 0
+        return self.revoked_token_filter.m // 8
+
+    def get_users_size(self) -> int:
+        return sys.getsizeof(self.revoked_users) + sum(
+            sys.getsizeof(k) + sys.getsizeof(v) for k, v in self.revoked_users.items()
+        )
+
+    def get_token_ids_size(self) -> int:
+        if self.revoked_token_ids is None:
+            return 0
+        return sys.getsizeof(self.revoked_token_ids) + sum(
+            sys.getsizeof(token) for token in self.revoked_token_ids
+        )
+
+    def get_token_filter_false_positive_rate(self) -> float:
+        bloom_filter = self.revoked_token_filter
+        if bloom_filter is None or not bloom_filter.m:
+            return 0.0
+        # probability that all k probed bits of a random key are set.
+        return math.pow(bloom_filter.bits.count(1) / bloom_filter.m, bloom_filter.k)
+
+
+def create_iam_revocation_list_fetcher(sdk: AccelByteSDK) -> RevocationListFetcher:
+    async def fetch() -> RevocationList:
+        result, error = await iam_service.get_revocation_list_v3_async(sdk=sdk)
+        if error:
+            raise Exception(error)
+
+        revoked_tokens = RevokedTokens(
+            bits=tuple(result.revoked_tokens.bits),
+            k=result.revoked_tokens.k,
+            m=result.revoked_tokens.m,
+        )
+
+        revoked_users: Dict[str, float] = {}
+        for user in result.revoked_users or []:
+            if not user.id_ or not user.revoked_at:
+                continue
+            revoked_users[user.id_] = str2datetime(user.revoked_at).timestamp()
+
+        return RevocationList(revoked_tokens=revoked_tokens, revoked_users=revoked_users)
+
+    return fetch
+
+
+class RevocationIndexCache:
+    """Drop-in replacement for the SDK's RevocationListCache.
+
+    Every refresh fetches the full revocation list (IAM has no incremental
+    endpoint), the new index is built off the event loop and swapped in
+    atomically. The bloom filter is only rebuilt when its bits change."""
+
+    def __init__(
+        self,
+        fetcher: RevocationListFetcher,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        self.fetcher = fetcher
+        self.logger = logger
+
+        self.index = RevocationIndex()
+        self.listeners: List[Callable[[], None]] = []
+
+        self.refreshes = Counter(
+            name="grpc_server_auth_revocation_index_refreshes",
+            documentation="number of revocation index refreshes",
+            unit="count",
+        )
+        self.size = Gauge(
+            name="grpc_server_auth_revocation_index_size",
+            documentation="estimated memory used by the revocation index",
+            labelnames=["kind"],
+            unit="bytes",
+        )
+        self.false_positive_rate = Gauge(
+            name="grpc_server_auth_revocation_index_false_positive_rate",
+            documentation="estimated false positive rate of the revoked tokens bloom filter",
+            unit="ratio",
+        )
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        self.listeners.append(listener)
+
+    async def refresh(self) -> bool:
+        revocation_list = await self.fetcher()
+
+        old_index = self.index
+        # building the bloom filter is CPU bound, keep it off the event loop.
+        new_index = await asyncio.get_running_loop().run_in_executor(
+            None, old_index.apply, revocation_list
+        )
+        self.index = new_index
+
+        self.refreshes.inc()
+        self.size.labels(kind="tokens").set(new_index.get_token_filter_size())
+        self.size.labels(kind="users").set(new_index.get_users_size())
+        self.size.labels(kind="token_ids").set(new_index.get_token_ids_size())
+        self.false_positive_rate.set(new_index.get_token_filter_false_positive_rate())
+
+        changed = not new_index.is_same(old_index)
+        if changed:
+            if self.logger:
+                self.logger.debug(
+                    "revocation index updated: %d revoked users", len(new_index.revoked_users)
+                )
+            for listener in self.listeners:
+                listener()
+
+        return changed
+
+    # RevocationListCache interface
+
+    def is_token_revoked(self, token: str, **kwargs) -> bool:
+        return self.index.is_token_revoked(token=token)
+
+    def is_user_revoked(self, user_id: str, issued_at: int, **kwargs) -> bool:
+        return self.index.is_user_revoked(user_id=user_id, issued_at=issued_at)
+
+    def update(self, **kwargs) -> None:
+        pass
+
+    def cancel(self) -> "RevocationIndexCache":
+        return self
+
+
+__all__ = [
+    "RevocationIndex",
+    "RevocationIndexCache",
+    "RevocationList",
+    "RevocationListFetcher",
+    "RevokedTokens",
+    "create_iam_revocation_list_fetcher",
+]
@@ -0,0 +1,144 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+
+from logging import Logger
+from typing import Any, Optional, Tuple
+
+from prometheus_client import Counter
+
+from accelbyte_py_sdk import AccelByteSDK
+from accelbyte_py_sdk.core import Operation
+from accelbyte_py_sdk.services.auth import LoginTimerBase
+
+from accelbyte_grpc_plugin.deadlines import check_deadline, get_time_remaining, is_deadline_exceeded
+
+
+class AsyncAccelByteSDK(AccelByteSDK):
+    """AccelByteSDK whose '*_async' calls do not block the event loop.
+
+    The stock 'run_request_async' sends requests with the blocking HTTP
+    client, here they are sent with the async one so that cancelling the
+    awaiting task (e.g. the RPC was cancelled) also cancels the request.
+
+    When called while serving an RPC, requests are not sent at all if its
+    deadline has passed, otherwise the time remaining becomes their timeout.
+
+    Errors are given an 'http_status' attribute with the response status."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.requests_skipped = Counter(
+            name="sdk_requests_skipped",
+            documentation="number of SDK requests not sent because the RPC deadline had passed",
+            unit="count",
+        )
+        self.requests_cancelled = Counter(
+            name="sdk_requests_cancelled",
+            documentation="number of in-flight SDK requests cancelled by their caller",
+            unit="count",
+        )
+        self.requests_wasted = Counter(
+            name="sdk_requests_wasted",
+            documentation="number of SDK requests that completed after the RPC deadline",
+            unit="count",
+        )
+
+    async def run_request_async(
+        self, operation: Operation, **kwargs
+    ) -> Tuple[Any, Any]:
+        try:
+            check_deadline()
+        except Exception:
+            self.requests_skipped.inc()
+            raise
+
+        if "timeout" not in kwargs:
+            time_remaining = get_time_remaining()
+            if time_remaining is not None:
+                kwargs["timeout"] = time_remaining
+
+        proto, error, kwargs = self._pre_run_request(operation=operation, **kwargs)
+        if error:
+            return None, error
+
+        http_client = kwargs.pop("http_client", self.get_http_client())
+        if not http_client.is_async_compatible():
+            response, error, kwargs = self.run_proto_request(
+                proto=proto, http_client=http_client, **kwargs
+            )
+        else:
+            request = http_client.create_request(proto=proto)
+            try:
+                raw_response, error = await http_client.send_request_async(
+                    request, **kwargs
+                )
+            except asyncio.CancelledError:
+                self.requests_cancelled.inc()
+                raise
+            if error:
+                return None, error
+            response, error = http_client.handle_response(raw_response, **kwargs)
+
+        if is_deadline_exceeded():
+            self.requests_wasted.inc()
+
+        if error:
+            return None, error
+
+        result, error = self._post_run_request(operation=operation, response=response)
+        if error is not None and not hasattr(error, "http_status"):
+            # the error models do not carry the status, which tells whether to retry.
+            setattr(error, "http_status", response[0])
+        return result, error
+
+
+class LoginTimerTask:
+    """Runs an SDK login timer (e.g. LoginClientTimer, created without
+    'autostart') on the running loop rather than on a thread of its own.
+
+    Its 'run_async' is awaited every 'interval' seconds, so the token is
+    refreshed with the async HTTP client on the same loop as the RPCs,
+    instead of with the blocking one."""
+
+    def __init__(
+        self,
+        timer: LoginTimerBase,
+        interval: float,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        self.timer = timer
+        self.interval = interval
+        self.logger = logger
+
+        self.task: Optional["asyncio.Task[None]"] = None
+
+    async def start(self) -> None:
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                _, error = await self.timer.run_async()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = e
+            if error and self.logger:
+                self.logger.warning("login refresh failed: %s", error)
+
+
+__all__ = [
+    "AsyncAccelByteSDK",
+    "LoginTimerTask",
+]
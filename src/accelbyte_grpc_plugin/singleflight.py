@@ -0,0 +1,49 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """Runs at most one call per key at a time, concurrent callers share its result.
+
+    The call runs in its own task, so a caller being cancelled (e.g. its
+    deadline expired) only stops that caller from waiting, not the others."""
+
+    def __init__(self) -> None:
+        self.calls: Dict[K, "asyncio.Future[V]"] = {}
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> Tuple[V, bool]:
+        """Returns the result of 'fn()' and whether it was shared with another caller."""
+        future = self.calls.get(key, None)
+        shared = future is not None
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            future.add_done_callback(lambda f: self.on_done(key, f))
+            self.calls[key] = future
+        return await asyncio.shield(future), shared
+
+    def forget(self, key: K) -> None:
+        """Callers from now on start a new call instead of sharing the one in flight."""
+        self.calls.pop(key, None)
+
+    def on_done(self, key: K, future: "asyncio.Future[V]") -> None:
+        if self.calls.get(key, None) is future:
+            del self.calls[key]
+        if not future.cancelled():
+            # mark the exception as retrieved in case every caller went away.
+            future.exception()
+
+
+__all__ = [
+    "SingleFlight",
+]
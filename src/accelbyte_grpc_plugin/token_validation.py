@@ -0,0 +1,431 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import functools
+import threading
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from logging import Logger
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+from typing import Protocol, runtime_checkable
+
+import jwt
+
+from accelbyte_py_sdk import AccelByteSDK
+from accelbyte_py_sdk.api import iam as iam_service
+from accelbyte_py_sdk.token_validation import PermissionAction, TokenValidatorProtocol
+from accelbyte_py_sdk.token_validation.caching import CachingTokenValidator
+
+from .revocation import (
+    RevocationIndexCache,
+    RevocationListFetcher,
+    create_iam_revocation_list_fetcher,
+)
+
+
+JWTClaims = Dict[str, Any]
+
+
+class AccessTokenClaims(NamedTuple):
+    user_id: Optional[str] = None
+    client_id: Optional[str] = None
+    namespace: Optional[str] = None
+    extend_namespace: Optional[str] = None
+    permissions: Tuple[Tuple[str, int], ...] = ()
+    exp: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, claims: JWTClaims) -> "AccessTokenClaims":
+        permissions = tuple(
+            (p.get("Resource", p.get("resource")), p.get("Action", p.get("action")))
+            for p in (claims.get("permissions", None) or [])
+        )
+        return cls(
+            user_id=claims.get("user_id", claims.get("sub", None)),
+            client_id=claims.get("client_id", None),
+            namespace=claims.get("namespace", None),
+            extend_namespace=claims.get("extend_namespace", None),
+            permissions=permissions,
+            exp=claims.get("exp", None),
+        )
+
+
+@runtime_checkable
+class AsyncTokenValidatorProtocol(Protocol):
+    async def validate_token_async(
+        self,
+        token: str,
+        resource: Optional[str] = None,
+        action: Optional[PermissionAction] = None,
+        namespace: Optional[str] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[Exception]:
+        ...
+
+
+@runtime_checkable
+class AsyncClaimsTokenValidatorProtocol(Protocol):
+    async def validate_token_claims_async(
+        self,
+        token: str,
+        resource: Optional[str] = None,
+        action: Optional[PermissionAction] = None,
+        namespace: Optional[str] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> Tuple[Optional[JWTClaims], Optional[Exception]]:
+        ...
+
+
+@runtime_checkable
+class RevocationListObservable(Protocol):
+    def add_revocation_list_listener(self, listener: Callable[[], None]) -> None:
+        ...
+
+
+class ExecutorTokenValidator:
+    """Runs a synchronous token validator in a bounded thread pool so that
+    cache misses and refreshes never block the event loop."""
+
+    DEFAULT_MAX_WORKERS: int = 4
+    DEFAULT_MAX_IN_FLIGHT: int = 64
+
+    def __init__(
+        self,
+        token_validator: TokenValidatorProtocol,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if max_workers is None:
+            max_workers = self.DEFAULT_MAX_WORKERS
+
+        if max_in_flight is None:
+            max_in_flight = self.DEFAULT_MAX_IN_FLIGHT
+
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="token-validator"
+            )
+
+        self.token_validator = token_validator
+        self.max_in_flight = max_in_flight
+        self.executor = executor
+
+        self.semaphore = asyncio.Semaphore(max_in_flight)
+
+    def validate_token(
+        self,
+        token: str,
+        resource: Optional[str] = None,
+        action: Optional[PermissionAction] = None,
+        namespace: Optional[str] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[Exception]:
+        return self.token_validator.validate_token(
+            token=token,
+            resource=resource,
+            action=action,
+            namespace=namespace,
+            user_id=user_id,
+            **kwargs,
+        )
+
+    async def validate_token_async(
+        self,
+        token: str,
+        resource: Optional[str] = None,
+        action: Optional[PermissionAction] = None,
+        namespace: Optional[str] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[Exception]:
+        return await self.run_in_executor(
+            functools.partial(
+                self.token_validator.validate_token,
+                token=token,
+                resource=resource,
+                action=action,
+                namespace=namespace,
+                user_id=user_id,
+                **kwargs,
+            )
+        )
+
+    def validate_token_claims(
+        self,
+        token: str,
+        resource: Optional[str] = None,
+        action: Optional[PermissionAction] = None,
+        namespace: Optional[str] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> Tuple[Optional[JWTClaims], Optional[Exception]]:
+        error = self.validate_token(
+            token=token,
+            resource=resource,
+            action=action,
+            namespace=namespace,
+            user_id=user_id,
+            **kwargs,
+        )
+        if error is not None:
+            return None, error
+
+        # the signature was already verified by the validator above, reading the
+        # claims again is only base64 and JSON decoding.
+        claims = jwt.decode(token, options={"verify_signature": False})
+        return claims, None
+
+    async def validate_token_claims_async(
+        self,
+        token: str,
+        resource: Optional[str] = None,
+        action: Optional[PermissionAction] = None,
+        namespace: Optional[str] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> Tuple[Optional[JWTClaims], Optional[Exception]]:
+        return await self.run_in_executor(
+            functools.partial(
+                self.validate_token_claims,
+                token=token,
+                resource=resource,
+                action=action,
+                namespace=namespace,
+                user_id=user_id,
+                **kwargs,
+            )
+        )
+
+    async def run_in_executor(self, fn: Callable[[], Any]) -> Any:
+        async with self.semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn)
+
+
+class AsyncJWKSCache:
+    """Drop-in replacement for the SDK's JWKSCache whose keys are added by
+    AsyncCachingTokenValidator's refresh task. Like the SDK's, a key that is
+    not cached yet is fetched (synchronously) when it is looked up."""
+
+    JWKS_KEYS_KEY: str = "keys"
+
+    def __init__(self, sdk: AccelByteSDK) -> None:
+        self.sdk = sdk
+        # replaced on every update, lookups read it without locking.
+        self.keys: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+
+    def add_keys(self, keys: List[Dict[str, Any]]) -> None:
+        jwks = jwt.PyJWKSet(keys)
+        with self.lock:
+            self.keys = {**self.keys, **{jwk.key_id: jwk.key for jwk in jwks.keys}}
+
+    # JWKSCache interface
+
+    def update(self, **kwargs) -> None:
+        result, error = iam_service.get_jwksv3(
+            x_additional_headers=kwargs.get("x_additional_headers", None),
+            sdk=self.sdk,
+        )
+        if error:
+            return
+        self.add_keys(result.to_dict().get(self.JWKS_KEYS_KEY, []))
+
+    def get_key_from_cache(self, key_id: str, **kwargs) -> Optional[Any]:
+        return self.keys.get(key_id, None)
+
+    def get_key(self, key_id: str, **kwargs) -> Optional[Any]:
+        key = self.get_key_from_cache(key_id)
+        if key is not None:
+            return key
+
+        self.update(**kwargs)
+
+        return self.get_key_from_cache(key_id)
+
+
+class AsyncCachingTokenValidator(ExecutorTokenValidator):
+    """A CachingTokenValidator whose JWKS and revocation list are refreshed by
+    background asyncio tasks using the SDK's async calls instead of timer
+    threads. Validation itself still runs in the bounded thread pool since
+    role and namespace context lookups can perform blocking I/O."""
+
+    DEFAULT_JWKS_REFRESH_INTERVAL: float = 3600
+    DEFAULT_REVOCATION_LIST_REFRESH_INTERVAL: float = 3600
+
+    def __init__(
+        self,
+        sdk: AccelByteSDK,
+        jwks_refresh_interval: Optional[Union[int, float]] = None,
+        revocation_list_refresh_interval: Optional[Union[int, float]] = None,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        revocation_list_fetcher: Optional[RevocationListFetcher] = None,
+        logger: Optional[Logger] = None,
+        **kwargs,
+    ) -> None:
+        if jwks_refresh_interval is None:
+            jwks_refresh_interval = self.DEFAULT_JWKS_REFRESH_INTERVAL
+
+        if revocation_list_refresh_interval is None:
+            revocation_list_refresh_interval = (
+                self.DEFAULT_REVOCATION_LIST_REFRESH_INTERVAL
+            )
+
+        token_validator = CachingTokenValidator(
+            sdk=sdk,
+            jwks_refresh_interval=None,
+            revocation_list_refresh_interval=revocation_list_refresh_interval,
+            **kwargs,
+        )
+        # the revocation list cache always starts its own timer thread,
+        # it is replaced by an index refreshed by the background tasks below.
+        token_validator.revocation_list_cache.cancel()
+
+        if revocation_list_fetcher is None:
+            revocation_list_fetcher = create_iam_revocation_list_fetcher(sdk=sdk)
+
+        self.revocation_index_cache = RevocationIndexCache(
+            fetcher=revocation_list_fetcher,
+            logger=logger,
+        )
+        token_validator.revocation_list_cache = self.revocation_index_cache
+
+        self.jwks_cache = AsyncJWKSCache(sdk=sdk)
+        token_validator.jwks_cache = self.jwks_cache
+
+        super().__init__(
+            token_validator=token_validator,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+        )
+
+        self.sdk = sdk
+        self.jwks_refresh_interval = jwks_refresh_interval
+        self.revocation_list_refresh_interval = revocation_list_refresh_interval
+        self.logger = logger
+
+        self.refresh_tasks: List[asyncio.Task] = []
+
+    @property
+    def caching_token_validator(self) -> CachingTokenValidator:
+        return self.token_validator
+
+    def add_revocation_list_listener(self, listener: Callable[[], None]) -> None:
+        self.revocation_index_cache.add_listener(listener)
+
+    def start(self) -> None:
+        if self.refresh_tasks:
+            return
+        loop = asyncio.get_running_loop()
+        self.refresh_tasks = [
+            loop.create_task(
+                self.refresh_periodically(
+                    self.jwks_refresh_interval, self.refresh_jwks
+                )
+            ),
+            loop.create_task(
+                self.refresh_periodically(
+                    self.revocation_list_refresh_interval,
+                    self.refresh_revocation_list,
+                )
+            ),
+        ]
+
+    async def stop(self) -> None:
+        tasks, self.refresh_tasks = self.refresh_tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def validate_token_async(
+        self,
+        token: str,
+        resource: Optional[str] = None,
+        action: Optional[PermissionAction] = None,
+        namespace: Optional[str] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[Exception]:
+        self.start()
+        return await super().validate_token_async(
+            token=token,
+            resource=resource,
+            action=action,
+            namespace=namespace,
+            user_id=user_id,
+            **kwargs,
+        )
+
+    async def validate_token_claims_async(
+        self,
+        token: str,
+        resource: Optional[str] = None,
+        action: Optional[PermissionAction] = None,
+        namespace: Optional[str] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> Tuple[Optional[JWTClaims], Optional[Exception]]:
+        self.start()
+        return await super().validate_token_claims_async(
+            token=token,
+            resource=resource,
+            action=action,
+            namespace=namespace,
+            user_id=user_id,
+            **kwargs,
+        )
+
+    async def refresh_periodically(
+        self, interval: float, refresh_fn: Callable[[], Awaitable[None]]
+    ) -> None:
+        while True:
+            try:
+                await refresh_fn()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                if self.logger:
+                    self.logger.warning(
+                        "%s failed: %s", getattr(refresh_fn, "__name__", ""), error
+                    )
+            await asyncio.sleep(interval)
+
+    async def refresh_jwks(self) -> None:
+        result, error = await iam_service.get_jwksv3_async(sdk=self.sdk)
+        if error:
+            raise Exception(error)
+
+        keys = result.to_dict().get(AsyncJWKSCache.JWKS_KEYS_KEY, [])
+        # loading the keys is CPU bound, keep it off the event loop.
+        await self.run_in_executor(functools.partial(self.jwks_cache.add_keys, keys))
+
+    async def refresh_revocation_list(self) -> None:
+        await self.revocation_index_cache.refresh()
+
+
+def create_async_token_validator(
+    token_validator: Union[AsyncTokenValidatorProtocol, TokenValidatorProtocol],
+    **kwargs,
+) -> AsyncTokenValidatorProtocol:
+    if isinstance(token_validator, AsyncTokenValidatorProtocol):
+        return token_validator
+    return ExecutorTokenValidator(token_validator=token_validator, **kwargs)
+
+
+__all__ = [
+    "AccessTokenClaims",
+    "AsyncCachingTokenValidator",
+    "AsyncClaimsTokenValidatorProtocol",
+    "AsyncJWKSCache",
+    "AsyncTokenValidatorProtocol",
+    "ExecutorTokenValidator",
+    "RevocationListObservable",
+    "JWTClaims",
+    "create_async_token_validator",
+]
@@ -0,0 +1,295 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import threading
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import Link, SpanContext, SpanKind, TraceFlags, get_current_span
+from opentelemetry.trace.status import StatusCode
+from opentelemetry.util.types import Attributes
+from prometheus_client import Counter
+
+
+class SpansDroppedCounter:
+    """The spans that were ended but not exported, by reason."""
+
+    def __init__(self) -> None:
+        self.counter = Counter(
+            name="otel_spans_dropped",
+            documentation="number of ended spans that were not exported",
+            labelnames=["reason"],
+            unit="count",
+        )
+
+    def inc(self, reason: str, count: int = 1) -> None:
+        self.counter.labels(reason=reason).inc(count)
+
+
+class MethodRatioSampler(Sampler):
+    """Samples root spans by the ratio of their method (the span name of gRPC
+    server spans, e.g. '/package.Service/Method'), and other spans as their
+    parent was.
+
+    Ratios are looked up by full method name, then by service
+    ('/package.Service/*'), then 'ratio' applies. A method or service ratio
+    of 0 drops the span even if its parent was sampled; a 'ratio' of 0 only
+    applies to root spans.
+
+    With 'record_unsampled', spans that are not sampled are still recorded
+    (but not propagated as sampled), so that TailSamplingSpanProcessor can
+    keep them if they turn out slow or failed."""
+
+    def __init__(
+        self,
+        ratio: float = 1.0,
+        method_ratios: Optional[Dict[str, float]] = None,
+        record_unsampled: bool = False,
+    ) -> None:
+        self.ratio = ratio
+        self.method_ratios = dict(method_ratios or {})
+        self.record_unsampled = record_unsampled
+
+        # name -> (trace ID bound, whether a method or service ratio matched),
+        # spans whose trace ID is below the bound are sampled.
+        self.bounds: Dict[str, Tuple[int, bool]] = {}
+
+    def get_bound(self, name: str) -> Tuple[int, bool]:
+        result = self.bounds.get(name, None)
+        if result is None:
+            service = name.rsplit("/", 1)[0] + "/*"
+            ratio = self.method_ratios.get(name, self.method_ratios.get(service, None))
+            is_matched = ratio is not None
+            if ratio is None:
+                ratio = self.ratio
+            bound = TraceIdRatioBased.get_bound_for_rate(max(0.0, min(1.0, ratio)))
+            result = bound, is_matched
+            # span names are bounded by the methods served and called.
+            self.bounds[name] = result
+        return result
+
+    def should_sample(
+        self,
+        parent_context: Optional[Context],
+        trace_id: int,
+        name: str,
+        kind: Optional[SpanKind] = None,
+        attributes: Attributes = None,
+        links: Optional[Sequence[Link]] = None,
+        trace_state=None,
+    ) -> SamplingResult:
+        parent_span = get_current_span(parent_context)
+        parent_span_context = parent_span.get_span_context()
+        parent_trace_state = parent_span_context.trace_state if parent_span_context.is_valid else None
+
+        bound, is_matched = self.get_bound(name)
+        if bound == 0 and is_matched:
+            decision = Decision.DROP
+        elif not parent_span_context.is_valid:
+            sampled = trace_id & TraceIdRatioBased.TRACE_ID_LIMIT < bound
+            decision = Decision.RECORD_AND_SAMPLE if sampled else self.get_unsampled_decision()
+        elif parent_span_context.trace_flags.sampled:
+            decision = Decision.RECORD_AND_SAMPLE
+        elif parent_span_context.is_remote or parent_span.is_recording():
+            decision = self.get_unsampled_decision()
+        else:
+            # the local parent was dropped.
+            decision = Decision.DROP
+
+        return SamplingResult(
+            decision,
+            attributes if decision != Decision.DROP else None,
+            parent_trace_state,
+        )
+
+    def get_unsampled_decision(self) -> Decision:
+        return Decision.RECORD_ONLY if self.record_unsampled else Decision.DROP
+
+    def get_description(self) -> str:
+        return "MethodRatioSampler{{{},{}}}".format(self.ratio, self.method_ratios)
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Forwards sampled spans to 'span_processor' as they end, and keeps the
+    recorded but unsampled spans of a trace until its local root span ends.
+
+    If the local root took at least 'latency_threshold' seconds, or any of
+    the spans failed, they are all forwarded (as sampled); otherwise they are
+    discarded. At most 'max_traces' traces are kept at once, each of at most
+    'max_spans_per_trace' spans; the oldest trace is discarded first."""
+
+    DEFAULT_LATENCY_THRESHOLD: float = 1.0
+    DEFAULT_MAX_TRACES: int = 1000
+    DEFAULT_MAX_SPANS_PER_TRACE: int = 128
+
+    def __init__(
+        self,
+        span_processor: SpanProcessor,
+        latency_threshold: Optional[float] = None,
+        max_traces: Optional[int] = None,
+        max_spans_per_trace: Optional[int] = None,
+        spans_dropped: Optional[SpansDroppedCounter] = None,
+    ) -> None:
+        if latency_threshold is None:
+            latency_threshold = self.DEFAULT_LATENCY_THRESHOLD
+
+        if max_traces is None:
+            max_traces = self.DEFAULT_MAX_TRACES
+
+        if max_spans_per_trace is None:
+            max_spans_per_trace = self.DEFAULT_MAX_SPANS_PER_TRACE
+
+        self.span_processor = span_processor
+        self.latency_threshold_ns = int(latency_threshold * 1e9)
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+        self.spans_dropped = spans_dropped
+
+        self.traces: "OrderedDict[int, List[ReadableSpan]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+        self.spans_kept = Counter(
+            name="otel_tail_sampled_spans",
+            documentation="number of unsampled spans exported because their trace was slow or failed",
+            unit="count",
+        )
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        self.span_processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        span_context = span.context
+        if span_context.trace_flags.sampled:
+            self.span_processor.on_end(span)
+            return
+
+        trace_id = span_context.trace_id
+        is_local_root = span.parent is None or span.parent.is_remote
+        with self.lock:
+            spans = self.traces.pop(trace_id, None)
+            if not is_local_root:
+                if spans is None:
+                    spans = []
+                    if len(self.traces) >= self.max_traces:
+                        _, evicted = self.traces.popitem(last=False)
+                        self.on_dropped("tail_buffer_full", len(evicted))
+                if len(spans) < self.max_spans_per_trace:
+                    spans.append(span)
+                else:
+                    self.on_dropped("tail_buffer_full")
+                # the most recently ended trace is evicted last.
+                self.traces[trace_id] = spans
+                return
+
+        spans = spans or []
+        spans.append(span)
+        if not self.should_keep(span, spans):
+            return
+        self.spans_kept.inc(len(spans))
+        for kept in spans:
+            self.span_processor.on_end(as_sampled(kept))
+
+    def should_keep(self, root: ReadableSpan, spans: List[ReadableSpan]) -> bool:
+        if (root.end_time or 0) - (root.start_time or 0) >= self.latency_threshold_ns:
+            return True
+        return any(s.status.status_code == StatusCode.ERROR for s in spans)
+
+    def on_dropped(self, reason: str, count: int = 1) -> None:
+        if self.spans_dropped is not None:
+            self.spans_dropped.inc(reason, count)
+
+    def shutdown(self) -> None:
+        self.span_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.span_processor.force_flush(timeout_millis)
+
+
+class CountingBatchSpanProcessor(BatchSpanProcessor):
+    """A BatchSpanProcessor that counts the spans it drops because its queue
+    is full (it otherwise only logs a warning the first time)."""
+
+    def __init__(
+        self,
+        span_exporter: SpanExporter,
+        spans_dropped: SpansDroppedCounter,
+        **kwargs,
+    ) -> None:
+        super().__init__(
+            span_exporter=CountingSpanExporter(span_exporter, spans_dropped), **kwargs
+        )
+        self.spans_dropped = spans_dropped
+
+    def on_end(self, span: ReadableSpan) -> None:
+        # the queue is a bounded deque, appending to a full one drops the oldest span.
+        if (
+            not self.done
+            and span.context.trace_flags.sampled
+            and len(self.queue) >= self.max_queue_size
+        ):
+            self.spans_dropped.inc("queue_full")
+        super().on_end(span)
+
+
+class CountingSpanExporter(SpanExporter):
+    """Counts the spans of failed exports."""
+
+    def __init__(self, span_exporter: SpanExporter, spans_dropped: SpansDroppedCounter) -> None:
+        self.span_exporter = span_exporter
+        self.spans_dropped = spans_dropped
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        result = self.span_exporter.export(spans)
+        if result != SpanExportResult.SUCCESS:
+            self.spans_dropped.inc("export_failed", len(spans))
+        return result
+
+    def shutdown(self) -> None:
+        self.span_exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.span_exporter.force_flush(timeout_millis)
+
+
+def as_sampled(span: ReadableSpan) -> ReadableSpan:
+    span_context = span.context
+    return ReadableSpan(
+        name=span.name,
+        context=SpanContext(
+            trace_id=span_context.trace_id,
+            span_id=span_context.span_id,
+            is_remote=span_context.is_remote,
+            trace_flags=TraceFlags(TraceFlags.SAMPLED),
+            trace_state=span_context.trace_state,
+        ),
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+__all__ = [
+    "CountingBatchSpanProcessor",
+    "CountingSpanExporter",
+    "MethodRatioSampler",
+    "SpansDroppedCounter",
+    "TailSamplingSpanProcessor",
+]
@@ -2,10 +2,13 @@
 # This is licensed software from AccelByte Inc, for limitations
 # and restrictions contact your company contract manager.
 
+import inspect
+
 from logging import Logger
-from typing import Any, Dict, Optional, Set
+from typing import Any, Callable, Dict, Optional, Set
 
-from grpc import HandlerCallDetails
+import grpc
+from grpc import HandlerCallDetails, RpcMethodHandler
 
 from environs import Env
 
@@ -55,6 +58,79 @@ def get_headers_from_metadata(handler_call_details: HandlerCallDetails) -> Dict[
     return headers
 
 
+def wrap_rpc_method_handler(
+    handler: Optional[RpcMethodHandler],
+    wrapper: Callable[[Callable], Callable],
+) -> Optional[RpcMethodHandler]:
+    if handler is None:
+        return None
+    if handler.unary_unary:
+        return grpc.unary_unary_rpc_method_handler(
+            wrapper(handler.unary_unary),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+    if handler.unary_stream:
+        return grpc.unary_stream_rpc_method_handler(
+            wrapper(handler.unary_stream),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+    if handler.stream_unary:
+        return grpc.stream_unary_rpc_method_handler(
+            wrapper(handler.stream_unary),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+    if handler.stream_stream:
+        return grpc.stream_stream_rpc_method_handler(
+            wrapper(handler.stream_stream),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+    return handler
+
+
+def wrap_rpc_behavior(
+    behavior: Callable,
+    before: Callable[[], Any],
+    after: Callable[[Any, Optional[BaseException]], None],
+) -> Callable:
+    """Wraps a gRPC method behavior (coroutine or async generator function) so
+    that 'before' runs right before it starts and 'after' runs once it ends,
+    on the same task that serves the RPC."""
+    if inspect.isasyncgenfunction(behavior):
+        async def wrapped_async_gen(request_or_iterator, context):
+            state = before()
+            error: Optional[BaseException] = None
+            try:
+                async for response in behavior(request_or_iterator, context):
+                    yield response
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                after(state, error)
+
+        return wrapped_async_gen
+
+    async def wrapped(request_or_iterator, context):
+        state = before()
+        error: Optional[BaseException] = None
+        try:
+            result = behavior(request_or_iterator, context)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            after(state, error)
+
+    return wrapped
+
+
 def get_propagator_header_keys() -> Set[str]:
     return get_global_textmap().fields
 
@@ -91,4 +167,6 @@ __all__ = [
     "get_headers_from_metadata",
     "get_propagator_header_keys",
     "instrument_sdk_http_client",
+    "wrap_rpc_behavior",
+    "wrap_rpc_method_handler",
 ]
@@ -0,0 +1,128 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import multiprocessing
+import os
+import signal
+import tempfile
+import time
+
+from logging import Logger
+from multiprocessing.process import BaseProcess
+from typing import Callable, List, Optional
+
+PROMETHEUS_MULTIPROC_DIR_ENV: str = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def setup_prometheus_multiprocess_dir() -> str:
+    # must be set before prometheus_client is imported by any worker process.
+    path = os.environ.get(PROMETHEUS_MULTIPROC_DIR_ENV, None)
+    if not path:
+        path = tempfile.mkdtemp(prefix="prometheus-multiproc-")
+        os.environ[PROMETHEUS_MULTIPROC_DIR_ENV] = path
+    else:
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if name.endswith(".db"):
+                os.remove(os.path.join(path, name))
+    return path
+
+
+class WorkerPool:
+    """Runs 'target(index)' in N separate processes and shuts them down together.
+
+    Workers are started with the 'spawn' method since gRPC does not support
+    forking a process once its core has been initialized."""
+
+    DEFAULT_SHUTDOWN_TIMEOUT: float = 30.0
+
+    def __init__(
+        self,
+        target: Callable[[int], None],
+        workers: int,
+        shutdown_timeout: Optional[float] = None,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        if shutdown_timeout is None:
+            shutdown_timeout = self.DEFAULT_SHUTDOWN_TIMEOUT
+
+        self.target = target
+        self.workers = workers
+        self.shutdown_timeout = shutdown_timeout
+        self.logger = logger
+
+        self.processes: List[BaseProcess] = []
+        self.is_stopping: bool = False
+
+    def start(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        for index in range(self.workers):
+            process = context.Process(
+                target=self.target, args=(index,), name=f"worker-{index}"
+            )
+            process.start()
+            self.processes.append(process)
+            if self.logger:
+                self.logger.info("worker %d started (pid: %s)", index, process.pid)
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self.on_signal)
+        signal.signal(signal.SIGINT, self.on_signal)
+
+        self.start()
+
+        exit_code = 0
+        # if any worker exits, take the whole pool down with it.
+        while not self.is_stopping:
+            exited = [p for p in self.processes if not p.is_alive()]
+            if exited:
+                exit_code = exited[0].exitcode or 0
+                if self.logger:
+                    self.logger.warning(
+                        "worker %s exited with code %s", exited[0].name, exited[0].exitcode
+                    )
+                break
+            time.sleep(0.5)
+
+        self.stop()
+        return exit_code
+
+    def stop(self) -> None:
+        self.is_stopping = True
+        for process in self.processes:
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.shutdown_timeout
+        for process in self.processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                if self.logger:
+                    self.logger.warning("worker %s did not stop in time", process.name)
+                process.kill()
+                process.join()
+            self.mark_process_dead(process)
+
+    def on_signal(self, signum, frame) -> None:
+        if self.logger:
+            self.logger.info("received signal %d, stopping workers", signum)
+        self.is_stopping = True
+
+    @staticmethod
+    def mark_process_dead(process: BaseProcess) -> None:
+        if not os.environ.get(PROMETHEUS_MULTIPROC_DIR_ENV, None):
+            return
+        try:
+            from prometheus_client import multiprocess
+
+            multiprocess.mark_process_dead(process.pid)
+        except ImportError:
+            pass
+
+
+__all__ = [
+    "PROMETHEUS_MULTIPROC_DIR_ENV",
+    "WorkerPool",
+    "setup_prometheus_multiprocess_dir",
+]
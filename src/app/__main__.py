@@ -4,6 +4,8 @@
 
 import asyncio
 import logging
+import signal
+import sys
 
 from logging import Logger
 from typing import List, Optional
@@ -22,49 +24,135 @@ from accelbyte_py_sdk.services import auth as auth_service
 from accelbyte_grpc_plugin.app import (
     App,
     AppOption,
+    AppOptionApplyOrderEnum,
+    AppOptionFunc,
     AppOptionGRPCInterceptor,
     AppOptionGRPCService,
 )
+from accelbyte_grpc_plugin.event_loop import (
+    EventLoopType,
+    get_event_loop_type,
+    run_event_loop,
+)
+from accelbyte_grpc_plugin.hedging import HedgingPolicy
+from accelbyte_grpc_plugin.http_client import create_httpx_http_client
+from accelbyte_grpc_plugin.payload_logging import PayloadLogger
+from accelbyte_grpc_plugin.resilience import CircuitBreaker, RetryBudget, SDKCallPolicy
+from accelbyte_grpc_plugin.sdk import AsyncAccelByteSDK, LoginTimerTask
 from accelbyte_grpc_plugin.utils import instrument_sdk_http_client
 
 from .proto.service_pb2_grpc import add_ServiceServicer_to_server
+from .services.guild_progress_cache import (
+    GuildProgressCacheProtocol,
+    InMemoryGuildProgressCache,
+)
+from .services.guild_progress_hub import OverflowPolicy
 from .services.my_service import AsyncService
 from .utils import create_env
 
 
 DEFAULT_APP_PORT: int = 6565
+DEFAULT_APP_WORKERS: int = 1
+DEFAULT_APP_SHUTDOWN_GRACE: float = 10.0
+# "asyncio" or "uvloop" (falls back to "asyncio" when uvloop is not installed).
+DEFAULT_APP_EVENT_LOOP: str = "asyncio"
 
 DEFAULT_AB_BASE_URL: str = "https://test.accelbyte.io"
 DEFAULT_AB_NAMESPACE: str = "accelbyte"
 
 DEFAULT_ENABLE_HEALTH_CHECK: bool = True
+DEFAULT_ENABLE_LOKI: bool = False
+DEFAULT_ENABLE_LOOP_MONITOR: bool = True
+DEFAULT_ENABLE_PROFILING: bool = False
 DEFAULT_ENABLE_PROMETHEUS: bool = True
 DEFAULT_ENABLE_REFLECTION: bool = True
 DEFAULT_ENABLE_ZIPKIN: bool = True
 
+DEFAULT_SDK_HTTP_HTTP2: bool = True
+DEFAULT_SDK_HTTP_MAX_CONNECTIONS: int = 100
+DEFAULT_SDK_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+DEFAULT_SDK_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+DEFAULT_SDK_HTTP_CONNECT_TIMEOUT: float = 5.0
+DEFAULT_SDK_HTTP_READ_TIMEOUT: float = 30.0
+DEFAULT_SDK_HTTP_WRITE_TIMEOUT: float = 30.0
+DEFAULT_SDK_HTTP_POOL_TIMEOUT: float = 5.0
+DEFAULT_SDK_HTTP_DNS_CACHE_TTL: float = 60.0
+
 DEFAULT_PLUGIN_GRPC_SERVER_AUTH_ENABLED: bool = True
 DEFAULT_PLUGIN_GRPC_SERVER_AUTH_RESOURCE: Optional[str] = None
 DEFAULT_PLUGIN_GRPC_SERVER_AUTH_ACTION: Optional[int] = None
+DEFAULT_PLUGIN_GRPC_SERVER_AUTH_CACHE_MAX_SIZE: int = 10000
+DEFAULT_PLUGIN_GRPC_SERVER_AUTH_CACHE_TTL: float = 60.0
+DEFAULT_PLUGIN_GRPC_SERVER_AUTH_VALIDATOR_MAX_WORKERS: int = 4
+DEFAULT_PLUGIN_GRPC_SERVER_AUTH_VALIDATOR_MAX_IN_FLIGHT: int = 64
+
+DEFAULT_PLUGIN_GRPC_SERVER_CONCURRENCY_LIMIT_ENABLED: bool = False
+DEFAULT_PLUGIN_GRPC_SERVER_CONCURRENCY_LIMIT_INITIAL: int = 20
+DEFAULT_PLUGIN_GRPC_SERVER_CONCURRENCY_LIMIT_MIN: int = 1
+DEFAULT_PLUGIN_GRPC_SERVER_CONCURRENCY_LIMIT_MAX: int = 1000
+DEFAULT_PLUGIN_GRPC_SERVER_CONCURRENCY_LIMIT_TOLERANCE: float = 1.5
+
+DEFAULT_PLUGIN_GRPC_SERVER_DEADLINE_ENABLED: bool = True
 
 DEFAULT_PLUGIN_GRPC_SERVER_LOGGING_ENABLED: bool = False
 DEFAULT_PLUGIN_GRPC_SERVER_METRICS_ENABLED: bool = True
 
+DEFAULT_PLUGIN_GRPC_SERVER_PAYLOAD_LOGGING_ENABLED: bool = False
+DEFAULT_PLUGIN_GRPC_SERVER_PAYLOAD_LOGGING_SAMPLE_RATE: float = 1.0
+DEFAULT_PLUGIN_GRPC_SERVER_PAYLOAD_LOGGING_MAX_QUEUE_SIZE: int = 1000
+
+DEFAULT_SDK_RETRY_MAX_ATTEMPTS: int = 3
+DEFAULT_SDK_RETRY_BASE_DELAY: float = 0.05
+DEFAULT_SDK_RETRY_MAX_DELAY: float = 1.0
+DEFAULT_SDK_RETRY_BUDGET_RATIO: float = 0.1
+DEFAULT_SDK_RETRY_BUDGET_MIN_PER_SECOND: float = 10.0
+
+DEFAULT_SDK_CIRCUIT_BREAKER_ENABLED: bool = True
+DEFAULT_SDK_CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+DEFAULT_SDK_CIRCUIT_BREAKER_RESET_TIMEOUT: float = 10.0
+
+DEFAULT_SDK_HEDGING_ENABLED: bool = False
+DEFAULT_SDK_HEDGING_PERCENTILE: float = 0.95
+DEFAULT_SDK_HEDGING_MIN_DELAY: float = 0.005
+DEFAULT_SDK_HEDGING_MAX_RATIO: float = 0.05
+
+# GUILD_PROGRESS_CACHE_ENABLED is opt-in: reads may be up to GUILD_PROGRESS_CACHE_TTL
+# seconds stale. Writes only invalidate the cache of the process that handled them,
+# with WORKERS > 1 or several replicas the other processes keep serving the old value
+# until it expires.
+DEFAULT_GUILD_PROGRESS_CACHE_ENABLED: bool = False
+DEFAULT_GUILD_PROGRESS_CACHE_MAX_SIZE: int = 10000
+DEFAULT_GUILD_PROGRESS_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+DEFAULT_GUILD_PROGRESS_CACHE_TTL: float = 5.0
+
+DEFAULT_GUILD_PROGRESS_BATCH_MAX_CONCURRENCY: int = 16
+
+DEFAULT_GUILD_PROGRESS_INCREMENT_MAX_ATTEMPTS: int = 5
+
+DEFAULT_GUILD_PROGRESS_WATCH_POLL_INTERVAL: float = 5.0
+DEFAULT_GUILD_PROGRESS_WATCH_MAX_QUEUE_SIZE: int = 32
+DEFAULT_GUILD_PROGRESS_WATCH_OVERFLOW_POLICY: str = "conflate"
+
+DEFAULT_GUILD_PROGRESS_WRITE_BEHIND_ENABLED: bool = False
+DEFAULT_GUILD_PROGRESS_WRITE_BEHIND_WINDOW: float = 0.01
+DEFAULT_GUILD_PROGRESS_WRITE_BEHIND_MAX_BATCH_SIZE: int = 64
+
 
 async def main(**kwargs) -> None:
     env = create_env(**kwargs)
 
     port: int = env.int("PORT", DEFAULT_APP_PORT)
+    shutdown_grace: float = env.float("SHUTDOWN_GRACE", DEFAULT_APP_SHUTDOWN_GRACE)
+    worker: Optional[int] = kwargs.get("worker", None)
 
-    logger = logging.getLogger("app")
-    logger.setLevel(logging.INFO)
-    logger.addHandler(logging.StreamHandler())
+    logger = create_logger()
 
     config = DictConfigRepository(dict(env.dump()))
     token = InMemoryTokenRepository()
-    http = HttpxHttpClient()
-    http.client.follow_redirects = True
+    http = create_sdk_http_client(env=env, logger=logger)
 
-    sdk = AccelByteSDK()
+    # sends '*_async' calls without blocking the loop and bounds them by the RPC deadline.
+    sdk = AsyncAccelByteSDK()
     sdk.initialize(
         options={
             "config": config,
@@ -79,25 +167,106 @@ async def main(**kwargs) -> None:
     if error:
         raise Exception(str(error))
 
-    sdk.timer = auth_service.LoginClientTimer(5, refresh_rate=0.8, repeats=-1, autostart=True, sdk=sdk)
+    # not started, it is run on this loop (with the async HTTP client) by 'login_timer'.
+    sdk.timer = auth_service.LoginClientTimer(5, refresh_rate=0.8, repeats=-1, sdk=sdk)
+    login_timer = LoginTimerTask(timer=sdk.timer, interval=5, logger=logger)
 
-    options = create_options(sdk=sdk, env=env, logger=logger)
+    write_behind_window: Optional[float] = None
+    write_behind_max_batch_size: Optional[int] = None
+    with env.prefixed("GUILD_PROGRESS_WRITE_BEHIND_"):
+        if env.bool("ENABLED", DEFAULT_GUILD_PROGRESS_WRITE_BEHIND_ENABLED):
+            write_behind_window = env.float(
+                "WINDOW", DEFAULT_GUILD_PROGRESS_WRITE_BEHIND_WINDOW
+            )
+            write_behind_max_batch_size = env.int(
+                "MAX_BATCH_SIZE", DEFAULT_GUILD_PROGRESS_WRITE_BEHIND_MAX_BATCH_SIZE
+            )
+
+    with env.prefixed("GUILD_PROGRESS_WATCH_"):
+        # 0 disables polling, only writes made by this process are streamed.
+        watch_poll_interval = env.float(
+            "POLL_INTERVAL", DEFAULT_GUILD_PROGRESS_WATCH_POLL_INTERVAL
+        )
+        watch_max_queue_size = env.int(
+            "MAX_QUEUE_SIZE", DEFAULT_GUILD_PROGRESS_WATCH_MAX_QUEUE_SIZE
+        )
+        watch_overflow_policy = OverflowPolicy(
+            env.str("OVERFLOW_POLICY", DEFAULT_GUILD_PROGRESS_WATCH_OVERFLOW_POLICY)
+        )
+
+    payload_logger = create_payload_logger(env=env, logger=logger)
+
+    service = AsyncService(
+        sdk=sdk,
+        logger=logger,
+        cache=create_guild_progress_cache(env=env),
+        write_behind_window=write_behind_window,
+        write_behind_max_batch_size=write_behind_max_batch_size,
+        batch_max_concurrency=env.int(
+            "GUILD_PROGRESS_BATCH_MAX_CONCURRENCY",
+            DEFAULT_GUILD_PROGRESS_BATCH_MAX_CONCURRENCY,
+        ),
+        watch_poll_interval=watch_poll_interval,
+        watch_max_queue_size=watch_max_queue_size,
+        watch_overflow_policy=watch_overflow_policy,
+        increment_max_attempts=env.int(
+            "GUILD_PROGRESS_INCREMENT_MAX_ATTEMPTS",
+            DEFAULT_GUILD_PROGRESS_INCREMENT_MAX_ATTEMPTS,
+        ),
+        sdk_call_policy=create_sdk_call_policy(env=env, logger=logger),
+        hedging_policy=create_hedging_policy(env=env),
+        payload_logger=payload_logger,
+    )
+
+    options = create_options(
+        sdk=sdk, env=env, logger=logger, worker=worker, payload_logger=payload_logger
+    )
     options.append(
         AppOptionGRPCService(
             full_name=AsyncService.full_name,
-            service=AsyncService(sdk=sdk, logger=logger),
+            service=service,
             add_service_fn=add_ServiceServicer_to_server,
         )
     )
 
     app = App(port=port, env=env, logger=logger, options=options)
+    if worker is not None:
+        # every worker binds the same port, the kernel balances connections between them.
+        app.grpc_server_options.append(("grpc.so_reuseport", 1))
+
+    app.add_startup_callback(login_timer.start)
+    app.add_shutdown_callback(login_timer.stop)
+
+    # pending write-behind batches are flushed once in-flight RPCs have drained.
+    app.add_shutdown_callback(service.close)
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(
+            signum, lambda: asyncio.ensure_future(app.stop(grace=shutdown_grace))
+        )
 
     logger.info(f"using {get_version(latest=True, full=True)}")
+    logger.info(f"using the {get_event_loop_type(loop).value} event loop")
 
     await app.run()
 
 
-def create_options(sdk: AccelByteSDK, env: Env, logger: Logger) -> List[AppOption]:
+def create_logger() -> Logger:
+    logger = logging.getLogger("app")
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
+    return logger
+
+
+def create_options(
+    sdk: AccelByteSDK,
+    env: Env,
+    logger: Logger,
+    worker: Optional[int] = None,
+    payload_logger: Optional[PayloadLogger] = None,
+) -> List[AppOption]:
     options: List[AppOption] = []
 
     with env.prefixed("AB_"):
@@ -110,10 +279,23 @@ def create_options(sdk: AccelByteSDK, env: Env, logger: Logger) -> List[AppOptio
             )
 
             options.append(AppOptionGRPCHealthCheck())
+        if env.bool("LOKI", DEFAULT_ENABLE_LOKI):
+            from accelbyte_grpc_plugin.options.loki import AppOptionLoki
+
+            options.append(AppOptionLoki())
+        if env.bool("LOOP_MONITOR", DEFAULT_ENABLE_LOOP_MONITOR):
+            from accelbyte_grpc_plugin.options.loop_monitor import AppOptionLoopMonitor
+
+            options.append(AppOptionLoopMonitor())
+        if env.bool("PROFILING", DEFAULT_ENABLE_PROFILING):
+            from accelbyte_grpc_plugin.options.profiling import AppOptionProfiling
+
+            # served on the metrics port, requires 'PROFILING_TOKEN'.
+            options.append(AppOptionProfiling())
         if env.bool("PROMETHEUS", DEFAULT_ENABLE_PROMETHEUS):
             from accelbyte_grpc_plugin.options.prometheus import AppOptionPrometheus
 
-            options.append(AppOptionPrometheus())
+            options.append(AppOptionPrometheus(worker=worker))
         if env.bool("REFLECTION", DEFAULT_ENABLE_REFLECTION):
             from accelbyte_grpc_plugin.options.grpc_reflection import (
                 AppOptionGRPCReflection,
@@ -126,23 +308,86 @@ def create_options(sdk: AccelByteSDK, env: Env, logger: Logger) -> List[AppOptio
             options.append(AppOptionZipkin())
 
     with env.prefixed("PLUGIN_GRPC_SERVER_"):
+        with env.prefixed("CONCURRENCY_LIMIT_"):
+            if env.bool("ENABLED", DEFAULT_PLUGIN_GRPC_SERVER_CONCURRENCY_LIMIT_ENABLED):
+                from accelbyte_grpc_plugin.options.concurrency_limit import (
+                    AppOptionConcurrencyLimit,
+                )
+
+                options.append(
+                    AppOptionConcurrencyLimit(
+                        initial_limit=env.int(
+                            "INITIAL", DEFAULT_PLUGIN_GRPC_SERVER_CONCURRENCY_LIMIT_INITIAL
+                        ),
+                        min_limit=env.int(
+                            "MIN", DEFAULT_PLUGIN_GRPC_SERVER_CONCURRENCY_LIMIT_MIN
+                        ),
+                        max_limit=env.int(
+                            "MAX", DEFAULT_PLUGIN_GRPC_SERVER_CONCURRENCY_LIMIT_MAX
+                        ),
+                        tolerance=env.float(
+                            "TOLERANCE", DEFAULT_PLUGIN_GRPC_SERVER_CONCURRENCY_LIMIT_TOLERANCE
+                        ),
+                        maximum_concurrent_rpcs=env.int("MAX_CONCURRENT_RPCS", None),
+                    )
+                )
+
+        if env.bool("DEADLINE_ENABLED", DEFAULT_PLUGIN_GRPC_SERVER_DEADLINE_ENABLED):
+            from accelbyte_grpc_plugin.deadlines import DeadlineServerInterceptor
+
+            options.append(
+                AppOptionGRPCInterceptor(interceptor=DeadlineServerInterceptor())
+            )
+
         with env.prefixed("AUTH_"):
             if env.bool("ENABLED", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_ENABLED):
-                from accelbyte_py_sdk.token_validation.caching import CachingTokenValidator
                 from accelbyte_grpc_plugin.interceptors.authorization import AuthorizationServerInterceptor
+                from accelbyte_grpc_plugin.token_validation import AsyncCachingTokenValidator
+
+                token_validator = AsyncCachingTokenValidator(
+                    sdk=sdk,
+                    max_workers=env.int(
+                        "VALIDATOR_MAX_WORKERS",
+                        DEFAULT_PLUGIN_GRPC_SERVER_AUTH_VALIDATOR_MAX_WORKERS,
+                    ),
+                    max_in_flight=env.int(
+                        "VALIDATOR_MAX_IN_FLIGHT",
+                        DEFAULT_PLUGIN_GRPC_SERVER_AUTH_VALIDATOR_MAX_IN_FLIGHT,
+                    ),
+                    logger=logger,
+                )
+                token_validator.start()
+
+                authorization_interceptor = AuthorizationServerInterceptor(
+                    resource=env.str(
+                        "RESOURCE", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_RESOURCE
+                    ),
+                    action=env.int(
+                        "ACTION", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_ACTION
+                    ),
+                    namespace=namespace,
+                    token_validator=token_validator,
+                    token_cache_max_size=env.int(
+                        "CACHE_MAX_SIZE", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_CACHE_MAX_SIZE
+                    ),
+                    token_cache_ttl=env.float(
+                        "CACHE_TTL", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_CACHE_TTL
+                    ),
+                )
 
                 options.append(
-                    AppOptionGRPCInterceptor(
-                        interceptor=AuthorizationServerInterceptor(
-                            resource=env.str(
-                                "RESOURCE", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_RESOURCE
-                            ),
-                            action=env.int(
-                                "ACTION", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_ACTION
-                            ),
-                            namespace=namespace,
-                            token_validator=CachingTokenValidator(sdk=sdk),
-                        )
+                    AppOptionGRPCInterceptor(interceptor=authorization_interceptor)
+                )
+                options.append(
+                    AppOptionFunc(
+                        "AuthorizationMethodPolicies",
+                        order=AppOptionApplyOrderEnum.ADD_GRPC_SERVICES,
+                        apply_fn=lambda app, *args, **kwargs: (
+                            authorization_interceptor.build_method_policies(
+                                service_names=app.grpc_service_names,
+                                logger=app.logger,
+                            )
+                        ),
                     )
                 )
         if env.bool("LOGGING_ENABLED", DEFAULT_PLUGIN_GRPC_SERVER_LOGGING_ENABLED):
@@ -156,20 +401,212 @@ def create_options(sdk: AccelByteSDK, env: Env, logger: Logger) -> List[AppOptio
                 )
             )
 
+        if payload_logger is not None:
+            from accelbyte_grpc_plugin.interceptors.payload_logging import (
+                PayloadLoggingServerInterceptor,
+            )
+
+            options.append(
+                AppOptionGRPCInterceptor(
+                    interceptor=PayloadLoggingServerInterceptor(
+                        payload_logger=payload_logger
+                    )
+                )
+            )
+
         if env.bool("METRICS_ENABLED", DEFAULT_PLUGIN_GRPC_SERVER_METRICS_ENABLED):
             from accelbyte_grpc_plugin.interceptors.metrics import (
                 MetricsServerInterceptor,
             )
 
+            # e.g. "0.005,0.01,0.05,0.1,0.5,1", defaults to MetricsServerInterceptor.DEFAULT_BUCKETS.
+            buckets = env.list("METRICS_BUCKETS", None, subcast=float)
             options.append(
-                AppOptionGRPCInterceptor(interceptor=MetricsServerInterceptor())
+                AppOptionGRPCInterceptor(
+                    interceptor=MetricsServerInterceptor(buckets=buckets or None)
+                )
             )
 
     return options
 
 
+def create_sdk_http_client(env: Env, logger: Logger) -> HttpxHttpClient:
+    with env.prefixed("ENABLE_"):
+        enable_prometheus = env.bool("PROMETHEUS", DEFAULT_ENABLE_PROMETHEUS)
+
+    with env.prefixed("SDK_HTTP_"):
+        return create_httpx_http_client(
+            http2=env.bool("HTTP2", DEFAULT_SDK_HTTP_HTTP2),
+            max_connections=env.int(
+                "MAX_CONNECTIONS", DEFAULT_SDK_HTTP_MAX_CONNECTIONS
+            ),
+            max_keepalive_connections=env.int(
+                "MAX_KEEPALIVE_CONNECTIONS", DEFAULT_SDK_HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=env.float(
+                "KEEPALIVE_EXPIRY", DEFAULT_SDK_HTTP_KEEPALIVE_EXPIRY
+            ),
+            connect_timeout=env.float(
+                "CONNECT_TIMEOUT", DEFAULT_SDK_HTTP_CONNECT_TIMEOUT
+            ),
+            read_timeout=env.float("READ_TIMEOUT", DEFAULT_SDK_HTTP_READ_TIMEOUT),
+            write_timeout=env.float("WRITE_TIMEOUT", DEFAULT_SDK_HTTP_WRITE_TIMEOUT),
+            pool_timeout=env.float("POOL_TIMEOUT", DEFAULT_SDK_HTTP_POOL_TIMEOUT),
+            # 0 disables the DNS cache.
+            dns_cache_ttl=env.float("DNS_CACHE_TTL", DEFAULT_SDK_HTTP_DNS_CACHE_TTL),
+            follow_redirects=True,
+            metrics=enable_prometheus,
+            logger=logger,
+        )
+
+
+def create_sdk_call_policy(env: Env, logger: Logger) -> SDKCallPolicy:
+    with env.prefixed("SDK_CIRCUIT_BREAKER_"):
+        if env.bool("ENABLED", DEFAULT_SDK_CIRCUIT_BREAKER_ENABLED):
+            failure_threshold = env.int(
+                "FAILURE_THRESHOLD", DEFAULT_SDK_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+            )
+            reset_timeout = env.float(
+                "RESET_TIMEOUT", DEFAULT_SDK_CIRCUIT_BREAKER_RESET_TIMEOUT
+            )
+            breaker_factory = lambda endpoint: CircuitBreaker(
+                failure_threshold=failure_threshold, reset_timeout=reset_timeout
+            )
+        else:
+            # never opens.
+            breaker_factory = lambda endpoint: CircuitBreaker(
+                failure_threshold=sys.maxsize
+            )
+
+    with env.prefixed("SDK_RETRY_"):
+        # 1 disables retries.
+        return SDKCallPolicy(
+            max_attempts=env.int("MAX_ATTEMPTS", DEFAULT_SDK_RETRY_MAX_ATTEMPTS),
+            base_delay=env.float("BASE_DELAY", DEFAULT_SDK_RETRY_BASE_DELAY),
+            max_delay=env.float("MAX_DELAY", DEFAULT_SDK_RETRY_MAX_DELAY),
+            retry_budget=RetryBudget(
+                ratio=env.float("BUDGET_RATIO", DEFAULT_SDK_RETRY_BUDGET_RATIO),
+                min_retries_per_second=env.float(
+                    "BUDGET_MIN_PER_SECOND", DEFAULT_SDK_RETRY_BUDGET_MIN_PER_SECOND
+                ),
+            ),
+            breaker_factory=breaker_factory,
+            logger=logger,
+        )
+
+
+def create_payload_logger(env: Env, logger: Logger) -> Optional[PayloadLogger]:
+    with env.prefixed("PLUGIN_GRPC_SERVER_PAYLOAD_LOGGING_"):
+        if not env.bool("ENABLED", DEFAULT_PLUGIN_GRPC_SERVER_PAYLOAD_LOGGING_ENABLED):
+            return None
+
+        # e.g. "/service.Service/GetGuildProgress=0.1,/grpc.health.v1.Health/*=0".
+        method_sample_rates = env.dict("METHOD_SAMPLE_RATES", {}, subcast_values=float)
+        # e.g. "namespace,guild_id", matched at any depth.
+        redact_fields = env.list("REDACT_FIELDS", [])
+        return PayloadLogger(
+            logger=logger,
+            sample_rate=env.float(
+                "SAMPLE_RATE", DEFAULT_PLUGIN_GRPC_SERVER_PAYLOAD_LOGGING_SAMPLE_RATE
+            ),
+            method_sample_rates=method_sample_rates,
+            redact_fields=redact_fields,
+            max_queue_size=env.int(
+                "MAX_QUEUE_SIZE", DEFAULT_PLUGIN_GRPC_SERVER_PAYLOAD_LOGGING_MAX_QUEUE_SIZE
+            ),
+        )
+
+
+def create_hedging_policy(env: Env) -> Optional[HedgingPolicy]:
+    with env.prefixed("SDK_HEDGING_"):
+        if not env.bool("ENABLED", DEFAULT_SDK_HEDGING_ENABLED):
+            return None
+
+        # a hedge is sent once a read is slower than 'PERCENTILE' of the recent ones.
+        return HedgingPolicy(
+            percentile=env.float("PERCENTILE", DEFAULT_SDK_HEDGING_PERCENTILE),
+            min_delay=env.float("MIN_DELAY", DEFAULT_SDK_HEDGING_MIN_DELAY),
+            max_ratio=env.float("MAX_RATIO", DEFAULT_SDK_HEDGING_MAX_RATIO),
+        )
+
+
+def create_guild_progress_cache(env: Env) -> Optional[GuildProgressCacheProtocol]:
+    with env.prefixed("GUILD_PROGRESS_CACHE_"):
+        if not env.bool("ENABLED", DEFAULT_GUILD_PROGRESS_CACHE_ENABLED):
+            return None
+
+        # 'TTL' bounds how stale a guild progress read can be.
+        return InMemoryGuildProgressCache(
+            max_size=env.int("MAX_SIZE", DEFAULT_GUILD_PROGRESS_CACHE_MAX_SIZE),
+            max_bytes=env.int("MAX_BYTES", DEFAULT_GUILD_PROGRESS_CACHE_MAX_BYTES),
+            ttl=env.float("TTL", DEFAULT_GUILD_PROGRESS_CACHE_TTL),
+        )
+
+
+def run_main(env: Env, **kwargs) -> None:
+    # the grpc.aio server, the SDK's async HTTP client and its login timer all share this loop.
+    run_event_loop(
+        main(**kwargs),
+        loop_type=EventLoopType(env.str("EVENT_LOOP", DEFAULT_APP_EVENT_LOOP)),
+        logger=create_logger(),
+    )
+
+
+def run_worker(index: int) -> None:
+    run_main(env=create_env(), worker=index)
+
+
+def run_workers(workers: int, env: Env) -> int:
+    from accelbyte_grpc_plugin.workers import WorkerPool, setup_prometheus_multiprocess_dir
+
+    logger = create_logger()
+
+    with env.prefixed("ENABLE_"):
+        enable_prometheus = env.bool("PROMETHEUS", DEFAULT_ENABLE_PROMETHEUS)
+
+    if enable_prometheus:
+        setup_prometheus_multiprocess_dir()
+
+        from accelbyte_grpc_plugin.options.prometheus import (
+            AppOptionPrometheus,
+            get_worker_port,
+            start_multiprocess_metrics_server,
+        )
+
+        with env.prefixed("PROMETHEUS_"):
+            start_multiprocess_metrics_server(
+                addr=env.str("ADDR", AppOptionPrometheus.DEFAULT_ADDR),
+                port=env.int("PORT", AppOptionPrometheus.DEFAULT_PORT),
+                endpoint=env.str("ENDPOINT", AppOptionPrometheus.DEFAULT_ENDPOINT),
+            )
+
+        if get_worker_port(env, 0) is None:
+            logger.warning(
+                "the OpenTelemetry metrics and the profiling endpoints of the workers are "
+                "not served, set PROMETHEUS_WORKER_BASE_PORT to serve them per worker"
+            )
+        else:
+            logger.info(
+                "workers serve their own metrics on ports %d-%d",
+                get_worker_port(env, 0),
+                get_worker_port(env, workers - 1),
+            )
+
+    pool = WorkerPool(
+        target=run_worker,
+        workers=workers,
+        shutdown_timeout=env.float("SHUTDOWN_GRACE", DEFAULT_APP_SHUTDOWN_GRACE) + 5,
+        logger=logger,
+    )
+    return pool.run()
+
+
 def run() -> None:
-    asyncio.run(main())
+    env = create_env()
+    workers = env.int("WORKERS", DEFAULT_APP_WORKERS)
+    if workers > 1:
+        sys.exit(run_workers(workers=workers, env=env))
+    run_main(env=env)
 
 
 if __name__ == "__main__":
@@ -16,7 +16,7 @@ from protoc_gen_openapiv2.options import annotations_pb2 as protoc__gen__openapi
 import permission_pb2 as permission__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rservice.proto\x12\x07service\x1a\x1cgoogle/api/annotations.proto\x1a.protoc-gen-openapiv2/options/annotations.proto\x1a\x10permission.proto\"g\n\"CreateOrUpdateGuildProgressRequest\x12\x11\n\tnamespace\x18\x01 \x01(\t\x12.\n\x0eguild_progress\x18\x02 \x01(\x0b\x32\x16.service.GuildProgress\"U\n#CreateOrUpdateGuildProgressResponse\x12.\n\x0eguild_progress\x18\x01 \x01(\x0b\x32\x16.service.GuildProgress\">\n\x17GetGuildProgressRequest\x12\x11\n\tnamespace\x18\x01 \x01(\t\x12\x10\n\x08guild_id\x18\x02 \x01(\t\"J\n\x18GetGuildProgressResponse\x12.\n\x0eguild_progress\x18\x01 \x01(\x0b\x32\x16.service.GuildProgress\"\xa3\x01\n\rGuildProgress\x12\x10\n\x08guild_id\x18\x01 \x01(\t\x12\x11\n\tnamespace\x18\x02 \x01(\t\x12:\n\nobjectives\x18\x03 \x03(\x0b\x32&.service.GuildProgress.ObjectivesEntry\x1a\x31\n\x0fObjectivesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x32\xe7\x04\n\x07Service\x12\xd0\x02\n\x1b\x43reateOrUpdateGuildProgress\x12+.service.CreateOrUpdateGuildProgressRequest\x1a,.service.CreateOrUpdateGuildProgressResponse\"\xd5\x01\x90\xb5\x18\x01\x8a\xb5\x18,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\x82\xd3\xe4\x93\x02-\"(/v1/admin/namespace/{namespace}/progress:\x01*\x92\x41k\x12\x18Update Guild progression\x1a\x41Update Guild progression if not existed yet will create a new oneb\x0c\n\n\n\x06\x42\x65\x61rer\x12\x00\x12\x88\x02\n\x10GetGuildProgress\x12 .service.GetGuildProgressRequest\x1a!.service.GetGuildProgressResponse\"\xae\x01\x90\xb5\x18\x02\x8a\xb5\x18,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\x82\xd3\xe4\x93\x02\x35\x12\x33/v1/admin/namespace/{namespace}/progress/{guild_id}\x92\x41<\x12\x15Get guild progression\x1a\x15Get guild progressionb\x0c\n\n\n\x06\x42\x65\x61rer\x12\x00\x42\xba\x01\n%net.accelbyte.extend.serviceextensionP\x01Z%accelbyte.net/extend/serviceextension\xaa\x02!AccelByte.Extend.ServiceExtension\x92\x41\x43\x12\x12\n\x0bService API2\x03\x31.0\"\x08/service*\x02\x01\x02Z\x1f\n\x1d\n\x06\x42\x65\x61rer\x12\x13\x08\x02\x1a\rAuthorization \x02\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rservice.proto\x12\x07service\x1a\x1cgoogle/api/annotations.proto\x1a.protoc-gen-openapiv2/options/annotations.proto\x1a\x10permission.proto\"g\n\"CreateOrUpdateGuildProgressRequest\x12\x11\n\tnamespace\x18\x01 \x01(\t\x12.\n\x0eguild_progress\x18\x02 \x01(\x0b\x32\x16.service.GuildProgress\"U\n#CreateOrUpdateGuildProgressResponse\x12.\n\x0eguild_progress\x18\x01 \x01(\x0b\x32\x16.service.GuildProgress\">\n\x17GetGuildProgressRequest\x12\x11\n\tnamespace\x18\x01 \x01(\t\x12\x10\n\x08guild_id\x18\x02 \x01(\t\"J\n\x18GetGuildProgressResponse\x12.\n\x0eguild_progress\x18\x01 \x01(\x0b\x32\x16.service.GuildProgress\"\xa3\x01\n\rGuildProgress\x12\x10\n\x08guild_id\x18\x01 \x01(\t\x12\x11\n\tnamespace\x18\x02 \x01(\t\x12:\n\nobjectives\x18\x03 \x03(\x0b\x32&.service.GuildProgress.ObjectivesEntry\x1a\x31\n\x0fObjectivesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"n\n\'BatchCreateOrUpdateGuildProgressRequest\x12\x11\n\tnamespace\x18\x01 \x01(\t\x12\x30\n\x10guild_progresses\x18\x02 \x03(\x0b\x32\x16.service.GuildProgress\"Y\n(BatchCreateOrUpdateGuildProgressResponse\x12-\n\x07results\x18\x01 \x03(\x0b\x32\x1c.service.GuildProgressResult\"D\n\x1c\x42\x61tchGetGuildProgressRequest\x12\x11\n\tnamespace\x18\x01 \x01(\t\x12\x11\n\tguild_ids\x18\x02 \x03(\t\"N\n\x1d\x42\x61tchGetGuildProgressResponse\x12-\n\x07results\x18\x01 \x03(\x0b\x32\x1c.service.GuildProgressResult\"\xc0\x01\n\x13GuildProgressResult\x12\x10\n\x08guild_id\x18\x01 \x01(\t\x12\x30\n\x0eguild_progress\x18\x02 \x01(\x0b\x32\x16.service.GuildProgressH\x00\x12\x33\n\x05\x65rror\x18\x03 \x01(\x0b\x32\".service.GuildProgressResult.ErrorH\x00\x1a&\n\x05\x45rror\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\tB\x08\n\x06result\"@\n\x19WatchGuildProgressRequest\x12\x11\n\tnamespace\x18\x01 \x01(\t\x12\x10\n\x08guild_id\x18\x02 \x01(\t\"^\n\x1aWatchGuildProgressResponse\x12.\n\x0eguild_progress\x18\x01 \x01(\x0b\x32\x16.service.GuildProgress\x12\x10\n\x08snapshot\x18\x02 \x01(\x08\"\xbb\x01\n\x1fIncrementGuildObjectivesRequest\x12\x11\n\tnamespace\x18\x01 \x01(\t\x12\x10\n\x08guild_id\x18\x02 \x01(\t\x12\x44\n\x06\x64\x65ltas\x18\x03 \x03(\x0b\x32\x34.service.IncrementGuildObjectivesRequest.DeltasEntry\x1a-\n\x0b\x44\x65ltasEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"R\n IncrementGuildObjectivesResponse\x12.\n\x0eguild_progress\x18\x01 \x01(\x0b\x32\x16.service.GuildProgress2\xb1\x10\n\x07Service\x12\xd0\x02\n\x1b\x43reateOrUpdateGuildProgress\x12+.service.CreateOrUpdateGuildProgressRequest\x1a,.service.CreateOrUpdateGuildProgressResponse\"\xd5\x01\x90\xb5\x18\x01\x8a\xb5\x18,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\x82\xd3\xe4\x93\x02-\"(/v1/admin/namespace/{namespace}/progress:\x01*\x92\x41k\x12\x18Update Guild progression\x1a\x41Update Guild progression if not existed yet will create a new oneb\x0c\n\n\n\x06\x42\x65\x61rer\x12\x00\x12\x88\x02\n\x10GetGuildProgress\x12 .service.GetGuildProgressRequest\x1a!.service.GetGuildProgressResponse\"\xae\x01\x90\xb5\x18\x02\x8a\xb5\x18,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\x82\xd3\xe4\x93\x02\x35\x12\x33/v1/admin/namespace/{namespace}/progress/{guild_id}\x92\x41<\x12\x15Get guild progression\x1a\x15Get guild progressionb\x0c\n\n\n\x06\x42\x65\x61rer\x12\x00\x12\x9b\x03\n BatchCreateOrUpdateGuildProgress\x12\x30.service.BatchCreateOrUpdateGuildProgressRequest\x1a\x31.service.BatchCreateOrUpdateGuildProgressResponse\"\x91\x02\x90\xb5\x18\x01\x8a\xb5\x18,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\x82\xd3\xe4\x93\x02\x39\"4/v1/admin/namespace/{namespace}/progress:batchUpdate:\x01*\x92\x41\x9a\x01\x12\x1e\x42\x61tch update Guild progression\x1ajUpdate multiple Guild progressions, creating the ones that do not exist yet. Errors are reported per item.b\x0c\n\n\n\x06\x42\x65\x61rer\x12\x00\x12\xc7\x02\n\x15\x42\x61tchGetGuildProgress\x12%.service.BatchGetGuildProgressRequest\x1a&.service.BatchGetGuildProgressResponse\"\xde\x01\x90\xb5\x18\x02\x8a\xb5\x18,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\x82\xd3\xe4\x93\x02\x36\"1/v1/admin/namespace/{namespace}/progress:batchGet:\x01*\x92\x41k\x12\x1b\x42\x61tch get guild progression\x1a>Get multiple guild progressions. Errors are reported per item.b\x0c\n\n\n\x06\x42\x65\x61rer\x12\x00\x12\xe4\x02\n\x12WatchGuildProgress\x12\".service.WatchGuildProgressRequest\x1a#.service.WatchGuildProgressResponse\"\x82\x02\x90\xb5\x18\x02\x8a\xb5\x18,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\x82\xd3\xe4\x93\x02;\x12\x39/v1/admin/namespace/{namespace}/progress/{guild_id}:watch\x92\x41\x89\x01\x12\x17Watch guild progression\x1a`Stream the guild progression, the first message is a snapshot followed by the changed objectivesb\x0c\n\n\n\x06\x42\x65\x61rer\x12\x00\x30\x01\x12\xf8\x02\n\x18IncrementGuildObjectives\x12(.service.IncrementGuildObjectivesRequest\x1a).service.IncrementGuildObjectivesResponse\"\x86\x02\x90\xb5\x18\x04\x8a\xb5\x18,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\x82\xd3\xe4\x93\x02M\"H/v1/admin/namespace/{namespace}/progress/{guild_id}/objectives:increment:\x01*\x92\x41|\x12\x1aIncrement guild objectives\x1aPAdd the given deltas to the guild objectives, missing objectives start from zerob\x0c\n\n\n\x06\x42\x65\x61rer\x12\x00\x42\xba\x01\n%net.accelbyte.extend.serviceextensionP\x01Z%accelbyte.net/extend/serviceextension\xaa\x02!AccelByte.Extend.ServiceExtension\x92\x41\x43\x12\x12\n\x0bService API2\x03\x31.0\"\x08/service*\x02\x01\x02Z\x1f\n\x1d\n\x06\x42\x65\x61rer\x12\x13\x08\x02\x1a\rAuthorization \x02\x62\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'service_pb2', globals())
@@ -26,10 +26,20 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._serialized_options = b'\n%net.accelbyte.extend.serviceextensionP\001Z%accelbyte.net/extend/serviceextension\252\002!AccelByte.Extend.ServiceExtension\222AC\022\022\n\013Service API2\0031.0\"\010/service*\002\001\002Z\037\n\035\n\006Bearer\022\023\010\002\032\rAuthorization \002'
   _GUILDPROGRESS_OBJECTIVESENTRY._options = None
   _GUILDPROGRESS_OBJECTIVESENTRY._serialized_options = b'8\001'
+  _INCREMENTGUILDOBJECTIVESREQUEST_DELTASENTRY._options = None
+  _INCREMENTGUILDOBJECTIVESREQUEST_DELTASENTRY._serialized_options = b'8\001'
   _SERVICE.methods_by_name['CreateOrUpdateGuildProgress']._options = None
   _SERVICE.methods_by_name['CreateOrUpdateGuildProgress']._serialized_options = b'\220\265\030\001\212\265\030,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\202\323\344\223\002-\"(/v1/admin/namespace/{namespace}/progress:\001*\222Ak\022\030Update Guild progression\032AUpdate Guild progression if not existed yet will create a new oneb\014\n\n\n\006Bearer\022\000'
   _SERVICE.methods_by_name['GetGuildProgress']._options = None
   _SERVICE.methods_by_name['GetGuildProgress']._serialized_options = b'\220\265\030\002\212\265\030,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\202\323\344\223\0025\0223/v1/admin/namespace/{namespace}/progress/{guild_id}\222A<\022\025Get guild progression\032\025Get guild progressionb\014\n\n\n\006Bearer\022\000'
+  _SERVICE.methods_by_name['BatchCreateOrUpdateGuildProgress']._options = None
+  _SERVICE.methods_by_name['BatchCreateOrUpdateGuildProgress']._serialized_options = b'\220\265\030\001\212\265\030,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\202\323\344\223\0029\"4/v1/admin/namespace/{namespace}/progress:batchUpdate:\001*\222A\232\001\022\036Batch update Guild progression\032jUpdate multiple Guild progressions, creating the ones that do not exist yet. Errors are reported per item.b\014\n\n\n\006Bearer\022\000'
+  _SERVICE.methods_by_name['BatchGetGuildProgress']._options = None
+  _SERVICE.methods_by_name['BatchGetGuildProgress']._serialized_options = b'\220\265\030\002\212\265\030,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\202\323\344\223\0026\"1/v1/admin/namespace/{namespace}/progress:batchGet:\001*\222Ak\022\033Batch get guild progression\032>Get multiple guild progressions. Errors are reported per item.b\014\n\n\n\006Bearer\022\000'
+  _SERVICE.methods_by_name['WatchGuildProgress']._options = None
+  _SERVICE.methods_by_name['WatchGuildProgress']._serialized_options = b'\220\265\030\002\212\265\030,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\202\323\344\223\002;\0229/v1/admin/namespace/{namespace}/progress/{guild_id}:watch\222A\211\001\022\027Watch guild progression\032`Stream the guild progression, the first message is a snapshot followed by the changed objectivesb\014\n\n\n\006Bearer\022\000'
+  _SERVICE.methods_by_name['IncrementGuildObjectives']._options = None
+  _SERVICE.methods_by_name['IncrementGuildObjectives']._serialized_options = b'\220\265\030\004\212\265\030,ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD\202\323\344\223\002M\"H/v1/admin/namespace/{namespace}/progress/{guild_id}/objectives:increment:\001*\222A|\022\032Increment guild objectives\032PAdd the given deltas to the guild objectives, missing objectives start from zerob\014\n\n\n\006Bearer\022\000'
   _CREATEORUPDATEGUILDPROGRESSREQUEST._serialized_start=122
   _CREATEORUPDATEGUILDPROGRESSREQUEST._serialized_end=225
   _CREATEORUPDATEGUILDPROGRESSRESPONSE._serialized_start=227
@@ -42,6 +52,28 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _GUILDPROGRESS._serialized_end=618
   _GUILDPROGRESS_OBJECTIVESENTRY._serialized_start=569
   _GUILDPROGRESS_OBJECTIVESENTRY._serialized_end=618
-  _SERVICE._serialized_start=621
-  _SERVICE._serialized_end=1236
+  _BATCHCREATEORUPDATEGUILDPROGRESSREQUEST._serialized_start=620
+  _BATCHCREATEORUPDATEGUILDPROGRESSREQUEST._serialized_end=730
+  _BATCHCREATEORUPDATEGUILDPROGRESSRESPONSE._serialized_start=732
+  _BATCHCREATEORUPDATEGUILDPROGRESSRESPONSE._serialized_end=821
+  _BATCHGETGUILDPROGRESSREQUEST._serialized_start=823
+  _BATCHGETGUILDPROGRESSREQUEST._serialized_end=891
+  _BATCHGETGUILDPROGRESSRESPONSE._serialized_start=893
+  _BATCHGETGUILDPROGRESSRESPONSE._serialized_end=971
+  _GUILDPROGRESSRESULT._serialized_start=974
+  _GUILDPROGRESSRESULT._serialized_end=1166
+  _GUILDPROGRESSRESULT_ERROR._serialized_start=1118
+  _GUILDPROGRESSRESULT_ERROR._serialized_end=1156
+  _WATCHGUILDPROGRESSREQUEST._serialized_start=1168
+  _WATCHGUILDPROGRESSREQUEST._serialized_end=1232
+  _WATCHGUILDPROGRESSRESPONSE._serialized_start=1234
+  _WATCHGUILDPROGRESSRESPONSE._serialized_end=1328
+  _INCREMENTGUILDOBJECTIVESREQUEST._serialized_start=1331
+  _INCREMENTGUILDOBJECTIVESREQUEST._serialized_end=1518
+  _INCREMENTGUILDOBJECTIVESREQUEST_DELTASENTRY._serialized_start=1473
+  _INCREMENTGUILDOBJECTIVESREQUEST_DELTASENTRY._serialized_end=1518
+  _INCREMENTGUILDOBJECTIVESRESPONSE._serialized_start=1520
+  _INCREMENTGUILDOBJECTIVESRESPONSE._serialized_end=1602
+  _SERVICE._serialized_start=1605
+  _SERVICE._serialized_end=3702
 # @@protoc_insertion_point(module_scope)
@@ -4,10 +4,38 @@ import permission_pb2 as _permission_pb2
 from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Mapping as _Mapping, Optional as _Optional, Union as _Union
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class BatchCreateOrUpdateGuildProgressRequest(_message.Message):
+    __slots__ = ["guild_progresses", "namespace"]
+    GUILD_PROGRESSES_FIELD_NUMBER: _ClassVar[int]
+    NAMESPACE_FIELD_NUMBER: _ClassVar[int]
+    guild_progresses: _containers.RepeatedCompositeFieldContainer[GuildProgress]
+    namespace: str
+    def __init__(self, namespace: _Optional[str] = ..., guild_progresses: _Optional[_Iterable[_Union[GuildProgress, _Mapping]]] = ...) -> None: ...
+
+class BatchCreateOrUpdateGuildProgressResponse(_message.Message):
+    __slots__ = ["results"]
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[GuildProgressResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[GuildProgressResult, _Mapping]]] = ...) -> None: ...
+
+class BatchGetGuildProgressRequest(_message.Message):
+    __slots__ = ["guild_ids", "namespace"]
+    GUILD_IDS_FIELD_NUMBER: _ClassVar[int]
+    NAMESPACE_FIELD_NUMBER: _ClassVar[int]
+    guild_ids: _containers.RepeatedScalarFieldContainer[str]
+    namespace: str
+    def __init__(self, namespace: _Optional[str] = ..., guild_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class BatchGetGuildProgressResponse(_message.Message):
+    __slots__ = ["results"]
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[GuildProgressResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[GuildProgressResult, _Mapping]]] = ...) -> None: ...
+
 class CreateOrUpdateGuildProgressRequest(_message.Message):
     __slots__ = ["guild_progress", "namespace"]
     GUILD_PROGRESS_FIELD_NUMBER: _ClassVar[int]
@@ -52,3 +80,59 @@ class GuildProgress(_message.Message):
     namespace: str
     objectives: _containers.ScalarMap[str, int]
     def __init__(self, guild_id: _Optional[str] = ..., namespace: _Optional[str] = ..., objectives: _Optional[_Mapping[str, int]] = ...) -> None: ...
+
+class GuildProgressResult(_message.Message):
+    __slots__ = ["error", "guild_id", "guild_progress"]
+    class Error(_message.Message):
+        __slots__ = ["code", "message"]
+        CODE_FIELD_NUMBER: _ClassVar[int]
+        MESSAGE_FIELD_NUMBER: _ClassVar[int]
+        code: int
+        message: str
+        def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ...) -> None: ...
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    GUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    GUILD_PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    error: GuildProgressResult.Error
+    guild_id: str
+    guild_progress: GuildProgress
+    def __init__(self, guild_id: _Optional[str] = ..., guild_progress: _Optional[_Union[GuildProgress, _Mapping]] = ..., error: _Optional[_Union[GuildProgressResult.Error, _Mapping]] = ...) -> None: ...
+
+class IncrementGuildObjectivesRequest(_message.Message):
+    __slots__ = ["deltas", "guild_id", "namespace"]
+    class DeltasEntry(_message.Message):
+        __slots__ = ["key", "value"]
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    DELTAS_FIELD_NUMBER: _ClassVar[int]
+    GUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    NAMESPACE_FIELD_NUMBER: _ClassVar[int]
+    deltas: _containers.ScalarMap[str, int]
+    guild_id: str
+    namespace: str
+    def __init__(self, namespace: _Optional[str] = ..., guild_id: _Optional[str] = ..., deltas: _Optional[_Mapping[str, int]] = ...) -> None: ...
+
+class IncrementGuildObjectivesResponse(_message.Message):
+    __slots__ = ["guild_progress"]
+    GUILD_PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    guild_progress: GuildProgress
+    def __init__(self, guild_progress: _Optional[_Union[GuildProgress, _Mapping]] = ...) -> None: ...
+
+class WatchGuildProgressRequest(_message.Message):
+    __slots__ = ["guild_id", "namespace"]
+    GUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    NAMESPACE_FIELD_NUMBER: _ClassVar[int]
+    guild_id: str
+    namespace: str
+    def __init__(self, namespace: _Optional[str] = ..., guild_id: _Optional[str] = ...) -> None: ...
+
+class WatchGuildProgressResponse(_message.Message):
+    __slots__ = ["guild_progress", "snapshot"]
+    GUILD_PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    SNAPSHOT_FIELD_NUMBER: _ClassVar[int]
+    guild_progress: GuildProgress
+    snapshot: bool
+    def __init__(self, guild_progress: _Optional[_Union[GuildProgress, _Mapping]] = ..., snapshot: bool = ...) -> None: ...
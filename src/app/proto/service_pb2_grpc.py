@@ -24,6 +24,26 @@ class ServiceStub(object):
                 request_serializer=service__pb2.GetGuildProgressRequest.SerializeToString,
                 response_deserializer=service__pb2.GetGuildProgressResponse.FromString,
                 )
+        self.BatchCreateOrUpdateGuildProgress = channel.unary_unary(
+                '/service.Service/BatchCreateOrUpdateGuildProgress',
+                request_serializer=service__pb2.BatchCreateOrUpdateGuildProgressRequest.SerializeToString,
+                response_deserializer=service__pb2.BatchCreateOrUpdateGuildProgressResponse.FromString,
+                )
+        self.BatchGetGuildProgress = channel.unary_unary(
+                '/service.Service/BatchGetGuildProgress',
+                request_serializer=service__pb2.BatchGetGuildProgressRequest.SerializeToString,
+                response_deserializer=service__pb2.BatchGetGuildProgressResponse.FromString,
+                )
+        self.WatchGuildProgress = channel.unary_stream(
+                '/service.Service/WatchGuildProgress',
+                request_serializer=service__pb2.WatchGuildProgressRequest.SerializeToString,
+                response_deserializer=service__pb2.WatchGuildProgressResponse.FromString,
+                )
+        self.IncrementGuildObjectives = channel.unary_unary(
+                '/service.Service/IncrementGuildObjectives',
+                request_serializer=service__pb2.IncrementGuildObjectivesRequest.SerializeToString,
+                response_deserializer=service__pb2.IncrementGuildObjectivesResponse.FromString,
+                )
 
 
 class ServiceServicer(object):
@@ -41,6 +61,30 @@ class ServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchCreateOrUpdateGuildProgress(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchGetGuildProgress(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchGuildProgress(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def IncrementGuildObjectives(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -54,6 +98,26 @@ def add_ServiceServicer_to_server(servicer, server):
                     request_deserializer=service__pb2.GetGuildProgressRequest.FromString,
                     response_serializer=service__pb2.GetGuildProgressResponse.SerializeToString,
             ),
+            'BatchCreateOrUpdateGuildProgress': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchCreateOrUpdateGuildProgress,
+                    request_deserializer=service__pb2.BatchCreateOrUpdateGuildProgressRequest.FromString,
+                    response_serializer=service__pb2.BatchCreateOrUpdateGuildProgressResponse.SerializeToString,
+            ),
+            'BatchGetGuildProgress': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetGuildProgress,
+                    request_deserializer=service__pb2.BatchGetGuildProgressRequest.FromString,
+                    response_serializer=service__pb2.BatchGetGuildProgressResponse.SerializeToString,
+            ),
+            'WatchGuildProgress': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchGuildProgress,
+                    request_deserializer=service__pb2.WatchGuildProgressRequest.FromString,
+                    response_serializer=service__pb2.WatchGuildProgressResponse.SerializeToString,
+            ),
+            'IncrementGuildObjectives': grpc.unary_unary_rpc_method_handler(
+                    servicer.IncrementGuildObjectives,
+                    request_deserializer=service__pb2.IncrementGuildObjectivesRequest.FromString,
+                    response_serializer=service__pb2.IncrementGuildObjectivesResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'service.Service', rpc_method_handlers)
@@ -97,3 +161,71 @@ class Service(object):
             service__pb2.GetGuildProgressResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def BatchCreateOrUpdateGuildProgress(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/service.Service/BatchCreateOrUpdateGuildProgress',
+            service__pb2.BatchCreateOrUpdateGuildProgressRequest.SerializeToString,
+            service__pb2.BatchCreateOrUpdateGuildProgressResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def BatchGetGuildProgress(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/service.Service/BatchGetGuildProgress',
+            service__pb2.BatchGetGuildProgressRequest.SerializeToString,
+            service__pb2.BatchGetGuildProgressResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def WatchGuildProgress(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/service.Service/WatchGuildProgress',
+            service__pb2.WatchGuildProgressRequest.SerializeToString,
+            service__pb2.WatchGuildProgressResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def IncrementGuildObjectives(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/service.Service/IncrementGuildObjectives',
+            service__pb2.IncrementGuildObjectivesRequest.SerializeToString,
+            service__pb2.IncrementGuildObjectivesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -0,0 +1,177 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+from typing import Dict, Optional, Protocol, Tuple, runtime_checkable
+
+from prometheus_client import Counter, Gauge
+
+from accelbyte_grpc_plugin.cache import TTLCache
+
+# (namespace, guild progress record key)
+GuildProgressKey = Tuple[str, str]
+
+
+@runtime_checkable
+class GuildProgressCacheProtocol(Protocol):
+    """Stores serialized GuildProgress messages keyed by (namespace, record key).
+
+    Implement this to put a shared cache (e.g. Redis) behind the service."""
+
+    async def get(self, key: GuildProgressKey) -> Optional[bytes]:
+        ...
+
+    async def set(self, key: GuildProgressKey, value: bytes) -> None:
+        ...
+
+    async def delete(self, key: GuildProgressKey) -> None:
+        ...
+
+
+class InMemoryGuildProgressCache:
+    DEFAULT_MAX_SIZE: int = 10000
+    DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+    DEFAULT_TTL: float = 5.0
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if max_size is None:
+            max_size = self.DEFAULT_MAX_SIZE
+
+        if max_bytes is None:
+            max_bytes = self.DEFAULT_MAX_BYTES
+
+        if ttl is None:
+            ttl = self.DEFAULT_TTL
+
+        self.cache: TTLCache[GuildProgressKey, bytes] = TTLCache(
+            max_size=max_size,
+            ttl=ttl,
+            max_bytes=max_bytes,
+            sizeof=len,
+        )
+
+    async def get(self, key: GuildProgressKey) -> Optional[bytes]:
+        return self.cache.get(key)
+
+    async def set(self, key: GuildProgressKey, value: bytes) -> None:
+        self.cache.set(key, value)
+
+    async def delete(self, key: GuildProgressKey) -> None:
+        self.cache.delete(key)
+
+
+class TieredGuildProgressCache:
+    """Looks up the local cache first, then the shared one."""
+
+    def __init__(
+        self,
+        local: GuildProgressCacheProtocol,
+        shared: GuildProgressCacheProtocol,
+    ) -> None:
+        self.local = local
+        self.shared = shared
+
+    async def get(self, key: GuildProgressKey) -> Optional[bytes]:
+        value = await self.local.get(key)
+        if value is None:
+            value = await self.shared.get(key)
+            if value is not None:
+                await self.local.set(key, value)
+        return value
+
+    async def set(self, key: GuildProgressKey, value: bytes) -> None:
+        await self.local.set(key, value)
+        await self.shared.set(key, value)
+
+    async def delete(self, key: GuildProgressKey) -> None:
+        await self.local.delete(key)
+        await self.shared.delete(key)
+
+
+class GuildProgressCacheMetrics:
+    # weight of the latest sample in the moving average of the read latency.
+    LATENCY_EWMA_ALPHA: float = 0.1
+
+    def __init__(self) -> None:
+        self.hits = Counter(
+            name="guild_progress_cache_hits",
+            documentation="number of guild progress reads served from cache",
+            unit="count",
+        )
+        self.misses = Counter(
+            name="guild_progress_cache_misses",
+            documentation="number of guild progress reads that went to CloudSave",
+            unit="count",
+        )
+        self.latency_saved = Counter(
+            name="guild_progress_cache_latency_saved",
+            documentation="estimated CloudSave read latency saved by cache hits",
+            unit="seconds",
+        )
+        self.read_latency = Gauge(
+            name="guild_progress_cache_read_latency",
+            documentation="moving average of the CloudSave guild progress read latency",
+            unit="seconds",
+        )
+        self.read_latency_average: Optional[float] = None
+
+    def on_hit(self) -> None:
+        self.hits.inc()
+        if self.read_latency_average is not None:
+            self.latency_saved.inc(self.read_latency_average)
+
+    def on_miss(self, read_latency: float) -> None:
+        self.misses.inc()
+        if self.read_latency_average is None:
+            self.read_latency_average = read_latency
+        else:
+            self.read_latency_average += self.LATENCY_EWMA_ALPHA * (
+                read_latency - self.read_latency_average
+            )
+        self.read_latency.set(self.read_latency_average)
+
+
+class GuildProgressWriteGenerations:
+    """Counts the writes of a key that finish while it is being read.
+
+    A read that overlapped a write may return the value from before it, such
+    a result must not be cached (or published) over the written one. Counts
+    are only kept for keys with reads in flight."""
+
+    def __init__(self) -> None:
+        self.generations: Dict[GuildProgressKey, int] = {}
+        self.readers: Dict[GuildProgressKey, int] = {}
+
+    def begin_read(self, key: GuildProgressKey) -> int:
+        self.readers[key] = self.readers.get(key, 0) + 1
+        return self.generations.setdefault(key, 0)
+
+    def end_read(self, key: GuildProgressKey, generation: int) -> bool:
+        """Returns whether no write of 'key' finished since 'begin_read'."""
+        is_fresh = self.generations.get(key, 0) == generation
+        readers = self.readers.get(key, 0) - 1
+        if readers > 0:
+            self.readers[key] = readers
+        else:
+            self.readers.pop(key, None)
+            self.generations.pop(key, None)
+        return is_fresh
+
+    def on_write(self, key: GuildProgressKey) -> None:
+        if key in self.readers:
+            self.generations[key] = self.generations.get(key, 0) + 1
+
+
+__all__ = [
+    "GuildProgressCacheMetrics",
+    "GuildProgressCacheProtocol",
+    "GuildProgressKey",
+    "GuildProgressWriteGenerations",
+    "InMemoryGuildProgressCache",
+    "TieredGuildProgressCache",
+]
@@ -0,0 +1,282 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import itertools
+
+from collections import deque
+from enum import Enum
+from logging import Logger
+from typing import Awaitable, Callable, Deque, Dict, List, NamedTuple, Optional, Set
+
+from prometheus_client import Counter, Gauge
+
+from ..proto.service_pb2 import GuildProgress
+from .guild_progress_cache import GuildProgressKey
+
+GuildProgressFetchFunc = Callable[[GuildProgressKey], Awaitable[GuildProgress]]
+
+
+class GuildProgressChange(NamedTuple):
+    guild_progress: GuildProgress
+    # True when 'guild_progress' is the full record, otherwise only the changed objectives.
+    is_snapshot: bool
+
+
+class OverflowPolicy(str, Enum):
+    # merge queued deltas into one, the subscriber only misses intermediate values.
+    CONFLATE = "conflate"
+    # drop the subscriber, it has to re-subscribe to get a fresh snapshot.
+    DROP = "drop"
+
+
+class SubscriptionDroppedError(Exception):
+    pass
+
+
+class GuildProgressSubscription:
+    def __init__(self, hub: "GuildProgressHub", key: GuildProgressKey) -> None:
+        self.hub = hub
+        self.key = key
+        self.queue: Deque[GuildProgressChange] = deque()
+        self.event = asyncio.Event()
+        self.has_snapshot: bool = False
+        self.is_dropped: bool = False
+
+    def __aiter__(self) -> "GuildProgressSubscription":
+        return self
+
+    async def __anext__(self) -> GuildProgressChange:
+        while not self.queue:
+            if self.is_dropped:
+                raise SubscriptionDroppedError("subscriber is too slow")
+            self.event.clear()
+            await self.event.wait()
+        self.hub.on_dequeue()
+        return self.queue.popleft()
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+
+class GuildProgressHub:
+    """Fans out guild progress changes to in-process subscribers.
+
+    Each subscriber first gets a snapshot, then deltas holding only the
+    objectives that changed. When the last known state of a guild is not
+    available (e.g. an objective was removed) a snapshot is sent instead.
+
+    Writes made outside this process are picked up by polling every
+    'poll_interval' seconds the guilds that have subscribers.
+
+    Every published change gets a new version. A value read from CloudSave is
+    published with the version of its key from when the read started, and is
+    dropped if another change was published since, as it may be older."""
+
+    DEFAULT_MAX_QUEUE_SIZE: int = 32
+    DEFAULT_POLL_INTERVAL: float = 5.0
+
+    def __init__(
+        self,
+        fetch: Optional[GuildProgressFetchFunc] = None,
+        poll_interval: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.CONFLATE,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        if poll_interval is None:
+            poll_interval = self.DEFAULT_POLL_INTERVAL
+
+        if max_queue_size is None:
+            max_queue_size = self.DEFAULT_MAX_QUEUE_SIZE
+
+        self.fetch = fetch
+        self.poll_interval = poll_interval
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.logger = logger
+
+        self.subscriptions: Dict[GuildProgressKey, Set[GuildProgressSubscription]] = {}
+        self.states: Dict[GuildProgressKey, GuildProgress] = {}
+        self.versions: Dict[GuildProgressKey, int] = {}
+        self.sequence = itertools.count(1)
+        self.pollers: Dict[GuildProgressKey, "asyncio.Task[None]"] = {}
+
+        self.subscribers = Gauge(
+            name="guild_progress_watch_subscribers",
+            documentation="number of guild progress watch subscribers",
+        )
+        self.queue_depth = Gauge(
+            name="guild_progress_watch_queue_depth",
+            documentation="number of guild progress changes queued for subscribers",
+        )
+        self.overflows = Counter(
+            name="guild_progress_watch_overflows",
+            documentation="number of times a subscriber queue was full",
+            labelnames=["policy"],
+            unit="count",
+        )
+        self.stale_reads = Counter(
+            name="guild_progress_watch_stale_reads",
+            documentation="number of guild progress reads not published because a newer change was",
+            unit="count",
+        )
+
+    def subscribe(self, key: GuildProgressKey) -> GuildProgressSubscription:
+        subscription = GuildProgressSubscription(hub=self, key=key)
+        subscriptions = self.subscriptions.setdefault(key, set())
+        subscriptions.add(subscription)
+        self.subscribers.inc()
+
+        state = self.states.get(key, None)
+        if state is not None:
+            self.enqueue(subscription, GuildProgressChange(state, is_snapshot=True))
+
+        if self.fetch is not None and self.poll_interval > 0 and key not in self.pollers:
+            self.pollers[key] = asyncio.ensure_future(self.poll(key))
+
+        return subscription
+
+    def unsubscribe(self, subscription: GuildProgressSubscription) -> None:
+        subscriptions = self.subscriptions.get(subscription.key, None)
+        if not subscriptions or subscription not in subscriptions:
+            return
+
+        subscriptions.remove(subscription)
+        self.subscribers.dec()
+        self.queue_depth.dec(len(subscription.queue))
+        subscription.queue.clear()
+
+        if not subscriptions:
+            del self.subscriptions[subscription.key]
+            # nobody is watching, the state would only go stale.
+            self.states.pop(subscription.key, None)
+            self.versions.pop(subscription.key, None)
+            poller = self.pollers.pop(subscription.key, None)
+            if poller is not None:
+                poller.cancel()
+
+    def get_state(self, key: GuildProgressKey) -> Optional[GuildProgress]:
+        return self.states.get(key, None)
+
+    def get_version(self, key: GuildProgressKey) -> int:
+        return self.versions.get(key, 0)
+
+    def publish(
+        self,
+        key: GuildProgressKey,
+        guild_progress: GuildProgress,
+        version: Optional[int] = None,
+    ) -> bool:
+        """Publishes a committed write, or with 'version' (from 'get_version' when
+        the read started) a read value. Returns whether it was published."""
+        subscriptions = self.subscriptions.get(key, None)
+        if not subscriptions:
+            return False
+
+        if version is not None and self.versions.get(key, 0) != version:
+            self.stale_reads.inc()
+            return False
+
+        previous = self.states.get(key, None)
+        self.states[key] = guild_progress
+        self.versions[key] = next(self.sequence)
+
+        delta = self.create_delta(previous, guild_progress)
+        for subscription in list(subscriptions):
+            if not subscription.has_snapshot or delta is None:
+                change = GuildProgressChange(guild_progress, is_snapshot=True)
+            elif not delta.objectives:
+                continue
+            else:
+                change = GuildProgressChange(delta, is_snapshot=False)
+            self.enqueue(subscription, change)
+
+        return True
+
+    def enqueue(
+        self, subscription: GuildProgressSubscription, change: GuildProgressChange
+    ) -> None:
+        if subscription.is_dropped:
+            return
+
+        if change.is_snapshot:
+            subscription.has_snapshot = True
+
+        if len(subscription.queue) >= self.max_queue_size:
+            self.overflows.labels(policy=self.overflow_policy.value).inc()
+            if self.overflow_policy == OverflowPolicy.DROP:
+                subscription.is_dropped = True
+                self.queue_depth.dec(len(subscription.queue))
+                subscription.queue.clear()
+                subscription.event.set()
+                return
+
+            conflated = self.conflate(list(subscription.queue) + [change])
+            self.queue_depth.dec(len(subscription.queue))
+            subscription.queue.clear()
+            subscription.queue.append(conflated)
+            self.queue_depth.inc()
+        else:
+            subscription.queue.append(change)
+            self.queue_depth.inc()
+
+        subscription.event.set()
+
+    def on_dequeue(self) -> None:
+        self.queue_depth.dec()
+
+    async def poll(self, key: GuildProgressKey) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            version = self.get_version(key)
+            try:
+                guild_progress = await self.fetch(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.logger:
+                    self.logger.debug("guild progress poll failed for %s: %s", key, e)
+                continue
+            self.publish(key, guild_progress, version=version)
+
+    @staticmethod
+    def create_delta(
+        previous: Optional[GuildProgress], current: GuildProgress
+    ) -> Optional[GuildProgress]:
+        """Returns the changed objectives, or None if a snapshot is needed instead."""
+        if (
+            previous is None
+            or previous.guild_id != current.guild_id
+            or previous.namespace != current.namespace
+            or any(k not in current.objectives for k in previous.objectives)
+        ):
+            return None
+        delta = GuildProgress(guild_id=current.guild_id, namespace=current.namespace)
+        for k, v in current.objectives.items():
+            if k not in previous.objectives or previous.objectives[k] != v:
+                delta.objectives[k] = v
+        return delta
+
+    @staticmethod
+    def conflate(changes: List[GuildProgressChange]) -> GuildProgressChange:
+        # start from the latest snapshot, if any, then apply the deltas after it.
+        start = 0
+        for i, change in enumerate(changes):
+            if change.is_snapshot:
+                start = i
+        merged = GuildProgress()
+        for change in changes[start:]:
+            merged.MergeFrom(change.guild_progress)
+        return GuildProgressChange(merged, is_snapshot=changes[start].is_snapshot)
+
+
+__all__ = [
+    "GuildProgressChange",
+    "GuildProgressFetchFunc",
+    "GuildProgressHub",
+    "GuildProgressSubscription",
+    "OverflowPolicy",
+    "SubscriptionDroppedError",
+]
@@ -0,0 +1,161 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+
+from logging import Logger
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from prometheus_client import Counter, Histogram
+
+from ..proto.service_pb2 import GuildProgress
+from .guild_progress_cache import GuildProgressKey
+
+GuildProgressWriteFunc = Callable[[str, str, GuildProgress], Awaitable[GuildProgress]]
+
+
+class GuildProgressWriteBatch:
+    def __init__(self) -> None:
+        self.guild_progress = GuildProgress()
+        self.waiters: List["asyncio.Future[GuildProgress]"] = []
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+
+class GuildProgressWriteBehind:
+    """Buffers guild progress updates per key and writes them in batches.
+
+    Updates submitted within 'window' seconds of the first one (or until
+    'max_batch_size' updates) are merged, later objective values win, and
+    written once. Every submitter gets the persisted result of the batch.
+    Writes for the same key are kept in submission order."""
+
+    DEFAULT_WINDOW: float = 0.01
+    DEFAULT_MAX_BATCH_SIZE: int = 64
+
+    def __init__(
+        self,
+        write: GuildProgressWriteFunc,
+        window: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        if window is None:
+            window = self.DEFAULT_WINDOW
+
+        if max_batch_size is None:
+            max_batch_size = self.DEFAULT_MAX_BATCH_SIZE
+
+        self.write = write
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.logger = logger
+
+        self.batches: Dict[GuildProgressKey, GuildProgressWriteBatch] = {}
+        self.flushes: Dict[GuildProgressKey, "asyncio.Task[None]"] = {}
+        self.is_closed: bool = False
+
+        self.batch_size = Histogram(
+            name="guild_progress_write_batch_size",
+            documentation="number of guild progress updates merged into a single CloudSave write",
+            buckets=(1, 2, 4, 8, 16, 32, 64, 128, float("inf")),
+        )
+        self.writes_saved = Counter(
+            name="guild_progress_writes_saved",
+            documentation="number of CloudSave writes avoided by merging guild progress updates",
+            unit="count",
+        )
+
+    async def submit(self, key: GuildProgressKey, guild_progress: GuildProgress) -> GuildProgress:
+        if self.is_closed:
+            return await self.write(key[0], key[1], guild_progress)
+
+        loop = asyncio.get_running_loop()
+
+        batch = self.batches.get(key, None)
+        if batch is None:
+            batch = GuildProgressWriteBatch()
+            batch.handle = loop.call_later(self.window, self.flush, key)
+            self.batches[key] = batch
+
+        batch.guild_progress.MergeFrom(guild_progress)
+        waiter = loop.create_future()
+        batch.waiters.append(waiter)
+
+        if len(batch.waiters) >= self.max_batch_size:
+            self.flush(key)
+
+        # a cancelled submitter only gives up waiting, its update stays in the batch.
+        return await waiter
+
+    def flush(self, key: GuildProgressKey) -> None:
+        batch = self.batches.pop(key, None)
+        if batch is None:
+            return
+
+        if batch.handle is not None:
+            batch.handle.cancel()
+
+        previous = self.flushes.get(key, None)
+        task = asyncio.ensure_future(self.write_batch(key, batch, previous))
+        self.flushes[key] = task
+        task.add_done_callback(lambda t: self.on_flush_done(key, t))
+
+    async def drain(self, key: GuildProgressKey) -> None:
+        """Writes the pending updates of 'key' now and waits for every write of it
+        in progress, so that a write made afterwards is not overwritten by them."""
+        self.flush(key)
+        task = self.flushes.get(key, None)
+        if task is not None:
+            await asyncio.wait([task])
+
+    def on_flush_done(self, key: GuildProgressKey, task: "asyncio.Task[None]") -> None:
+        if self.flushes.get(key, None) is task:
+            del self.flushes[key]
+
+    async def write_batch(
+        self,
+        key: GuildProgressKey,
+        batch: GuildProgressWriteBatch,
+        previous: Optional["asyncio.Task[None]"],
+    ) -> None:
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])
+
+            size = len(batch.waiters)
+            self.batch_size.observe(size)
+            self.writes_saved.inc(size - 1)
+
+            result = await self.write(key[0], key[1], batch.guild_progress)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning("guild progress batch write failed: %s", e)
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+        except BaseException:
+            # the flush was cancelled (e.g. on shutdown), do not leave the submitters waiting.
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.cancel()
+            raise
+        else:
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.set_result(result)
+
+    async def close(self) -> None:
+        """Writes every pending batch, later updates are written directly."""
+        self.is_closed = True
+        for key in list(self.batches.keys()):
+            self.flush(key)
+        if self.flushes:
+            await asyncio.wait(list(self.flushes.values()))
+
+
+__all__ = [
+    "GuildProgressWriteBatch",
+    "GuildProgressWriteBehind",
+    "GuildProgressWriteFunc",
+]
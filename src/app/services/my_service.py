@@ -2,44 +2,194 @@
 # This is licensed software from AccelByte Inc, for limitations
 # and restrictions contact your company contract manager.
 
+import asyncio
+import random
+import time
 import uuid
 
 from logging import Logger
-from typing import Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from google.protobuf.json_format import MessageToJson
 from grpc import StatusCode
+from grpc.aio import AioRpcError
+from prometheus_client import Counter
 
 from accelbyte_py_sdk import AccelByteSDK
 from accelbyte_py_sdk.api import cloudsave as cs_service
 from accelbyte_py_sdk.api.cloudsave import models as cs_models
 
+from accelbyte_grpc_plugin.deadlines import check_deadline, no_deadline
+from accelbyte_grpc_plugin.hedging import HedgingPolicy
+from accelbyte_grpc_plugin.interceptors.authorization import get_access_token_claims
+from accelbyte_grpc_plugin.payload_logging import PayloadLogger
+from accelbyte_grpc_plugin.resilience import (
+    SDKCallFunc,
+    SDKCallPolicy,
+    create_sdk_rpc_error,
+    get_http_status,
+)
+from accelbyte_grpc_plugin.singleflight import SingleFlight
 from accelbyte_grpc_plugin.utils import create_aio_rpc_error
 
 from ..proto.service_pb2 import (
+    BatchCreateOrUpdateGuildProgressRequest,
+    BatchCreateOrUpdateGuildProgressResponse,
+    BatchGetGuildProgressRequest,
+    BatchGetGuildProgressResponse,
     CreateOrUpdateGuildProgressRequest,
     CreateOrUpdateGuildProgressResponse,
     GetGuildProgressRequest,
     GetGuildProgressResponse,
+    GuildProgress,
+    IncrementGuildObjectivesRequest,
+    IncrementGuildObjectivesResponse,
+    GuildProgressResult,
+    WatchGuildProgressRequest,
+    WatchGuildProgressResponse,
     DESCRIPTOR,
 )
 
 from ..proto.service_pb2_grpc import ServiceServicer
 
+from .guild_progress_cache import (
+    GuildProgressCacheMetrics,
+    GuildProgressCacheProtocol,
+    GuildProgressKey,
+    GuildProgressWriteGenerations,
+)
+from .guild_progress_hub import GuildProgressHub, OverflowPolicy, SubscriptionDroppedError
+from .guild_progress_writer import GuildProgressWriteBehind
+
 
 class AsyncService(ServiceServicer):
     full_name: str = DESCRIPTOR.services_by_name["Service"].full_name
 
-    def __init__(self, sdk: AccelByteSDK, logger: Logger) -> None:
+    DEFAULT_BATCH_MAX_CONCURRENCY: int = 16
+    MAX_BATCH_SIZE: int = 1000
+    # maximum number of keys per CloudSave bulk get request.
+    MAX_BULK_GET_KEYS: int = 20
+
+    DEFAULT_INCREMENT_MAX_ATTEMPTS: int = 5
+    INCREMENT_RETRY_BASE_DELAY: float = 0.01
+
+    # CloudSave error codes.
+    RECORD_NOT_FOUND_ERROR_CODE: int = 18003
+    PRECONDITION_FAILED_ERROR_CODE: int = 18056
+
+    # a concurrent write with it only creates the record, it matches no existing one.
+    NEW_RECORD_UPDATED_AT: str = "1970-01-01T00:00:00Z"
+
+    MIN_INT32: int = -(2**31)
+    MAX_INT32: int = 2**31 - 1
+
+    def __init__(
+        self,
+        sdk: AccelByteSDK,
+        logger: Logger,
+        cache: Optional[GuildProgressCacheProtocol] = None,
+        write_behind_window: Optional[float] = None,
+        write_behind_max_batch_size: Optional[int] = None,
+        batch_max_concurrency: Optional[int] = None,
+        watch_poll_interval: Optional[float] = None,
+        watch_max_queue_size: Optional[int] = None,
+        watch_overflow_policy: OverflowPolicy = OverflowPolicy.CONFLATE,
+        increment_max_attempts: Optional[int] = None,
+        sdk_call_policy: Optional[SDKCallPolicy] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        payload_logger: Optional[PayloadLogger] = None,
+    ) -> None:
+        if batch_max_concurrency is None:
+            batch_max_concurrency = self.DEFAULT_BATCH_MAX_CONCURRENCY
+
+        if increment_max_attempts is None:
+            increment_max_attempts = self.DEFAULT_INCREMENT_MAX_ATTEMPTS
+
+        if payload_logger is None and logger:
+            payload_logger = PayloadLogger(logger=logger)
+
         self.sdk = sdk
         self.logger = logger
+        self.cache = cache
+        self.cache_metrics = GuildProgressCacheMetrics() if cache is not None else None
+        self.batch_max_concurrency = batch_max_concurrency
+        self.increment_max_attempts = increment_max_attempts
+        # retries transient CloudSave failures and fails fast while it is down.
+        self.sdk_call_policy = sdk_call_policy
+        # re-sends slow guild progress reads (opt-in).
+        self.hedging_policy = hedging_policy
+        # payloads are sampled, and serialized on a background thread.
+        self.payload_logger = payload_logger
+
+        # concurrent reads of the same guild share a single CloudSave request.
+        self.reads: SingleFlight[GuildProgressKey, GuildProgress] = SingleFlight()
+        self.coalesced_reads = Counter(
+            name="guild_progress_coalesced_reads",
+            documentation="number of guild progress reads that joined an in-flight CloudSave request",
+            unit="count",
+        )
+        # turned off once CloudSave denies bulk gets, the single gets use the admin endpoint.
+        self.bulk_get_enabled: bool = True
+        # reads that overlapped a write do not overwrite its result in the cache.
+        self.write_generations = GuildProgressWriteGenerations()
+
+        self.increment_conflicts = Counter(
+            name="guild_progress_increment_conflicts",
+            documentation="number of guild objective increments rejected because the record changed",
+            unit="count",
+        )
+        self.increment_retries = Counter(
+            name="guild_progress_increment_retries",
+            documentation="number of guild objective increments retried after a conflict",
+            unit="count",
+        )
+
+        # updates of the same guild are merged and written once per window (opt-in).
+        self.writer: Optional[GuildProgressWriteBehind] = None
+        if write_behind_window is not None:
+            self.writer = GuildProgressWriteBehind(
+                write=self.write_guild_progress,
+                window=write_behind_window,
+                max_batch_size=write_behind_max_batch_size,
+                logger=logger,
+            )
+
+        # committed writes are fanned out to WatchGuildProgress subscribers, writes
+        # from other processes are picked up by polling the watched guilds.
+        self.hub = GuildProgressHub(
+            fetch=self.poll_guild_progress,
+            poll_interval=watch_poll_interval,
+            max_queue_size=watch_max_queue_size,
+            overflow_policy=watch_overflow_policy,
+            logger=logger,
+        )
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            await self.writer.close()
+        if self.payload_logger is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.payload_logger.close
+            )
 
     # noinspection PyShadowingBuiltins
-    def log_payload(self, format: str, payload: Any) -> None:
+    def log_payload(self, format: str, payload: Any, method: Optional[str] = None) -> None:
+        if self.payload_logger is None:
+            return
+        self.payload_logger.log(format, payload, method=method)
+
+    def log_caller(self, method: str) -> None:
         if not self.logger:
             return
-        payload_json = MessageToJson(payload, preserving_proto_field_name=True)
-        self.logger.info(format.format(payload_json))
+        # claims are already verified and parsed by the authorization interceptor.
+        claims = get_access_token_claims()
+        if claims is not None:
+            self.logger.debug(
+                "%s called by user: %s, client: %s, namespace: %s",
+                method,
+                claims.user_id,
+                claims.client_id,
+                claims.namespace,
+            )
 
     @staticmethod
     def generate_new_guild_id() -> str:
@@ -49,39 +199,486 @@ class AsyncService(ServiceServicer):
     def format_guild_progress_key(guild_id: str) -> str:
         return f"guildProgress_{guild_id}"
 
+    @staticmethod
+    def parse_guild_progress(value: Dict[str, Any]) -> GuildProgress:
+        guild_progress = GuildProgress()
+        guild_progress.guild_id = value["guild_id"]
+        guild_progress.namespace = value["namespace"]
+        for k, v in value["objectives"].items():
+            guild_progress.objectives[k] = v
+        return guild_progress
+
+    async def call_sdk(
+        self, endpoint: str, fn: SDKCallFunc, retryable: bool = True
+    ) -> Tuple[Any, Any]:
+        if self.sdk_call_policy is None:
+            return await fn()
+        return await self.sdk_call_policy.call(endpoint, fn, retryable=retryable)
+
+    async def call_sdk_hedged(self, endpoint: str, fn: SDKCallFunc) -> Tuple[Any, Any]:
+        """Like 'call_sdk' with the hedging policy applied to each attempt, for
+        idempotent reads only."""
+        if self.hedging_policy is None:
+            return await self.call_sdk(endpoint, fn)
+        return await self.call_sdk(
+            endpoint, lambda: self.hedging_policy.call(endpoint, fn)
+        )
+
+    async def get_cached_guild_progress(
+        self, key: GuildProgressKey
+    ) -> Optional[GuildProgress]:
+        if self.cache is None:
+            return None
+        try:
+            value = await self.cache.get(key)
+        except Exception as e:
+            # a broken cache must not fail the request, fall back to CloudSave.
+            if self.logger:
+                self.logger.warning("guild progress cache get failed: %s", e)
+            return None
+        if value is None:
+            return None
+        return GuildProgress.FromString(value)
+
+    async def set_cached_guild_progress(
+        self, key: GuildProgressKey, guild_progress: Optional[GuildProgress]
+    ) -> None:
+        if self.cache is None:
+            return
+        try:
+            if guild_progress is None:
+                await self.cache.delete(key)
+            else:
+                await self.cache.set(key, guild_progress.SerializeToString())
+        except Exception as e:
+            if self.logger:
+                self.logger.warning("guild progress cache update failed: %s", e)
+
+    async def fetch_guild_progress(self, namespace: str, gp_key: str) -> GuildProgress:
+        (
+            response,
+            error,
+        ) = await self.call_sdk_hedged(
+            "cloudsave.admin_get_game_record_handler_v1",
+            lambda: cs_service.admin_get_game_record_handler_v1_async(
+                key=gp_key,
+                namespace=namespace,
+                sdk=self.sdk,
+            ),
+        )
+        if error:
+            raise create_sdk_rpc_error(error)
+
+        return self.parse_guild_progress(response.value)
+
+    async def get_guild_progress(self, namespace: str, gp_key: str) -> GuildProgress:
+        key = (namespace, gp_key)
+
+        guild_progress = await self.get_cached_guild_progress(key)
+        if guild_progress is not None:
+            self.cache_metrics.on_hit()
+            return guild_progress
+
+        # the read is shared, it must not be cut short by the deadline of whoever
+        # started it, but there is no point in starting one for a gone client.
+        check_deadline()
+
+        async def read() -> GuildProgress:
+            start = time.perf_counter()
+            generation = self.write_generations.begin_read(key)
+            version = self.hub.get_version(key)
+            try:
+                with no_deadline():
+                    result = await self.fetch_guild_progress(namespace, gp_key)
+            finally:
+                is_fresh = self.write_generations.end_read(key, generation)
+            if self.cache_metrics is not None:
+                self.cache_metrics.on_miss(time.perf_counter() - start)
+            if is_fresh:
+                await self.set_cached_guild_progress(key, result)
+                self.hub.publish(key, result, version=version)
+            return result
+
+        guild_progress, shared = await self.reads.do(key, read)
+        if shared:
+            self.coalesced_reads.inc()
+        return guild_progress
+
+    async def save_guild_progress(
+        self, namespace: str, gp_key: str, guild_progress: GuildProgress
+    ) -> GuildProgress:
+        key = (namespace, gp_key)
+
+        gp_value = cs_models.ModelsGameRecordRequest()
+        gp_value["guild_id"] = guild_progress.guild_id
+        gp_value["namespace"] = guild_progress.namespace
+        gp_value["objectives"] = dict(guild_progress.objectives)
+
+        (
+            response,
+            error,
+        ) = await self.call_sdk(
+            "cloudsave.admin_post_game_record_handler_v1",
+            lambda: cs_service.admin_post_game_record_handler_v1_async(
+                body=gp_value,
+                key=gp_key,
+                namespace=namespace,
+                sdk=self.sdk,
+            ),
+        )
+        self.on_guild_progress_written(key)
+        if error:
+            # the record may or may not have been written, drop the cached copy.
+            await self.set_cached_guild_progress(key, None)
+            raise create_sdk_rpc_error(error)
+
+        try:
+            guild_progress = self.parse_guild_progress(response.value)
+        except (KeyError, TypeError, AttributeError):
+            await self.set_cached_guild_progress(key, None)
+            raise
+
+        # the write response holds the stored record, use it to refresh the cache.
+        await self.set_cached_guild_progress(key, guild_progress)
+        self.hub.publish(key, guild_progress)
+        return guild_progress
+
+    def on_guild_progress_written(self, key: GuildProgressKey) -> None:
+        """Called once a write of 'key' finished (or may have), reads that started
+        before it could return the previous value."""
+        self.write_generations.on_write(key)
+        self.reads.forget(key)
+
+    async def write_guild_progress(
+        self, namespace: str, gp_key: str, guild_progress: GuildProgress
+    ) -> GuildProgress:
+        # write-behind batches are shared by several RPCs.
+        with no_deadline():
+            return await self.save_guild_progress(namespace, gp_key, guild_progress)
+
+    async def poll_guild_progress(self, key: GuildProgressKey) -> GuildProgress:
+        # polls outlive the RPC that started them.
+        with no_deadline():
+            return await self.fetch_guild_progress(*key)
+
+    @classmethod
+    def get_error_code(cls, error: Any) -> Optional[int]:
+        return getattr(error, "error_code", None)
+
+    @classmethod
+    def is_conflict(cls, error: Any) -> bool:
+        # 412 once 'updatedAt' no longer matches, 409 if the record was created meanwhile.
+        return (
+            cls.get_error_code(error) == cls.PRECONDITION_FAILED_ERROR_CODE
+            or get_http_status(error) in (409, 412)
+        )
+
+    @classmethod
+    def apply_objective_deltas(
+        cls, objectives: Dict[str, int], deltas: Dict[str, int]
+    ) -> Dict[str, int]:
+        result = dict(objectives)
+        for k, delta in deltas.items():
+            value = result.get(k, 0) + delta
+            if not cls.MIN_INT32 <= value <= cls.MAX_INT32:
+                raise create_aio_rpc_error(
+                    f"objective out of range: {k}", StatusCode.OUT_OF_RANGE
+                )
+            result[k] = value
+        return result
+
+    async def increment_guild_objectives(
+        self, namespace: str, gp_key: str, guild_id: str, deltas: Dict[str, int]
+    ) -> GuildProgress:
+        key = (namespace, gp_key)
+
+        if self.writer is not None:
+            # buffered updates of this guild would otherwise be written over the increment.
+            await self.writer.drain(key)
+
+        for attempt in range(self.increment_max_attempts):
+            if attempt > 0:
+                self.increment_retries.inc()
+                # jittered exponential backoff, so that contending writers spread out.
+                await asyncio.sleep(
+                    random.uniform(0, self.INCREMENT_RETRY_BASE_DELAY * (2 ** (attempt - 1)))
+                )
+
+            (
+                response,
+                error,
+            ) = await self.call_sdk(
+                "cloudsave.admin_get_game_record_handler_v1",
+                lambda: cs_service.admin_get_game_record_handler_v1_async(
+                    key=gp_key,
+                    namespace=namespace,
+                    sdk=self.sdk,
+                ),
+            )
+            if error and self.get_error_code(error) != self.RECORD_NOT_FOUND_ERROR_CODE:
+                raise create_sdk_rpc_error(error)
+
+            if error:
+                # no record yet, it is only created if still missing when written.
+                value = {"guild_id": guild_id, "namespace": namespace, "objectives": {}}
+                set_by = "CLIENT"
+                updated_at = self.NEW_RECORD_UPDATED_AT
+            else:
+                value = dict(response.value)
+                set_by = getattr(response, "set_by", None) or "CLIENT"
+                updated_at = response.updated_at
+
+            value["objectives"] = self.apply_objective_deltas(
+                value.get("objectives") or {}, deltas
+            )
+
+            # not retried, a retry of an applied write would add the deltas twice.
+            (
+                _,
+                error,
+            ) = await self.call_sdk(
+                "cloudsave.admin_put_game_record_concurrent_handler_v1",
+                lambda: cs_service.admin_put_game_record_concurrent_handler_v1_async(
+                    body=cs_models.ModelsAdminConcurrentRecordRequest.create(
+                        set_by=set_by,
+                        updated_at=updated_at,
+                        value=value,
+                    ),
+                    key=gp_key,
+                    namespace=namespace,
+                    sdk=self.sdk,
+                ),
+                retryable=False,
+            )
+            if not self.is_conflict(error):
+                # a rejected write left the record as it was.
+                self.on_guild_progress_written(key)
+            if not error:
+                guild_progress = self.parse_guild_progress(value)
+                await self.set_cached_guild_progress(key, guild_progress)
+                self.hub.publish(key, guild_progress)
+                return guild_progress
+
+            if not self.is_conflict(error):
+                await self.set_cached_guild_progress(key, None)
+                raise create_sdk_rpc_error(error)
+
+            self.increment_conflicts.inc()
+
+        raise create_aio_rpc_error(
+            f"guild progress kept changing, gave up after {self.increment_max_attempts} attempts",
+            StatusCode.ABORTED,
+        )
+
+    async def fetch_guild_progress_bulk(
+        self, namespace: str, gp_keys: List[str]
+    ) -> Dict[str, GuildProgress]:
+        # CloudSave has no admin bulk get for game records ('adminrecords' are a
+        # different store), this needs 'NAMESPACE:{namespace}:CLOUDSAVE:RECORD [READ]'.
+        (
+            response,
+            error,
+        ) = await self.call_sdk(
+            "cloudsave.get_game_records_bulk",
+            lambda: cs_service.get_game_records_bulk_async(
+                body=cs_models.ModelsBulkGetGameRecordRequest.create(keys=gp_keys),
+                namespace=namespace,
+                sdk=self.sdk,
+            ),
+        )
+        if error:
+            raise create_sdk_rpc_error(error)
+
+        return {
+            record.key: self.parse_guild_progress(record.value)
+            for record in response.data or []
+        }
+
+    async def get_guild_progress_batch(
+        self, namespace: str, gp_keys: List[str]
+    ) -> Dict[str, Union[GuildProgress, Exception]]:
+        results: Dict[str, Union[GuildProgress, Exception]] = {}
+
+        misses = []
+        for gp_key in dict.fromkeys(gp_keys):
+            guild_progress = await self.get_cached_guild_progress((namespace, gp_key))
+            if guild_progress is not None:
+                self.cache_metrics.on_hit()
+                results[gp_key] = guild_progress
+            else:
+                misses.append(gp_key)
+
+        semaphore = asyncio.Semaphore(self.batch_max_concurrency)
+
+        async def get_one(gp_key: str) -> None:
+            async with semaphore:
+                try:
+                    results[gp_key] = await self.get_guild_progress(namespace, gp_key)
+                except Exception as e:
+                    results[gp_key] = e
+
+        async def get_chunk(chunk: List[str]) -> None:
+            if not self.bulk_get_enabled:
+                await asyncio.gather(*(get_one(gp_key) for gp_key in chunk))
+                return
+
+            generations = [
+                self.write_generations.begin_read((namespace, gp_key)) for gp_key in chunk
+            ]
+            try:
+                async with semaphore:
+                    start = time.perf_counter()
+                    records = await self.fetch_guild_progress_bulk(namespace, chunk)
+            except Exception as e:
+                if isinstance(e, AioRpcError) and e.code() == StatusCode.PERMISSION_DENIED:
+                    if self.bulk_get_enabled and self.logger:
+                        self.logger.warning(
+                            "bulk get denied, using single gets from now on: %s", e.details()
+                        )
+                    self.bulk_get_enabled = False
+                elif self.logger:
+                    self.logger.debug("bulk get failed, falling back to single gets: %s", e)
+                await asyncio.gather(*(get_one(gp_key) for gp_key in chunk))
+                return
+            finally:
+                fresh = [
+                    self.write_generations.end_read((namespace, gp_key), generation)
+                    for gp_key, generation in zip(chunk, generations)
+                ]
+
+            if self.cache_metrics is not None:
+                self.cache_metrics.on_miss(time.perf_counter() - start)
+            for gp_key, is_fresh in zip(chunk, fresh):
+                guild_progress = records.get(gp_key, None)
+                if guild_progress is None:
+                    results[gp_key] = create_aio_rpc_error(
+                        f"guild progress not found: {gp_key}", StatusCode.NOT_FOUND
+                    )
+                else:
+                    results[gp_key] = guild_progress
+                    if is_fresh:
+                        await self.set_cached_guild_progress(
+                            (namespace, gp_key), guild_progress
+                        )
+
+        chunks = [
+            misses[i : i + self.MAX_BULK_GET_KEYS]
+            for i in range(0, len(misses), self.MAX_BULK_GET_KEYS)
+        ]
+        await asyncio.gather(*(get_chunk(chunk) for chunk in chunks))
+
+        return results
+
+    @staticmethod
+    def create_guild_progress_result(
+        guild_id: str, result: Union[GuildProgress, Exception]
+    ) -> GuildProgressResult:
+        guild_progress_result = GuildProgressResult(guild_id=guild_id)
+        if isinstance(result, GuildProgress):
+            guild_progress_result.guild_progress.CopyFrom(result)
+        elif isinstance(result, AioRpcError):
+            guild_progress_result.error.code = result.code().value[0]
+            guild_progress_result.error.message = result.details() or ""
+        else:
+            guild_progress_result.error.code = StatusCode.INTERNAL.value[0]
+            guild_progress_result.error.message = str(result)
+        return guild_progress_result
+
+    async def BatchCreateOrUpdateGuildProgress(
+        self, request: BatchCreateOrUpdateGuildProgressRequest, context: Any
+    ) -> BatchCreateOrUpdateGuildProgressResponse:
+        if not request.namespace:
+            raise create_aio_rpc_error("", StatusCode.INVALID_ARGUMENT)
+
+        if len(request.guild_progresses) > self.MAX_BATCH_SIZE:
+            raise create_aio_rpc_error(
+                f"at most {self.MAX_BATCH_SIZE} items per batch", StatusCode.INVALID_ARGUMENT
+            )
+
+        self.log_caller("BatchCreateOrUpdateGuildProgress")
+
+        semaphore = asyncio.Semaphore(self.batch_max_concurrency)
+
+        async def save_one(item: GuildProgress) -> GuildProgressResult:
+            gp_value = GuildProgress()
+            gp_value.CopyFrom(item)
+            gp_value.guild_id = item.guild_id.strip() or self.generate_new_guild_id()
+            gp_key = self.format_guild_progress_key(gp_value.guild_id)
+
+            try:
+                async with semaphore:
+                    if self.writer is not None:
+                        check_deadline()
+                        guild_progress = await self.writer.submit(
+                            (request.namespace, gp_key), gp_value
+                        )
+                    else:
+                        guild_progress = await self.save_guild_progress(
+                            request.namespace, gp_key, gp_value
+                        )
+            except Exception as e:
+                return self.create_guild_progress_result(gp_value.guild_id, e)
+            return self.create_guild_progress_result(gp_value.guild_id, guild_progress)
+
+        # CloudSave has no bulk write for game records, fan out with bounded concurrency.
+        results = await asyncio.gather(
+            *(save_one(item) for item in request.guild_progresses)
+        )
+
+        return BatchCreateOrUpdateGuildProgressResponse(results=results)
+
+    async def BatchGetGuildProgress(
+        self, request: BatchGetGuildProgressRequest, context: Any
+    ) -> BatchGetGuildProgressResponse:
+        if not request.namespace:
+            raise create_aio_rpc_error("", StatusCode.INVALID_ARGUMENT)
+
+        if len(request.guild_ids) > self.MAX_BATCH_SIZE:
+            raise create_aio_rpc_error(
+                f"at most {self.MAX_BATCH_SIZE} items per batch", StatusCode.INVALID_ARGUMENT
+            )
+
+        self.log_caller("BatchGetGuildProgress")
+
+        guild_ids = [guild_id.strip() for guild_id in request.guild_ids]
+        gp_keys = [self.format_guild_progress_key(guild_id) for guild_id in guild_ids]
+
+        results = await self.get_guild_progress_batch(request.namespace, gp_keys)
+
+        return BatchGetGuildProgressResponse(
+            results=[
+                self.create_guild_progress_result(guild_id, results[gp_key])
+                for guild_id, gp_key in zip(guild_ids, gp_keys)
+            ]
+        )
+
     async def CreateOrUpdateGuildProgress(
         self, request: CreateOrUpdateGuildProgressRequest, context: Any
     ) -> CreateOrUpdateGuildProgressResponse:
         if not request.namespace:
             raise create_aio_rpc_error("", StatusCode.INVALID_ARGUMENT)
 
+        self.log_caller("CreateOrUpdateGuildProgress")
+
         guild_id = request.guild_progress.guild_id.strip()
         if not guild_id:
             guild_id = self.generate_new_guild_id()
 
         gp_key = self.format_guild_progress_key(guild_id)
-        gp_value = cs_models.ModelsGameRecordRequest()
-        gp_value["guild_id"] = guild_id
-        gp_value["namespace"] = request.guild_progress.namespace
-        gp_value["objectives"] = dict(request.guild_progress.objectives)
+        gp_value = GuildProgress()
+        gp_value.CopyFrom(request.guild_progress)
+        gp_value.guild_id = guild_id
 
-        (
-            response,
-            error,
-        ) = await cs_service.admin_post_game_record_handler_v1_async(
-            body=gp_value,
-            key=gp_key,
-            namespace=request.namespace,
-            sdk=self.sdk,
-        )
-        if error:
-            raise Exception(error)
+        if self.writer is not None:
+            check_deadline()
+            guild_progress = await self.writer.submit((request.namespace, gp_key), gp_value)
+        else:
+            guild_progress = await self.save_guild_progress(
+                request.namespace, gp_key, gp_value
+            )
 
         result = CreateOrUpdateGuildProgressResponse()
-        result.guild_progress.guild_id = response.value["guild_id"]
-        result.guild_progress.namespace = response.value["namespace"]
-        for k, v in response.value["objectives"].items():
-            result.guild_progress.objectives[k] = v
+        result.guild_progress.CopyFrom(guild_progress)
 
         return result
 
@@ -91,23 +688,66 @@ class AsyncService(ServiceServicer):
         if not request.namespace:
             raise create_aio_rpc_error("", StatusCode.INVALID_ARGUMENT)
 
+        self.log_caller("GetGuildProgress")
+
         gp_key = self.format_guild_progress_key(request.guild_id.strip())
 
-        (
-            response,
-            error,
-        ) = await cs_service.admin_get_game_record_handler_v1_async(
-            key=gp_key,
-            namespace=request.namespace,
-            sdk=self.sdk,
-        )
-        if error:
-            raise Exception(error)
+        guild_progress = await self.get_guild_progress(request.namespace, gp_key)
 
         result = GetGuildProgressResponse()
-        result.guild_progress.guild_id = response.value["guild_id"]
-        result.guild_progress.namespace = response.value["namespace"]
-        for k, v in response.value["objectives"].items():
-            result.guild_progress.objectives[k] = v
+        result.guild_progress.CopyFrom(guild_progress)
+
+        return result
+
+    async def WatchGuildProgress(
+        self, request: WatchGuildProgressRequest, context: Any
+    ) -> AsyncIterator[WatchGuildProgressResponse]:
+        if not request.namespace:
+            raise create_aio_rpc_error("", StatusCode.INVALID_ARGUMENT)
+
+        self.log_caller("WatchGuildProgress")
+
+        gp_key = self.format_guild_progress_key(request.guild_id.strip())
+        key = (request.namespace, gp_key)
+
+        # subscribe before reading so no commit between the two is missed.
+        subscription = self.hub.subscribe(key)
+        try:
+            if self.hub.get_state(key) is None:
+                version = self.hub.get_version(key)
+                guild_progress = await self.get_guild_progress(request.namespace, gp_key)
+                # a change published meanwhile (e.g. by the read itself) is newer, and the snapshot.
+                if self.hub.get_state(key) is None:
+                    self.hub.publish(key, guild_progress, version=version)
+
+            async for change in subscription:
+                result = WatchGuildProgressResponse(snapshot=change.is_snapshot)
+                result.guild_progress.CopyFrom(change.guild_progress)
+                yield result
+        except SubscriptionDroppedError as e:
+            raise create_aio_rpc_error(str(e), StatusCode.RESOURCE_EXHAUSTED)
+        finally:
+            subscription.close()
+
+    async def IncrementGuildObjectives(
+        self, request: IncrementGuildObjectivesRequest, context: Any
+    ) -> IncrementGuildObjectivesResponse:
+        if not request.namespace:
+            raise create_aio_rpc_error("", StatusCode.INVALID_ARGUMENT)
+
+        guild_id = request.guild_id.strip()
+        if not guild_id:
+            raise create_aio_rpc_error("guild_id is required", StatusCode.INVALID_ARGUMENT)
+
+        self.log_caller("IncrementGuildObjectives")
+
+        gp_key = self.format_guild_progress_key(guild_id)
+
+        guild_progress = await self.increment_guild_objectives(
+            request.namespace, gp_key, guild_id, dict(request.deltas)
+        )
+
+        result = IncrementGuildObjectivesResponse()
+        result.guild_progress.CopyFrom(guild_progress)
 
         return result
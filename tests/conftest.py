@@ -0,0 +1,27 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import pytest
+
+from prometheus_client import REGISTRY
+
+
+@pytest.fixture(scope="module", autouse=True)
+def prometheus_registry():
+    """Unregisters the metrics created by a test module once it is done, so
+    that other modules can create the same components again."""
+    collectors = []
+    register = REGISTRY.register
+
+    def register_and_track(collector):
+        register(collector)
+        collectors.append(collector)
+
+    REGISTRY.register = register_and_track
+    try:
+        yield REGISTRY
+    finally:
+        del REGISTRY.register
+        for collector in collectors:
+            REGISTRY.unregister(collector)
@@ -0,0 +1,176 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import time
+
+from types import SimpleNamespace
+
+import grpc
+import pytest
+
+from grpc import StatusCode
+
+from accelbyte_py_sdk.token_validation._ctypes import InsufficientPermissionsError
+
+# registers the service and its permission options in the descriptor pool.
+import app.proto.service_pb2  # noqa: F401
+
+from accelbyte_grpc_plugin.interceptors.authorization import AuthorizationServerInterceptor
+
+NAMESPACE = "test"
+GET_GUILD_PROGRESS = "/service.Service/GetGuildProgress"
+
+
+class Abort(Exception):
+    def __init__(self, code: StatusCode, details: str) -> None:
+        super().__init__(details)
+        self.code = code
+
+
+class FakeContext:
+    async def abort(self, code, details="", trailing_metadata=()):
+        raise Abort(code, details)
+
+
+class FakeTokenValidator:
+    def __init__(self) -> None:
+        self.calls = []
+        self.error = None
+        self.claims = {"sub": "user", "namespace": NAMESPACE}
+        self.revocation_list_listeners = []
+
+    def add_revocation_list_listener(self, listener) -> None:
+        self.revocation_list_listeners.append(listener)
+
+    async def validate_token_async(self, token, resource=None, action=None, **kwargs):
+        claims, error = await self.validate_token_claims_async(token, resource, action, **kwargs)
+        return error
+
+    async def validate_token_claims_async(self, token, resource=None, action=None, **kwargs):
+        self.calls.append((token, resource, action))
+        if self.error is not None:
+            return None, self.error
+        return dict(self.claims), None
+
+
+@pytest.fixture(scope="module")
+def revocation_list_source() -> FakeTokenValidator:
+    # the validator the interceptor was created with, it holds its revocation list listener.
+    return FakeTokenValidator()
+
+
+@pytest.fixture(scope="module")
+def interceptor(revocation_list_source) -> AuthorizationServerInterceptor:
+    # metrics are registered globally, the interceptor is shared by the tests.
+    return AuthorizationServerInterceptor(
+        token_validator=revocation_list_source, namespace=NAMESPACE
+    )
+
+
+@pytest.fixture
+def token_validator(interceptor) -> FakeTokenValidator:
+    interceptor.async_token_validator = interceptor.token_validator = FakeTokenValidator()
+    if interceptor.token_cache is not None:
+        interceptor.token_cache.clear()
+    return interceptor.async_token_validator
+
+
+def call(interceptor, method: str, token: str = "token"):
+    async def ok(request, context):
+        return "ok"
+
+    async def continuation(handler_call_details):
+        return grpc.unary_unary_rpc_method_handler(ok)
+
+    async def run():
+        handler_call_details = SimpleNamespace(
+            method=method,
+            invocation_metadata=[SimpleNamespace(key="authorization", value=f"Bearer {token}")],
+        )
+        handler = await interceptor.intercept_service(continuation, handler_call_details)
+        return await handler.unary_unary(None, FakeContext())
+
+    return asyncio.run(run())
+
+
+def test_methods_missing_from_the_policies_are_resolved(interceptor, token_validator):
+    # e.g. a service registered after the policies were built.
+    interceptor.build_method_policies(service_names=[])
+    assert GET_GUILD_PROGRESS not in interceptor.method_policies
+
+    assert call(interceptor, GET_GUILD_PROGRESS) == "ok"
+    assert token_validator.calls == [
+        ("token", "ADMIN:NAMESPACE:{namespace}:CLOUDSAVE:RECORD", 2),
+    ]
+    assert GET_GUILD_PROGRESS in interceptor.resolved_method_policies
+
+
+def test_unknown_methods_are_rejected(interceptor, token_validator):
+    interceptor.build_method_policies(service_names=["service.Service"])
+
+    with pytest.raises(Abort) as e:
+        call(interceptor, "/service.Service/Unknown")
+
+    assert e.value.code == StatusCode.INTERNAL
+    assert not token_validator.calls
+    assert "/service.Service/Unknown" not in interceptor.resolved_method_policies
+
+
+def test_verified_tokens_are_cached(interceptor, token_validator):
+    interceptor.build_method_policies(service_names=["service.Service"])
+
+    assert call(interceptor, GET_GUILD_PROGRESS) == "ok"
+    assert call(interceptor, GET_GUILD_PROGRESS) == "ok"
+    assert call(interceptor, GET_GUILD_PROGRESS, token="other") == "ok"
+
+    assert [token for token, _, _ in token_validator.calls] == ["token", "other"]
+
+
+def test_definite_verdicts_are_cached(interceptor, token_validator):
+    interceptor.build_method_policies(service_names=["service.Service"])
+    token_validator.error = InsufficientPermissionsError()
+
+    for _ in range(2):
+        with pytest.raises(Abort) as e:
+            call(interceptor, GET_GUILD_PROGRESS)
+        assert e.value.code == StatusCode.PERMISSION_DENIED
+
+    assert len(token_validator.calls) == 1
+
+
+def test_transient_failures_are_not_cached(interceptor, token_validator):
+    interceptor.build_method_policies(service_names=["service.Service"])
+    token_validator.error = Exception("jwks fetch timed out")
+
+    with pytest.raises(Abort) as e:
+        call(interceptor, GET_GUILD_PROGRESS)
+    assert e.value.code == StatusCode.UNAUTHENTICATED
+
+    token_validator.error = None
+    assert call(interceptor, GET_GUILD_PROGRESS) == "ok"
+    assert len(token_validator.calls) == 2
+
+
+def test_tokens_are_not_cached_past_their_expiry(interceptor, token_validator):
+    interceptor.build_method_policies(service_names=["service.Service"])
+    token_validator.claims["exp"] = int(time.time()) - 1
+
+    call(interceptor, GET_GUILD_PROGRESS)
+    call(interceptor, GET_GUILD_PROGRESS)
+
+    assert len(token_validator.calls) == 2
+
+
+def test_revocation_list_updates_clear_the_cache(
+    interceptor, token_validator, revocation_list_source
+):
+    interceptor.build_method_policies(service_names=["service.Service"])
+    call(interceptor, GET_GUILD_PROGRESS)
+
+    for listener in revocation_list_source.revocation_list_listeners:
+        listener()
+    call(interceptor, GET_GUILD_PROGRESS)
+
+    assert len(token_validator.calls) == 2
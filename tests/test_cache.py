@@ -0,0 +1,100 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+from accelbyte_grpc_plugin.cache import TTLCache
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_cache(**kwargs):
+    timer = FakeTimer()
+    evicted = []
+    cache = TTLCache(
+        timer=timer, on_evict=lambda key, value: evicted.append(key), **kwargs
+    )
+    return cache, timer, evicted
+
+
+def test_entries_expire_after_their_ttl():
+    cache, timer, evicted = create_cache(max_size=10, ttl=10.0)
+    cache.set("a", "1")
+    # a shorter ttl is kept, a longer one is capped.
+    cache.set("b", "2", ttl=5.0)
+    cache.set("c", "3", ttl=60.0)
+
+    timer.now += 5.0
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+
+    timer.now += 5.0
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert evicted == ["b", "a", "c"]
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache, timer, evicted = create_cache(max_size=2, ttl=10.0)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+
+    cache.set("c", "3")
+
+    assert evicted == ["b"]
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_entries_are_evicted_to_stay_under_max_bytes():
+    cache, timer, evicted = create_cache(max_size=10, ttl=10.0, max_bytes=10)
+    cache.set("a", "1234")
+    cache.set("b", "1234")
+    # replacing a value accounts for the old one.
+    cache.set("a", "12")
+    assert cache.bytes == 6
+    assert not evicted
+
+    cache.set("c", "12345")
+
+    assert evicted == ["b"]
+    assert cache.bytes == 7
+
+    # a value larger than max_bytes is not cached, the previous one is dropped.
+    cache.set("c", "12345678901")
+    assert cache.get("c") is None
+    assert cache.get("a") == "12"
+    assert cache.bytes == 2
+
+
+def test_unusable_ttls_and_sizes_cache_nothing():
+    cache, timer, evicted = create_cache(max_size=10, ttl=10.0)
+    cache.set("a", "1", ttl=0.0)
+    assert cache.get("a") is None
+
+    cache, timer, evicted = create_cache(max_size=0, ttl=10.0)
+    cache.set("a", "1")
+    assert cache.get("a") is None
+
+
+def test_delete_and_clear():
+    cache, timer, evicted = create_cache(max_size=10, ttl=10.0, max_bytes=100)
+    cache.set("a", "1")
+    cache.set("b", "22")
+
+    assert cache.delete("a") == "1"
+    assert cache.delete("a") is None
+    assert evicted == ["a"]
+    assert cache.bytes == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.bytes == 0
+    assert cache.get("b") is None
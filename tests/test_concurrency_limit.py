@@ -0,0 +1,157 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+
+from types import SimpleNamespace
+
+import grpc
+import pytest
+
+from grpc import StatusCode
+
+from accelbyte_grpc_plugin.interceptors.concurrency_limit import (
+    ConcurrencyLimitServerInterceptor,
+    GradientLimit,
+)
+
+
+class Abort(Exception):
+    def __init__(self, code: StatusCode, trailing_metadata) -> None:
+        super().__init__(code)
+        self.status_code = code
+        self.trailing_metadata = dict(trailing_metadata)
+
+    def code(self) -> StatusCode:
+        return self.status_code
+
+
+class FakeContext:
+    async def abort(self, code, details="", trailing_metadata=()):
+        raise Abort(code, trailing_metadata)
+
+
+class DeadlineExceeded(Exception):
+    def code(self) -> StatusCode:
+        return StatusCode.DEADLINE_EXCEEDED
+
+
+@pytest.fixture(scope="module")
+def interceptor() -> ConcurrencyLimitServerInterceptor:
+    # metrics are registered globally, the interceptor is shared by the tests.
+    return ConcurrencyLimitServerInterceptor()
+
+
+def set_limit(interceptor, method: str, limit: int) -> GradientLimit:
+    interceptor.limits[method] = GradientLimit(initial_limit=limit)
+    return interceptor.limits[method]
+
+
+async def intercept(interceptor, method: str, behavior):
+    async def continuation(handler_call_details):
+        return grpc.unary_unary_rpc_method_handler(behavior)
+
+    handler = await interceptor.intercept_service(continuation, SimpleNamespace(method=method))
+    return handler.unary_unary
+
+
+def test_calls_never_dispatched_do_not_hold_a_slot(interceptor):
+    method = "/test.Service/NeverDispatched"
+    limit = set_limit(interceptor, method, 1)
+
+    async def ok(request, context):
+        return "ok"
+
+    async def run():
+        # e.g. cancelled while the request was read, the behaviors never run.
+        for _ in range(5):
+            await intercept(interceptor, method, ok)
+        behavior = await intercept(interceptor, method, ok)
+        return await behavior(None, FakeContext())
+
+    assert asyncio.run(run()) == "ok"
+    assert limit.in_flight == 0
+
+
+def test_sheds_above_limit_and_releases_cancelled_calls(interceptor):
+    method = "/test.Service/Shed"
+    limit = set_limit(interceptor, method, 1)
+
+    async def run():
+        started = asyncio.Event()
+
+        async def block(request, context):
+            started.set()
+            await asyncio.Event().wait()
+
+        behavior = await intercept(interceptor, method, block)
+        blocked = asyncio.ensure_future(behavior(None, FakeContext()))
+        await started.wait()
+        assert limit.in_flight == 1
+
+        shed = await intercept(interceptor, method, block)
+        with pytest.raises(Abort) as e:
+            await shed(None, FakeContext())
+        assert e.value.code() == StatusCode.RESOURCE_EXHAUSTED
+        assert "grpc-retry-pushback-ms" in e.value.trailing_metadata
+        assert "retry-after" in e.value.trailing_metadata
+
+        blocked.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await blocked
+
+    asyncio.run(run())
+    assert limit.in_flight == 0
+
+
+def test_sheds_calls_dispatched_after_the_limit_was_reached(interceptor):
+    method = "/test.Service/Dispatched"
+    limit = set_limit(interceptor, method, 1)
+
+    async def run():
+        release = asyncio.Event()
+
+        async def wait(request, context):
+            await release.wait()
+            return "ok"
+
+        # both pass the early check, only one gets a slot when dispatched.
+        first = await intercept(interceptor, method, wait)
+        second = await intercept(interceptor, method, wait)
+        admitted = asyncio.ensure_future(first(None, FakeContext()))
+        await asyncio.sleep(0)
+        with pytest.raises(Abort) as e:
+            await second(None, FakeContext())
+        assert e.value.code() == StatusCode.RESOURCE_EXHAUSTED
+        release.set()
+        return await admitted
+
+    assert asyncio.run(run()) == "ok"
+    assert limit.in_flight == 0
+
+
+def test_overload_failures_shrink_the_limit(interceptor):
+    method = "/test.Service/Overloaded"
+    limit = set_limit(interceptor, method, 20)
+
+    async def fail(request, context):
+        raise DeadlineExceeded()
+
+    async def run():
+        behavior = await intercept(interceptor, method, fail)
+        with pytest.raises(DeadlineExceeded):
+            await behavior(None, FakeContext())
+
+    asyncio.run(run())
+    assert limit.in_flight == 0
+    assert limit.limit == 20 * GradientLimit.DEFAULT_BACKOFF_RATIO
+
+
+def test_explicit_zero_is_not_replaced_by_defaults():
+    limit = GradientLimit(min_limit=0)
+    limit.set_limit(0)
+
+    assert limit.min_limit == 0
+    assert limit.limit == 0
+    assert not limit.try_acquire()
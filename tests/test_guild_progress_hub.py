@@ -0,0 +1,187 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+
+import pytest
+
+from prometheus_client import REGISTRY
+
+from app.proto.service_pb2 import GuildProgress
+from app.services.guild_progress_hub import (
+    GuildProgressHub,
+    OverflowPolicy,
+    SubscriptionDroppedError,
+)
+
+KEY = ("test", "guildProgress_1")
+
+
+@pytest.fixture(scope="module")
+def shared_hub() -> GuildProgressHub:
+    # metrics are registered globally, the hub is shared by the tests.
+    return GuildProgressHub(poll_interval=0)
+
+
+@pytest.fixture
+def hub(shared_hub) -> GuildProgressHub:
+    yield shared_hub
+    for subscriptions in list(shared_hub.subscriptions.values()):
+        for subscription in list(subscriptions):
+            subscription.close()
+    shared_hub.fetch = None
+    shared_hub.poll_interval = 0
+    shared_hub.max_queue_size = GuildProgressHub.DEFAULT_MAX_QUEUE_SIZE
+    shared_hub.overflow_policy = OverflowPolicy.CONFLATE
+
+
+def progress(**objectives) -> GuildProgress:
+    return GuildProgress(guild_id="1", namespace="test", objectives=objectives)
+
+
+def drain(subscription):
+    changes = list(subscription.queue)
+    for _ in changes:
+        subscription.hub.on_dequeue()
+    subscription.queue.clear()
+    return [(dict(c.guild_progress.objectives), c.is_snapshot) for c in changes]
+
+
+def get_queue_depth() -> float:
+    return REGISTRY.get_sample_value("guild_progress_watch_queue_depth")
+
+
+def test_subscribers_get_a_snapshot_then_deltas(hub):
+    async def run():
+        hub.subscribe(KEY)
+        assert hub.publish(KEY, progress(kills=1, wins=1))
+        late = hub.subscribe(KEY)
+        assert drain(late) == [({"kills": 1, "wins": 1}, True)]
+
+        assert hub.publish(KEY, progress(kills=2, wins=1))
+        # nothing changed, nothing is sent.
+        assert hub.publish(KEY, progress(kills=2, wins=1))
+        # a removed objective cannot be sent as a delta.
+        assert hub.publish(KEY, progress(kills=2))
+        return drain(late)
+
+    changes = asyncio.run(run())
+
+    assert changes == [({"kills": 2}, False), ({"kills": 2}, True)]
+
+
+def test_waiting_subscribers_are_woken_in_order(hub):
+    async def run():
+        subscription = hub.subscribe(KEY)
+
+        async def receive(n):
+            changes = [await subscription.__anext__() for _ in range(n)]
+            return [dict(c.guild_progress.objectives) for c in changes]
+
+        receiver = asyncio.ensure_future(receive(3))
+        await asyncio.sleep(0)
+        for kills in (1, 2, 3):
+            hub.publish(KEY, progress(kills=kills))
+            await asyncio.sleep(0)
+        return await asyncio.wait_for(receiver, timeout=1)
+
+    assert asyncio.run(run()) == [{"kills": 1}, {"kills": 2}, {"kills": 3}]
+    assert get_queue_depth() == 0
+
+
+def test_reads_older_than_the_last_change_are_not_published(hub):
+    async def run():
+        subscription = hub.subscribe(KEY)
+        # a read starts, then a write is published before it returns.
+        version = hub.get_version(KEY)
+        assert hub.publish(KEY, progress(kills=5))
+        published = hub.publish(KEY, progress(kills=4), version=version)
+
+        # a read started after the write is published.
+        assert hub.publish(KEY, progress(kills=6), version=hub.get_version(KEY))
+        return published, drain(subscription)
+
+    stale_reads = REGISTRY.get_sample_value("guild_progress_watch_stale_reads_count_total")
+    published, changes = asyncio.run(run())
+
+    assert not published
+    assert changes == [({"kills": 5}, True), ({"kills": 6}, False)]
+    assert hub.get_state(KEY).objectives["kills"] == 6
+    assert (
+        REGISTRY.get_sample_value("guild_progress_watch_stale_reads_count_total")
+        == stale_reads + 1
+    )
+
+
+def test_full_queues_are_conflated(hub):
+    hub.max_queue_size = 2
+
+    async def run():
+        subscription = hub.subscribe(KEY)
+        hub.publish(KEY, progress(kills=1, wins=1))
+        hub.publish(KEY, progress(kills=2, wins=1))
+        hub.publish(KEY, progress(kills=2, wins=2))
+        return drain(subscription)
+
+    # the snapshot and the deltas after it are merged into a single snapshot.
+    assert asyncio.run(run()) == [({"kills": 2, "wins": 2}, True)]
+    assert get_queue_depth() == 0
+
+
+def test_slow_subscribers_are_dropped(hub):
+    hub.max_queue_size = 2
+    hub.overflow_policy = OverflowPolicy.DROP
+
+    async def run():
+        subscription = hub.subscribe(KEY)
+        other = hub.subscribe(KEY)
+        for kills in (1, 2):
+            hub.publish(KEY, progress(kills=kills))
+        drain(other)
+        hub.publish(KEY, progress(kills=3))
+
+        with pytest.raises(SubscriptionDroppedError):
+            await subscription.__anext__()
+        return drain(other)
+
+    assert asyncio.run(run()) == [({"kills": 3}, False)]
+    assert get_queue_depth() == 0
+
+
+def test_pollers_publish_and_stop_with_the_last_subscriber(hub):
+    fetches = []
+
+    async def fetch(key):
+        fetches.append(key)
+        if len(fetches) == 1:
+            raise RuntimeError("cloudsave is down")
+        return progress(kills=len(fetches))
+
+    hub.fetch = fetch
+    hub.poll_interval = 0.001
+
+    async def run():
+        first = hub.subscribe(KEY)
+        second = hub.subscribe(KEY)
+        poller = hub.pollers[KEY]
+        # a failed poll is retried on the next interval.
+        while not first.queue:
+            await asyncio.sleep(0.001)
+        change = await first.__anext__()
+
+        first.close()
+        assert not poller.done()
+        second.close()
+        await asyncio.sleep(0)
+        return change, poller
+
+    change, poller = asyncio.run(run())
+
+    assert change.is_snapshot
+    assert change.guild_progress.objectives["kills"] == 2
+    assert poller.cancelled()
+    assert KEY not in hub.pollers
+    assert hub.get_state(KEY) is None
+    assert hub.get_version(KEY) == 0
+    assert get_queue_depth() == 0
@@ -0,0 +1,138 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+
+import pytest
+
+from app.proto.service_pb2 import GuildProgress
+from app.services.guild_progress_writer import GuildProgressWriteBehind
+
+KEY = ("test", "guildProgress_1")
+
+
+class FakeWrite:
+    """Records the written guild progress, writes wait for 'release' when set."""
+
+    def __init__(self) -> None:
+        self.writes = []
+        self.started = asyncio.Event()
+        self.release = None
+        self.error = None
+
+    async def __call__(self, namespace: str, gp_key: str, guild_progress: GuildProgress):
+        self.writes.append(dict(guild_progress.objectives))
+        self.started.set()
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        result = GuildProgress()
+        result.CopyFrom(guild_progress)
+        return result
+
+
+@pytest.fixture(scope="module")
+def writer() -> GuildProgressWriteBehind:
+    # metrics are registered globally, the writer is shared by the tests.
+    return GuildProgressWriteBehind(write=None, window=0.01)
+
+
+def update(**objectives) -> GuildProgress:
+    return GuildProgress(guild_id="1", namespace="test", objectives=objectives)
+
+
+def test_updates_within_the_window_are_written_once(writer):
+    async def run():
+        writer.write = write = FakeWrite()
+        results = await asyncio.gather(
+            writer.submit(KEY, update(kills=1)),
+            writer.submit(KEY, update(kills=2, wins=1)),
+        )
+        return write, results
+
+    write, results = asyncio.run(run())
+
+    assert write.writes == [{"kills": 2, "wins": 1}]
+    assert [dict(r.objectives) for r in results] == [{"kills": 2, "wins": 1}] * 2
+
+
+def test_write_failures_reach_every_submitter(writer):
+    async def run():
+        writer.write = write = FakeWrite()
+        write.error = RuntimeError("cloudsave is down")
+        return await asyncio.gather(
+            writer.submit(KEY, update(kills=1)),
+            writer.submit(KEY, update(kills=2)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_cancelled_flushes_do_not_leave_submitters_waiting(writer):
+    async def run():
+        writer.write = write = FakeWrite()
+        write.release = asyncio.Event()
+        first = asyncio.ensure_future(writer.submit(KEY, update(kills=1)))
+        await write.started.wait()
+        first_flush = writer.flushes[KEY]
+
+        # queued behind the first flush, which is still writing.
+        second = asyncio.ensure_future(writer.submit(KEY, update(kills=2)))
+        await asyncio.sleep(0)
+        writer.flush(KEY)
+        second_flush = writer.flushes[KEY]
+        await asyncio.sleep(0)
+
+        second_flush.cancel()
+        await asyncio.wait([second], timeout=1)
+        assert second.cancelled()
+        assert not first.done()
+
+        first_flush.cancel()
+        await asyncio.wait([first], timeout=1)
+        assert first.cancelled()
+        return write
+
+    write = asyncio.run(run())
+
+    assert write.writes == [{"kills": 1}]
+
+
+def test_cancelled_submitters_keep_their_update(writer):
+    async def run():
+        writer.write = write = FakeWrite()
+        submit = asyncio.ensure_future(writer.submit(KEY, update(kills=1)))
+        await asyncio.sleep(0)
+        submit.cancel()
+        await writer.drain(KEY)
+        return write
+
+    write = asyncio.run(run())
+
+    assert write.writes == [{"kills": 1}]
+
+
+def test_close_writes_pending_batches(writer):
+    async def run():
+        writer.write = write = FakeWrite()
+        writer.window = 60
+        submit = asyncio.ensure_future(writer.submit(KEY, update(kills=1)))
+        await asyncio.sleep(0)
+        await writer.close()
+        await submit
+        # later updates are written directly.
+        await writer.submit(KEY, update(kills=2))
+        return write
+
+    try:
+        write = asyncio.run(run())
+    finally:
+        writer.window = 0.01
+        writer.is_closed = False
+
+    assert write.writes == [{"kills": 1}, {"kills": 2}]
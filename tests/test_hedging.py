@@ -0,0 +1,184 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+
+import pytest
+
+from prometheus_client import REGISTRY
+
+from accelbyte_grpc_plugin.hedging import HedgingPolicy, LatencyTracker
+from accelbyte_grpc_plugin.resilience import RetryBudget
+
+ENDPOINT = "cloudsave.test"
+
+
+class FakeError:
+    def __init__(self, http_status: int) -> None:
+        self.http_status = http_status
+
+
+class FakeAttempts:
+    """Attempt i waits for 'releases[i]' (if any) and returns 'results[i]'."""
+
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.releases = [asyncio.Event() for _ in results]
+        self.cancelled = []
+        self.calls = 0
+
+    async def __call__(self):
+        i = self.calls
+        self.calls += 1
+        try:
+            await self.releases[i].wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(i)
+            raise
+        return self.results[i]
+
+
+@pytest.fixture(scope="module")
+def shared_policy() -> HedgingPolicy:
+    # metrics are registered globally, the policy is shared by the tests.
+    return HedgingPolicy(min_delay=0.0)
+
+
+@pytest.fixture
+def policy(shared_policy) -> HedgingPolicy:
+    shared_policy.budget = RetryBudget(ratio=1.0, min_retries_per_second=0.0, max_tokens=10.0)
+    shared_policy.trackers.clear()
+    return shared_policy
+
+
+def set_latency(policy, latency: float) -> LatencyTracker:
+    tracker = LatencyTracker(percentile=policy.percentile, update_interval=1, min_samples=1)
+    tracker.add(latency)
+    policy.trackers[ENDPOINT] = tracker
+    return tracker
+
+
+def get_count(name: str) -> float:
+    return REGISTRY.get_sample_value(f"{name}_count_total", {"endpoint": ENDPOINT}) or 0.0
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(percentile=0.9, window_size=10, update_interval=5, min_samples=10)
+    for latency in range(1, 10):
+        tracker.add(latency)
+    assert tracker.get() is None
+
+    tracker.add(10)
+    assert tracker.get() == 9
+
+    # only recomputed every 5 samples, over the last 10.
+    for _ in range(4):
+        tracker.add(100)
+    assert tracker.get() == 9
+    tracker.add(100)
+    assert tracker.get() == 100
+
+
+def test_no_hedges_until_the_latency_is_known(policy):
+    async def run():
+        attempts = FakeAttempts(("ok", None))
+        attempts.releases[0].set()
+        return attempts, await policy.call(ENDPOINT, attempts)
+
+    attempts, result = asyncio.run(run())
+
+    assert result == ("ok", None)
+    assert attempts.calls == 1
+    # the attempt is recorded, the percentile needs more samples.
+    assert len(policy.get_tracker(ENDPOINT).samples) == 1
+
+
+def test_slow_requests_are_hedged_and_the_loser_cancelled(policy):
+    tracker = set_latency(policy, 0.001)
+    fired, won = get_count("sdk_hedges_fired"), get_count("sdk_hedges_won")
+
+    async def run():
+        attempts = FakeAttempts(("primary", None), ("hedge", None))
+        attempts.releases[1].set()
+        return attempts, await policy.call(ENDPOINT, attempts)
+
+    attempts, result = asyncio.run(run())
+
+    assert result == ("hedge", None)
+    assert attempts.cancelled == [0]
+    assert get_count("sdk_hedges_fired") == fired + 1
+    assert get_count("sdk_hedges_won") == won + 1
+    # both attempts are recorded, the cancelled one as at least the hedge delay.
+    assert len(tracker.samples) == 3
+    assert max(tracker.samples) >= 0.001
+
+
+def test_failed_attempts_wait_for_the_other_one(policy):
+    set_latency(policy, 0.001)
+
+    async def run():
+        attempts = FakeAttempts((None, FakeError(503)), ("hedge", None))
+        hedged = asyncio.ensure_future(policy.call(ENDPOINT, attempts))
+        while attempts.calls < 2:
+            await asyncio.sleep(0.001)
+        attempts.releases[0].set()
+        await asyncio.sleep(0.001)
+        assert not hedged.done()
+        attempts.releases[1].set()
+        return await hedged
+
+    assert asyncio.run(run()) == ("hedge", None)
+
+
+def test_the_last_failure_is_returned(policy):
+    set_latency(policy, 0.001)
+    error = FakeError(503)
+
+    async def run():
+        attempts = FakeAttempts((None, FakeError(500)), (None, error))
+        hedged = asyncio.ensure_future(policy.call(ENDPOINT, attempts))
+        while attempts.calls < 2:
+            await asyncio.sleep(0.001)
+        attempts.releases[0].set()
+        await asyncio.sleep(0.001)
+        attempts.releases[1].set()
+        return await hedged
+
+    assert asyncio.run(run()) == (None, error)
+
+
+def test_hedges_are_capped_by_the_budget(policy):
+    set_latency(policy, 0.001)
+    policy.budget = RetryBudget(ratio=0.0, min_retries_per_second=0.0, max_tokens=0.0)
+    denied = get_count("sdk_hedges_denied")
+
+    async def run():
+        attempts = FakeAttempts(("primary", None))
+        asyncio.get_running_loop().call_later(0.01, attempts.releases[0].set)
+        return attempts, await policy.call(ENDPOINT, attempts)
+
+    attempts, result = asyncio.run(run())
+
+    assert result == ("primary", None)
+    assert attempts.calls == 1
+    assert get_count("sdk_hedges_denied") == denied + 1
+
+
+def test_cancelled_callers_cancel_every_attempt(policy):
+    set_latency(policy, 0.001)
+
+    async def run():
+        attempts = FakeAttempts(("primary", None), ("hedge", None))
+        hedged = asyncio.ensure_future(policy.call(ENDPOINT, attempts))
+        while attempts.calls < 2:
+            await asyncio.sleep(0.001)
+        hedged.cancel()
+        await asyncio.wait([hedged])
+        await asyncio.sleep(0)
+        return attempts, hedged
+
+    attempts, hedged = asyncio.run(run())
+
+    assert hedged.cancelled()
+    assert sorted(attempts.cancelled) == [0, 1]
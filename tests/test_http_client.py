@@ -0,0 +1,79 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import logging
+
+import httpcore
+import pytest
+
+from accelbyte_grpc_plugin import http_client
+from accelbyte_grpc_plugin.http_client import (
+    AsyncDNSCachingNetworkBackend,
+    DNSCachingNetworkBackend,
+    InstrumentedAsyncHTTPTransport,
+    TimeoutHTTPTransport,
+    create_httpx_http_client,
+)
+
+
+def close(http) -> None:
+    http.client.close()
+
+    async def aclose():
+        await http.client_async.aclose()
+
+    asyncio.run(aclose())
+
+
+def test_clients_are_built_on_the_tuned_transports():
+    # no metrics, the pool metrics are registered globally.
+    http = create_httpx_http_client(read_timeout=5.0, metrics=False)
+    try:
+        assert isinstance(http.transport, TimeoutHTTPTransport)
+        assert isinstance(http.transport_async, InstrumentedAsyncHTTPTransport)
+        # the clients use the transports, none are left behind to be closed.
+        assert http.client._transport is http.transport
+        assert http.client_async._transport is http.transport_async
+        assert http.client_async.timeout.read == 5.0
+    finally:
+        close(http)
+
+
+def test_the_dns_cache_wraps_both_pools():
+    http = create_httpx_http_client(dns_cache_ttl=10.0, metrics=False)
+    try:
+        backend = http.transport._pool._network_backend
+        backend_async = http.transport_async._pool._network_backend
+        assert isinstance(backend, DNSCachingNetworkBackend)
+        assert isinstance(backend_async, AsyncDNSCachingNetworkBackend)
+        assert backend.dns_cache is backend_async.dns_cache
+    finally:
+        close(http)
+
+
+def test_the_dns_cache_is_skipped_on_unsupported_httpcore(monkeypatch, caplog):
+    monkeypatch.setattr(httpcore, "__version__", "2.0.0")
+    logger = logging.getLogger("test")
+
+    with caplog.at_level(logging.WARNING, logger="test"):
+        http = create_httpx_http_client(dns_cache_ttl=10.0, metrics=False, logger=logger)
+    try:
+        assert http_client.get_httpcore_version() == (2, 0)
+        assert not isinstance(
+            http.transport_async._pool._network_backend, AsyncDNSCachingNetworkBackend
+        )
+        assert "DNS cache disabled" in caplog.text
+    finally:
+        close(http)
+
+
+@pytest.mark.parametrize("version", ["1.0.9", "0.17.3", "1.1.dev0"])
+def test_supported_httpcore_versions(monkeypatch, version):
+    monkeypatch.setattr(httpcore, "__version__", version)
+    http = create_httpx_http_client(metrics=False)
+    try:
+        assert http_client.is_network_backend_supported(http.transport_async)
+    finally:
+        close(http)
@@ -0,0 +1,200 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import copy
+import logging
+
+import pytest
+
+from accelbyte_py_sdk.api import cloudsave as cs_service
+from accelbyte_py_sdk.api.cloudsave import models as cs_models
+
+from app.proto.service_pb2 import GuildProgress
+from app.services.my_service import AsyncService
+
+NAMESPACE = "test"
+
+
+class FakeCloudSave:
+    """In-memory game records behind the SDK functions the service calls.
+
+    Requests see the records as they are when they arrive and respond after
+    'latency' seconds, so that concurrent requests interleave like remote ones."""
+
+    def __init__(self, latency: float = 0.005) -> None:
+        self.latency = latency
+        self.records = {}
+        self.version = 0
+        self.bulk_gets = 0
+        # the public bulk get needs a permission the client may not have.
+        self.bulk_get_denied = False
+
+    def install(self, monkeypatch) -> "FakeCloudSave":
+        for name in (
+            "admin_get_game_record_handler_v1_async",
+            "admin_post_game_record_handler_v1_async",
+            "admin_put_game_record_concurrent_handler_v1_async",
+            "get_game_records_bulk_async",
+        ):
+            monkeypatch.setattr(cs_service, name, getattr(self, name))
+        return self
+
+    def next_updated_at(self) -> str:
+        self.version += 1
+        return f"2025-01-01T00:00:00.{self.version:06d}Z"
+
+    @staticmethod
+    def create_error(error_code: int, http_status: int) -> cs_models.ModelsResponseError:
+        error = cs_models.ModelsResponseError.create(error_code=error_code, error_message="")
+        setattr(error, "http_status", http_status)
+        return error
+
+    def create_response(self, namespace: str, key: str):
+        record = self.records[(namespace, key)]
+        return cs_models.ModelsGameRecordAdminResponse.create(
+            created_at=record["updated_at"],
+            key=key,
+            namespace=namespace,
+            updated_at=record["updated_at"],
+            value=copy.deepcopy(record["value"]),
+        )
+
+    async def admin_get_game_record_handler_v1_async(self, key, namespace, **kwargs):
+        if (namespace, key) in self.records:
+            result = self.create_response(namespace, key), None
+        else:
+            result = None, self.create_error(AsyncService.RECORD_NOT_FOUND_ERROR_CODE, 404)
+        await asyncio.sleep(self.latency)
+        return result
+
+    async def get_game_records_bulk_async(self, body, namespace, **kwargs):
+        self.bulk_gets += 1
+        if self.bulk_get_denied:
+            result = None, self.create_error(20013, 403)
+        else:
+            result = cs_models.ModelsBulkGetGameRecordResponse.create(
+                data=[
+                    cs_models.ModelsGameRecordResponse.create(
+                        created_at=self.records[(namespace, key)]["updated_at"],
+                        key=key,
+                        namespace=namespace,
+                        updated_at=self.records[(namespace, key)]["updated_at"],
+                        value=copy.deepcopy(self.records[(namespace, key)]["value"]),
+                    )
+                    for key in body.keys
+                    if (namespace, key) in self.records
+                ]
+            ), None
+        await asyncio.sleep(self.latency)
+        return result
+
+    async def admin_post_game_record_handler_v1_async(self, body, key, namespace, **kwargs):
+        # merges the top level fields into the record, creating it if missing.
+        record = self.records.setdefault((namespace, key), {"value": {}})
+        record["value"].update(copy.deepcopy(body.to_dict()))
+        record["updated_at"] = self.next_updated_at()
+        result = self.create_response(namespace, key), None
+        await asyncio.sleep(self.latency)
+        return result
+
+    async def admin_put_game_record_concurrent_handler_v1_async(
+        self, body, key, namespace, **kwargs
+    ):
+        # creates the record, or replaces it if 'updated_at' still matches.
+        record = self.records.get((namespace, key), None)
+        if record is not None and record["updated_at"] != body.updated_at:
+            result = None, self.create_error(AsyncService.PRECONDITION_FAILED_ERROR_CODE, 412)
+        else:
+            self.records[(namespace, key)] = {
+                "value": copy.deepcopy(body.value),
+                "updated_at": self.next_updated_at(),
+            }
+            result = None, None
+        await asyncio.sleep(self.latency)
+        return result
+
+
+@pytest.fixture(scope="module")
+def service() -> AsyncService:
+    # metrics are registered globally, the service is shared by the tests.
+    return AsyncService(
+        sdk=None,
+        logger=logging.getLogger(__name__),
+        write_behind_window=0.05,
+        increment_max_attempts=50,
+    )
+
+
+@pytest.fixture
+def cloudsave(monkeypatch) -> FakeCloudSave:
+    return FakeCloudSave().install(monkeypatch)
+
+
+def test_concurrent_increments_of_missing_record(service, cloudsave):
+    gp_key = service.format_guild_progress_key("new")
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                service.increment_guild_objectives(NAMESPACE, gp_key, "new", {"kills": 1})
+                for _ in range(8)
+            )
+        )
+
+    results = asyncio.run(run())
+
+    assert sorted(r.objectives["kills"] for r in results) == list(range(1, 9))
+    assert cloudsave.records[(NAMESPACE, gp_key)]["value"]["objectives"] == {"kills": 8}
+
+
+def test_increment_after_buffered_update(service, cloudsave):
+    gp_key = service.format_guild_progress_key("buffered")
+    key = (NAMESPACE, gp_key)
+
+    async def run():
+        update = asyncio.ensure_future(
+            service.writer.submit(
+                key,
+                GuildProgress(guild_id="buffered", namespace=NAMESPACE, objectives={"kills": 5}),
+            )
+        )
+        await asyncio.sleep(0)
+        incremented = await service.increment_guild_objectives(
+            NAMESPACE, gp_key, "buffered", {"kills": 1}
+        )
+        await update
+        await service.writer.drain(key)
+        return incremented
+
+    incremented = asyncio.run(run())
+
+    assert incremented.objectives["kills"] == 6
+    assert cloudsave.records[key]["value"]["objectives"] == {"kills": 6}
+
+
+def test_denied_bulk_gets_fall_back_to_single_gets(service, cloudsave):
+    gp_keys = [service.format_guild_progress_key(f"bulk{i}") for i in range(3)]
+    for i, gp_key in enumerate(gp_keys):
+        cloudsave.records[(NAMESPACE, gp_key)] = {
+            "value": {"guild_id": f"bulk{i}", "namespace": NAMESPACE, "objectives": {"kills": i}},
+            "updated_at": cloudsave.next_updated_at(),
+        }
+    cloudsave.bulk_get_denied = True
+
+    async def run():
+        # the service caches nothing, both batches read CloudSave.
+        first = await service.get_guild_progress_batch(NAMESPACE, gp_keys)
+        second = await service.get_guild_progress_batch(NAMESPACE, gp_keys)
+        return first, second
+
+    try:
+        first, second = asyncio.run(run())
+    finally:
+        service.bulk_get_enabled = True
+
+    for results in (first, second):
+        assert [results[gp_key].objectives["kills"] for gp_key in gp_keys] == [0, 1, 2]
+    # once denied, later batches no longer try the bulk get.
+    assert cloudsave.bulk_gets == 1
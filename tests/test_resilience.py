@@ -0,0 +1,241 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+
+import httpx
+import pytest
+
+from grpc import StatusCode
+from grpc.aio import AioRpcError
+
+from accelbyte_grpc_plugin.deadlines import set_deadline
+from accelbyte_grpc_plugin.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RetryBudget,
+    SDKCallPolicy,
+)
+
+ENDPOINT = "cloudsave.test"
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeError:
+    """An SDK error model, as recorded by AsyncAccelByteSDK."""
+
+    def __init__(self, http_status: int) -> None:
+        self.http_status = http_status
+
+
+class FakeCall:
+    """Returns (or raises) 'results' in order, the last one from then on."""
+
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self):
+        result = self.results[min(self.calls, len(self.results) - 1)]
+        self.calls += 1
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+@pytest.fixture(scope="module")
+def shared_policy() -> SDKCallPolicy:
+    # metrics are registered globally, the policy is shared by the tests.
+    return SDKCallPolicy()
+
+
+@pytest.fixture
+def timer() -> FakeTimer:
+    return FakeTimer()
+
+
+@pytest.fixture
+def policy(shared_policy, timer) -> SDKCallPolicy:
+    shared_policy.base_delay = shared_policy.max_delay = 0.0
+    shared_policy.max_attempts = 3
+    shared_policy.retry_budget = RetryBudget(timer=timer)
+    shared_policy.breaker_factory = lambda endpoint: CircuitBreaker(
+        failure_threshold=3, reset_timeout=10.0, timer=timer
+    )
+    shared_policy.breakers.clear()
+    return shared_policy
+
+
+def call(policy, fn, retryable: bool = True):
+    return asyncio.run(policy.call(ENDPOINT, fn, retryable=retryable))
+
+
+def test_breaker_opens_half_opens_and_closes(timer):
+    states = []
+    breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout=10.0, on_state_change=states.append, timer=timer
+    )
+
+    for _ in range(2):
+        assert breaker.try_acquire()
+        breaker.on_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.try_acquire()
+    assert breaker.get_retry_after() == 10.0
+
+    # a single probe is let through once the timeout elapsed.
+    timer.now += 10.0
+    assert breaker.try_acquire()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.try_acquire()
+    breaker.on_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.try_acquire()
+    assert states == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+
+
+def test_failed_probes_reopen_the_breaker(timer):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, timer=timer)
+    breaker.on_failure()
+    timer.now += 10.0
+    assert breaker.try_acquire()
+
+    breaker.on_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.get_retry_after() == 10.0
+
+
+def test_released_probes_let_another_one_through(timer):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, timer=timer)
+    breaker.on_failure()
+    timer.now += 10.0
+    assert breaker.try_acquire()
+
+    breaker.release()
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.try_acquire()
+
+
+def test_successes_reset_the_failure_count(timer):
+    breaker = CircuitBreaker(failure_threshold=2, timer=timer)
+    breaker.on_failure()
+    breaker.on_success()
+    breaker.on_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_retry_budget_refills_over_time(timer):
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=1.0, max_tokens=2.0, timer=timer)
+    assert budget.try_withdraw()
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+
+    # two calls earn a retry.
+    budget.on_call()
+    budget.on_call()
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+
+    timer.now += 1.0
+    assert budget.try_withdraw()
+
+
+def test_transient_failures_are_retried(policy):
+    fn = FakeCall((None, FakeError(503)), httpx.ConnectError("refused"), ("ok", None))
+
+    assert call(policy, fn) == ("ok", None)
+    assert fn.calls == 3
+    assert policy.get_breaker(ENDPOINT).state == CircuitState.CLOSED
+
+
+def test_other_errors_are_returned_without_retries(policy):
+    error = FakeError(404)
+    fn = FakeCall((None, error))
+
+    assert call(policy, fn) == (None, error)
+    assert fn.calls == 1
+
+
+def test_calls_not_safe_to_repeat_are_not_retried(policy):
+    error = FakeError(503)
+    fn = FakeCall((None, error))
+
+    assert call(policy, fn, retryable=False) == (None, error)
+    assert fn.calls == 1
+
+
+def test_exceptions_left_after_the_last_attempt_are_raised(policy):
+    fn = FakeCall(httpx.ReadTimeout("timed out"))
+
+    with pytest.raises(AioRpcError) as e:
+        call(policy, fn)
+
+    assert e.value.code() == StatusCode.DEADLINE_EXCEEDED
+    assert fn.calls == policy.max_attempts
+
+
+def test_retries_stop_when_the_budget_is_spent(policy, timer):
+    policy.retry_budget = RetryBudget(
+        ratio=0.0, min_retries_per_second=0.0, max_tokens=1.0, timer=timer
+    )
+    fn = FakeCall((None, FakeError(503)))
+
+    call(policy, fn)
+    assert fn.calls == 2
+    call(policy, fn)
+    assert fn.calls == 3
+
+
+def test_retries_stop_at_the_deadline(policy):
+    policy.base_delay = policy.max_delay = 1.0
+    fn = FakeCall((None, FakeError(503)), ("ok", None))
+
+    async def run():
+        # the backoff would outlive the RPC.
+        set_deadline(0.0001)
+        return await policy.call(ENDPOINT, fn)
+
+    assert asyncio.run(run())[1].http_status == 503
+    assert fn.calls == 1
+
+
+def test_open_breakers_reject_calls_until_a_probe_succeeds(policy, timer):
+    fn = FakeCall((None, FakeError(503)))
+    call(policy, fn)
+    assert fn.calls == 3
+    assert policy.get_breaker(ENDPOINT).state == CircuitState.OPEN
+
+    with pytest.raises(AioRpcError) as e:
+        call(policy, fn)
+    assert e.value.code() == StatusCode.UNAVAILABLE
+    assert fn.calls == 3
+
+    timer.now += 10.0
+    fn.results = [("ok", None)]
+    assert call(policy, fn) == ("ok", None)
+    assert policy.get_breaker(ENDPOINT).state == CircuitState.CLOSED
+
+
+def test_cancelled_calls_give_back_the_probe(policy, timer):
+    fn = FakeCall((None, FakeError(503)))
+    call(policy, fn)
+    timer.now += 10.0
+
+    with pytest.raises(asyncio.CancelledError):
+        call(policy, FakeCall(asyncio.CancelledError()))
+
+    breaker = policy.get_breaker(ENDPOINT)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.try_acquire()
@@ -0,0 +1,148 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import struct
+
+from typing import Dict, Iterable, List, Optional
+
+import pytest
+
+from accelbyte_py_sdk.api import iam as iam_service
+from accelbyte_py_sdk.api.iam import models as iam_models
+from accelbyte_py_sdk.token_validation._bloom_filter import BloomFilter
+from bitarray import bitarray
+
+from accelbyte_grpc_plugin.revocation import (
+    RevocationIndexCache,
+    RevocationList,
+    RevokedTokens,
+    create_iam_revocation_list_fetcher,
+)
+
+
+def create_bloom_bits(tokens: Iterable[str], k: int, m: int) -> List[int]:
+    bloom_filter = BloomFilter()
+    bloom_filter.bits = bitarray(m, endian=BloomFilter.BITARRAY_ENDIAN)
+    bloom_filter.bits.setall(0)
+    bloom_filter.k = k
+    bloom_filter.m = m
+    for token in tokens:
+        bloom_filter.put(token)
+    # IAM publishes the bits as uint64 words.
+    return list(struct.unpack(BloomFilter.UINT64_FMT_CHAR * (m // 64), bloom_filter.bits.tobytes()))
+
+
+class FakeIAM:
+    """Revocation list source standing in for IAM."""
+
+    def __init__(self, k: int = 4, m: int = 1024, publish_token_ids: bool = False) -> None:
+        self.k = k
+        self.m = m
+        self.publish_token_ids = publish_token_ids
+        self.revoked_tokens: List[str] = []
+        self.revoked_users: Dict[str, float] = {}
+        self.fetches = 0
+
+    async def fetch(self) -> RevocationList:
+        self.fetches += 1
+        bits = create_bloom_bits(self.revoked_tokens, k=self.k, m=self.m)
+        return RevocationList(
+            revoked_tokens=RevokedTokens(bits=tuple(bits), k=self.k, m=self.m),
+            revoked_users=dict(self.revoked_users),
+            revoked_token_ids=frozenset(self.revoked_tokens) if self.publish_token_ids else None,
+        )
+
+
+@pytest.fixture(scope="module")
+def cache() -> RevocationIndexCache:
+    # metrics are registered globally, the cache is shared by the tests.
+    return RevocationIndexCache(fetcher=FakeIAM().fetch)
+
+
+def refresh(cache: RevocationIndexCache, iam: FakeIAM) -> bool:
+    cache.fetcher = iam.fetch
+    return asyncio.run(cache.refresh())
+
+
+def find_false_positive(cache: RevocationIndexCache, revoked: List[str]) -> Optional[str]:
+    bloom_filter = cache.index.revoked_token_filter
+    for i in range(10000):
+        token = f"token{i}"
+        if token not in revoked and bloom_filter.might_contains(key=token):
+            return token
+    return None
+
+
+def test_refresh_swaps_in_the_full_list(cache):
+    iam = FakeIAM()
+    updates = []
+    cache.add_listener(lambda: updates.append(cache.index))
+
+    iam.revoked_tokens.append("revoked")
+    iam.revoked_users["user1"] = 100.0
+    assert refresh(cache, iam)
+    assert cache.is_token_revoked("revoked")
+    assert not cache.is_token_revoked("valid")
+    assert cache.is_user_revoked("user1", issued_at=50)
+    assert not cache.is_user_revoked("user1", issued_at=150)
+    assert len(updates) == 1
+
+    # nothing changed, the index keeps its bloom filter and listeners are not called.
+    index = cache.index
+    assert not refresh(cache, iam)
+    assert cache.index.revoked_token_filter is index.revoked_token_filter
+    assert len(updates) == 1
+
+    # lifted revocations are dropped on the next refresh.
+    del iam.revoked_users["user1"]
+    iam.revoked_users["user2"] = 200.0
+    assert refresh(cache, iam)
+    assert not cache.is_user_revoked("user1", issued_at=50)
+    assert cache.is_user_revoked("user2", issued_at=150)
+    assert cache.index.revoked_token_filter is index.revoked_token_filter
+    assert len(updates) == 2
+    assert iam.fetches == 3
+
+
+def test_bloom_hits_are_confirmed_by_the_exact_set(cache):
+    revoked = [f"revoked{i}" for i in range(20)]
+
+    # a small filter, so that false positives are easy to find.
+    bloom_only = FakeIAM(k=1, m=64)
+    bloom_only.revoked_tokens.extend(revoked)
+    refresh(cache, bloom_only)
+    false_positive = find_false_positive(cache, revoked)
+    assert false_positive is not None
+    assert cache.is_token_revoked(false_positive)
+
+    exact = FakeIAM(k=1, m=64, publish_token_ids=True)
+    exact.revoked_tokens.extend(revoked)
+    refresh(cache, exact)
+    assert not cache.is_token_revoked(false_positive)
+    assert all(cache.is_token_revoked(token) for token in revoked)
+
+
+def test_iam_fetcher(monkeypatch):
+    bits = create_bloom_bits(["revoked"], k=4, m=1024)
+    response = iam_models.OauthapiRevocationList.create(
+        revoked_tokens=iam_models.BloomFilterJSON.create(bits=bits, k=4, m=1024),
+        revoked_users=[
+            iam_models.OauthcommonUserRevocationListRecord.create(
+                id_="user1", revoked_at="2025-01-01T00:00:00.500000000Z"
+            ),
+            iam_models.OauthcommonUserRevocationListRecord.create(id_="user2", revoked_at=""),
+        ],
+    )
+
+    async def get_revocation_list_v3_async(**kwargs):
+        return response, None
+
+    monkeypatch.setattr(iam_service, "get_revocation_list_v3_async", get_revocation_list_v3_async)
+
+    revocation_list = asyncio.run(create_iam_revocation_list_fetcher(sdk=None)())
+
+    assert revocation_list.revoked_tokens == RevokedTokens(bits=tuple(bits), k=4, m=1024)
+    assert revocation_list.revoked_users == {"user1": 1735689600.5}
+    assert revocation_list.revoked_token_ids is None
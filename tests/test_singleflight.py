@@ -0,0 +1,144 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+
+import pytest
+
+from accelbyte_grpc_plugin.singleflight import SingleFlight
+
+
+class FakeCall:
+    """Counts its calls, which wait for 'release' and then return or raise 'error'."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error = None
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return call
+
+
+def test_concurrent_callers_share_one_call():
+    async def run():
+        flight = SingleFlight()
+        fn = FakeCall()
+        callers = [asyncio.ensure_future(flight.do("key", fn)) for _ in range(3)]
+        await asyncio.sleep(0)
+        fn.release.set()
+        results = await asyncio.gather(*callers)
+        return flight, fn, results
+
+    flight, fn, results = asyncio.run(run())
+
+    assert fn.calls == 1
+    assert sorted(results) == [(1, False), (1, True), (1, True)]
+    assert len(flight) == 0
+
+
+def test_failures_reach_every_caller_and_are_not_kept():
+    async def run():
+        flight = SingleFlight()
+        fn = FakeCall()
+        fn.error = RuntimeError("cloudsave is down")
+        callers = [asyncio.ensure_future(flight.do("key", fn)) for _ in range(2)]
+        await asyncio.sleep(0)
+        fn.release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        # the next caller starts a new call.
+        fn.error = None
+        result = await flight.do("key", fn)
+        return results, result
+
+    results, result = asyncio.run(run())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert result == (2, False)
+
+
+def test_cancelled_callers_do_not_cancel_the_call():
+    async def run():
+        flight = SingleFlight()
+        fn = FakeCall()
+        first = asyncio.ensure_future(flight.do("key", fn))
+        second = asyncio.ensure_future(flight.do("key", fn))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        fn.release.set()
+        return first, await second
+
+    first, result = asyncio.run(run())
+
+    assert first.cancelled()
+    assert result == (1, True)
+
+
+def test_calls_without_callers_finish_and_are_removed(caplog):
+    async def run():
+        flight = SingleFlight()
+        fn = FakeCall()
+        fn.error = RuntimeError("cloudsave is down")
+        caller = asyncio.ensure_future(flight.do("key", fn))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.sleep(0)
+        assert len(flight) == 1
+
+        fn.release.set()
+        await asyncio.sleep(0.01)
+        return flight
+
+    flight = asyncio.run(run())
+
+    assert len(flight) == 0
+    # the failure of the abandoned call was retrieved.
+    assert "exception was never retrieved" not in caplog.text
+
+
+def test_forgotten_calls_are_not_shared():
+    async def run():
+        flight = SingleFlight()
+        fn = FakeCall()
+        first = asyncio.ensure_future(flight.do("key", fn))
+        await asyncio.sleep(0)
+        # e.g. the record was written while it was being read.
+        flight.forget("key")
+        second = asyncio.ensure_future(flight.do("key", fn))
+        await asyncio.sleep(0)
+        fn.release.set()
+        return await first, await second, flight
+
+    first, second, flight = asyncio.run(run())
+
+    assert first == (1, False)
+    assert second == (2, False)
+    assert len(flight) == 0
+
+
+@pytest.mark.parametrize("error", [None, RuntimeError("cloudsave is down")])
+def test_other_keys_are_not_shared(error):
+    async def run():
+        flight = SingleFlight()
+        fn = FakeCall()
+        fn.error = error
+        fn.release.set()
+        return await asyncio.gather(
+            flight.do("a", fn), flight.do("b", fn), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    if error is None:
+        assert sorted(results) == [(1, False), (2, False)]
+    else:
+        assert all(r is error for r in results)
@@ -0,0 +1,142 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import json
+import time
+
+import jwt
+import pytest
+
+from accelbyte_py_sdk import AccelByteSDK
+from accelbyte_py_sdk.api import iam as iam_service
+from accelbyte_py_sdk.api.iam import models as iam_models
+from accelbyte_py_sdk.token_validation import (
+    InsufficientPermissionsError,
+    UserRevokedError,
+)
+from accelbyte_py_sdk.token_validation.caching import CachingTokenValidator
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from accelbyte_grpc_plugin.revocation import RevocationList
+from accelbyte_grpc_plugin.token_validation import AsyncCachingTokenValidator
+
+KEY_ID = "test"
+NAMESPACE = "test"
+RESOURCE = f"ADMIN:NAMESPACE:{NAMESPACE}:CLOUDSAVE:RECORD"
+READ = 2
+
+
+class FakeIAM:
+    """JWKS and revocation list behind the SDK functions the validator calls."""
+
+    def __init__(self) -> None:
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.revoked_users = {}
+        # fetches made when a key is looked up, rather than by the refresh task.
+        self.jwks_lookup_fetches = 0
+
+    def install(self, monkeypatch) -> "FakeIAM":
+        monkeypatch.setattr(iam_service, "get_jwksv3_async", self.get_jwksv3_async)
+        monkeypatch.setattr(iam_service, "get_jwksv3", self.get_jwksv3)
+        return self
+
+    def create_jwks(self) -> iam_models.OauthcommonJWKSet:
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key()))
+        return iam_models.OauthcommonJWKSet.create_from_dict(
+            {"keys": [{**jwk, "kid": KEY_ID, "alg": "RS256", "use": "sig"}]}
+        )
+
+    async def get_jwksv3_async(self, **kwargs):
+        return self.create_jwks(), None
+
+    def get_jwksv3(self, **kwargs):
+        self.jwks_lookup_fetches += 1
+        return self.create_jwks(), None
+
+    async def fetch_revocation_list(self) -> RevocationList:
+        return RevocationList(revoked_tokens=None, revoked_users=dict(self.revoked_users))
+
+    def create_token(self, user_id: str, action: int = 15) -> str:
+        now = int(time.time())
+        return jwt.encode(
+            {
+                "sub": user_id,
+                "client_id": "client",
+                "namespace": NAMESPACE,
+                "iat": now,
+                "exp": now + 3600,
+                "permissions": [{"Resource": RESOURCE, "Action": action}],
+            },
+            self.private_key,
+            algorithm="RS256",
+            headers={"kid": KEY_ID},
+        )
+
+
+@pytest.fixture
+def iam(monkeypatch) -> FakeIAM:
+    return FakeIAM().install(monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def validator() -> AsyncCachingTokenValidator:
+    # metrics are registered globally, the validator is shared by the tests.
+    return AsyncCachingTokenValidator(sdk=AccelByteSDK())
+
+
+def validate(validator, token: str):
+    async def run():
+        try:
+            await validator.refresh_jwks()
+            await validator.refresh_revocation_list()
+            return await validator.validate_token_claims_async(
+                token=token, resource=RESOURCE, action=READ, namespace=NAMESPACE
+            )
+        finally:
+            await validator.stop()
+
+    return asyncio.run(run())
+
+
+def test_the_sdk_validator_uses_the_replaced_caches(validator):
+    token_validator = validator.caching_token_validator
+
+    assert isinstance(token_validator, CachingTokenValidator)
+    assert token_validator.jwks_cache is validator.jwks_cache
+    assert token_validator.revocation_list_cache is validator.revocation_index_cache
+
+
+def test_refreshed_keys_validate_tokens_and_return_claims(validator, iam):
+    validator.revocation_index_cache.fetcher = iam.fetch_revocation_list
+
+    claims, error = validate(validator, iam.create_token("user1"))
+
+    assert error is None
+    assert claims["sub"] == "user1"
+    assert claims["namespace"] == NAMESPACE
+    assert iam.jwks_lookup_fetches == 0
+
+
+def test_errors_are_returned_without_claims(validator, iam):
+    validator.revocation_index_cache.fetcher = iam.fetch_revocation_list
+    iam.revoked_users["revoked"] = time.time() + 60
+
+    claims, error = validate(validator, iam.create_token("revoked"))
+    assert claims is None
+    assert isinstance(error, UserRevokedError)
+
+    claims, error = validate(validator, iam.create_token("user1", action=1))
+    assert claims is None
+    assert isinstance(error, InsufficientPermissionsError)
+
+
+def test_unknown_keys_are_fetched_on_lookup(validator, iam):
+    validator.jwks_cache.keys = {}
+
+    key = validator.jwks_cache.get_key(KEY_ID)
+
+    assert key is not None
+    assert iam.jwks_lookup_fetches == 1
+    assert validator.jwks_cache.get_key("unknown") is None